@@ -0,0 +1,265 @@
+"""
+Async Base Page Object class providing common Playwright actions
+Mirrors BasePage on playwright.async_api so many flows can share one event loop
+"""
+
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from typing import Optional
+import logging
+
+from instrumentation import timed
+from network_router import RequestRouter, get_request_router, install_request_router_async
+from selector_chain import SELECTOR_CACHE, SelectorChain, resolve_chain_async
+from settings import get_settings
+from wait_engine import AsyncWaitEngine
+from web_vitals import COLLECT_VITALS_JS, VITALS, VITALS_READY_JS
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBasePage:
+
+    # Selector cache section for this page object's SelectorChain attributes
+    PAGE_TYPE = "page"
+
+    def __init__(self, page: Page):
+        """
+        Initialize AsyncBasePage with a playwright.async_api Page object
+        """
+        self.page = page
+        # timeouts (ms) come from the session settings (config.json timeouts + overrides)
+        timeouts = get_settings().timeouts
+        self.timeout = timeouts.default
+        self.navigation_timeout = timeouts.navigation
+        self.page_ready_timeout = timeouts.page_ready
+        self.results_timeout = timeouts.results
+        self.filter_option_timeout = timeouts.filter_option
+        self.element_timeout = timeouts.element_wait
+        page.set_default_timeout(self.timeout)
+        page.set_default_navigation_timeout(self.navigation_timeout)
+        self.waits = AsyncWaitEngine(page, self.timeout)
+
+    def get_wait_timings(self) -> dict:
+        """
+        Get per-wait-type statistics recorded by the wait engine
+        """
+        summary = self.waits.summary()
+        logger.info("Wait timings: %s", summary)
+        return summary
+
+    @property
+    def router(self) -> Optional[RequestRouter]:
+        """Request router installed on this page's context, if any"""
+        return get_request_router(self.page.context)
+
+    async def install_request_router(self, settings: dict) -> Optional[RequestRouter]:
+        """
+        Block or stub unneeded requests for this page's context
+
+        Args:
+            settings (dict): 'network' section of config.json
+
+        Returns:
+            Optional[RequestRouter]: Installed router, or None if routing is disabled
+        """
+        return await install_request_router_async(self.page.context, settings)
+
+    def get_network_savings(self) -> dict:
+        """
+        Get the requests and estimated bytes saved by the request router
+        """
+        router = self.router
+        savings = router.summary() if router else {}
+        logger.info("Network savings: %s", savings)
+        return savings
+
+    async def collect_web_vitals(self, page_type: str, label: str) -> Optional[dict]:
+        """
+        Sample web performance metrics of the current document and check them against budgets
+        """
+        if not VITALS.enabled:
+            return None
+        try:
+            try:
+                # the observers' LCP entry, not a full load; settle_ms caps the wait
+                await self.page.wait_for_function(VITALS_READY_JS, timeout=VITALS.settle_ms)
+            except PlaywrightTimeoutError:
+                logger.debug("No LCP entry within %s ms, sampling without it", VITALS.settle_ms)
+            metrics = await self.page.evaluate(COLLECT_VITALS_JS)
+        except Exception as e:
+            logger.warning("Could not collect web vitals: %s", e)
+            return None
+        return VITALS.record(page_type, label, self.page.url, metrics)
+
+    async def resolve(self, selector: str, timeout: Optional[int] = None, state: str = "visible") -> Optional[str]:
+        """
+        Resolve a SelectorChain to its first matching candidate (plain selectors are returned as-is)
+
+        Args:
+            selector (str): CSS selector or SelectorChain
+            timeout (int, optional): Milliseconds to wait for any candidate (default: element wait timeout)
+            state (str): 'visible' or 'attached'
+
+        Returns:
+            Optional[str]: Concrete selector, or None if no candidate matched in time
+        """
+        if not isinstance(selector, SelectorChain):
+            return selector
+        return await resolve_chain_async(self.page, selector, self.PAGE_TYPE, timeout or self.element_timeout, state)
+
+    async def _selector(self, selector: str, probe: bool = True) -> str:
+        """Concrete selector for a primitive: a chain's winner from this run, else a probe (or the candidates' union)"""
+        if not isinstance(selector, SelectorChain):
+            return selector
+        resolved = SELECTOR_CACHE.verified(self.PAGE_TYPE, selector.name)
+        if resolved is None and probe:
+            resolved = await self.resolve(selector)
+        return resolved or selector
+
+    @timed()
+    async def navigate(self, url: str) -> None:
+        """
+        Navigate to a given URL
+        """
+        logger.info("Navigating to: %s", url)
+        await self.page.goto(url)
+        logger.info("Successfully navigated to: %s", url)
+
+    @timed()
+    async def click(self, selector: str) -> None:
+        """
+        Click on an element identified by selector
+        """
+        selector = await self._selector(selector)
+        logger.info("Clicking element: %s", selector)
+        await self.page.click(selector)
+
+    @timed()
+    async def fill(self, selector: str, text: str) -> None:
+        """
+        Fill text input field
+        """
+        selector = await self._selector(selector)
+        logger.info("Filling text into %s: %s", selector, text)
+        await self.page.fill(selector, text)
+
+    @timed(false_is_error=True)
+    async def wait_for_element(self, selector: str, timeout: Optional[int] = None) -> bool:
+        """
+        Wait for element to be visible
+        """
+        timeout = timeout or self.element_timeout
+        if isinstance(selector, SelectorChain):
+            # the chain probe is the wait: all candidates are checked together
+            logger.info("Waiting for element: %s (%s candidates)", selector.name, len(selector.candidates))
+            return await self.resolve(selector, timeout) is not None
+        try:
+            logger.info("Waiting for element: %s", selector)
+            await self.page.wait_for_selector(selector, timeout=timeout)
+            return True
+        except Exception as e:
+            logger.error("Element not found: %s - %s", selector, e)
+            return False
+
+    @timed()
+    async def is_element_visible(self, selector: str) -> bool:
+        """
+        Check if element is visible
+        """
+        selector = await self._selector(selector, probe=False)
+        try:
+            return await self.page.is_visible(selector)
+        except Exception:
+            return False
+
+    @timed()
+    async def get_text(self, selector: str) -> str:
+        """
+        Get text content of an element
+        """
+        selector = await self._selector(selector)
+        logger.info("Getting text from: %s", selector)
+        return await self.page.text_content(selector) or ""
+
+    @timed()
+    async def get_attribute(self, selector: str, attribute: str) -> Optional[str]:
+        """
+        Get attribute value of an element
+        """
+        selector = await self._selector(selector)
+        logger.info("Getting attribute '%s' from: %s", attribute, selector)
+        return await self.page.get_attribute(selector, attribute)
+
+    @timed()
+    async def press_key(self, key: str) -> None:
+        """
+        Press a keyboard key
+        """
+        logger.info("Pressing key: %s", key)
+        await self.page.press("body", key)
+
+    @timed()
+    async def take_screenshot(self, filename: str) -> None:
+        """
+        Take a screenshot of the current page
+        """
+        logger.info("Taking screenshot: %s", filename)
+        await self.page.screenshot(path=filename)
+
+    @timed()
+    async def get_page_title(self) -> str:
+        """
+        Get the page title
+        """
+        title = await self.page.title()
+        logger.info("Page title: %s", title)
+        return title
+
+    def get_page_url(self) -> str:
+        """
+        Get the current page URL
+        """
+        url = self.page.url
+        logger.info("Current URL: %s", url)
+        return url
+
+    @timed()
+    async def scroll_to_bottom(self) -> None:
+        """Scroll to bottom of page"""
+        logger.info("Scrolling to bottom of page")
+        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+
+    @timed()
+    async def scroll_to_element(self, selector: str) -> None:
+        """
+        Scroll to a specific element
+        """
+        selector = await self._selector(selector)
+        logger.info("Scrolling to element: %s", selector)
+        await self.page.locator(selector).scroll_into_view_if_needed()
+
+    @timed()
+    async def wait_for_load_state(self, state: str = "domcontentloaded") -> None:
+        """
+        Wait for page load state
+        Args:
+            state (str): Load state ('domcontentloaded', 'load', 'networkidle')
+        """
+        logger.info("Waiting for load state: %s", state)
+        await self.page.wait_for_load_state(state)
+
+    @timed()
+    async def get_element_count(self, selector: str) -> int:
+        """
+        Get count of elements matching selector
+        """
+        selector = await self._selector(selector)
+        count = await self.page.locator(selector).count()
+        logger.info("Found %s elements matching: %s", count, selector)
+        return count
+
+    @timed()
+    async def close_page(self) -> None:
+        """Close the current page"""
+        logger.info("Closing page")
+        await self.page.close()
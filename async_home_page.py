@@ -0,0 +1,96 @@
+"""
+Async eBay Home Page Object
+Handles interactions with the eBay home page on playwright.async_api
+"""
+
+from async_base_page import AsyncBasePage
+from home_page import EBayHomePage
+from settings import get_settings
+from playwright.async_api import Page
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEBayHomePage(AsyncBasePage):
+    """Async Page Object for eBay Home Page (same surface as EBayHomePage)"""
+
+    # Selectors (shared with the sync page object)
+    SEARCH_INPUT = EBayHomePage.SEARCH_INPUT
+    SEARCH_BUTTON = EBayHomePage.SEARCH_BUTTON
+    EBAY_LOGO = EBayHomePage.EBAY_LOGO
+    RESULTS_URL_PATTERN = EBayHomePage.RESULTS_URL_PATTERN
+    PAGE_TYPE = EBayHomePage.PAGE_TYPE
+    VITALS_PAGE_TYPE = EBayHomePage.VITALS_PAGE_TYPE
+    RESULTS_VITALS_PAGE_TYPE = EBayHomePage.RESULTS_VITALS_PAGE_TYPE
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.page_url = get_settings().base_url
+
+    async def navigate_to_home(self) -> None:
+        """Navigate to eBay home page"""
+        await self.navigate(self.page_url)
+        logger.info("Navigated to eBay home page")
+        await self.collect_web_vitals(self.VITALS_PAGE_TYPE, "navigate")
+
+    async def is_home_page_loaded(self) -> bool:
+        """
+        Validate that eBay home page is loaded
+        """
+        logger.info("Validating eBay home page is loaded")
+
+        try:
+            # Check if search input is visible
+            search_visible = await self.wait_for_element(self.SEARCH_INPUT, timeout=self.page_ready_timeout)
+
+            if search_visible:
+                logger.info("eBay home page loaded successfully")
+                return True
+            else:
+                logger.warning("eBay home page did not load properly")
+                return False
+
+        except Exception as e:
+            logger.error("Error validating home page: %s", e)
+            return False
+
+    async def search_for_item(self, search_term: str) -> None:
+        """
+        Search for an item on eBay
+        """
+        logger.info("Searching for: %s", search_term)
+
+        try:
+            # Ensure on home page
+            if not await self.is_home_page_loaded():
+                await self.navigate_to_home()
+
+            # Fill search input
+            await self.fill(self.SEARCH_INPUT, search_term)
+            logger.info("Entered search term: %s", search_term)
+
+            # Click search button
+            await self.click(self.SEARCH_BUTTON)
+            logger.info("Clicked search button")
+
+            # Wait for the results document itself, not every subresource
+            await self.waits.for_url(self.RESULTS_URL_PATTERN, wait_until="domcontentloaded")
+            logger.info("Search results page loaded")
+            await self.collect_web_vitals(self.RESULTS_VITALS_PAGE_TYPE, "search")
+
+        except Exception as e:
+            logger.error("Error during search: %s", e)
+            raise
+
+    async def get_page_header_text(self) -> str:
+        """
+        Get the header text from home page
+        """
+        try:
+            header_text = await self.get_text("body > header")
+            logger.info("Header text: %s", header_text)
+            return header_text
+        except Exception as e:
+            logger.error("Error getting header text: %s", e)
+            return ""
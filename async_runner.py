@@ -0,0 +1,167 @@
+"""
+Concurrent search-and-filter runner
+Drives many eBay search flows at once on one event loop, one browser context per flow
+
+Usage:
+    python async_runner.py "mazda mx-5" "honda s2000" --transmission Manual --concurrency 10
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import List, NamedTuple, Optional
+import logging
+
+from playwright.async_api import Browser, async_playwright
+
+from async_home_page import AsyncEBayHomePage
+from async_search_results_page import AsyncEBaySearchResultsPage
+from browser_server import DEFAULT_ENDPOINT_FILE, connect_or_launch_async
+from logger_report import TestLogger
+from network_router import install_request_router_async
+from selector_chain import DEFAULT_CACHE_FILE, SELECTOR_CACHE
+from settings import Settings, cli_overrides, use_settings
+
+logger = logging.getLogger(__name__)
+
+
+class FlowResult(NamedTuple):
+    """Outcome of one search-and-filter flow"""
+
+    query: str
+    count: int
+    filtered_count: int
+    duration: float
+    error: str = ""
+
+    @property
+    def passed(self) -> bool:
+        return not self.error and self.count > 0 and 0 <= self.filtered_count <= self.count
+
+
+async def run_search_flow(browser: Browser, query: str, transmission: str,
+                          context_options: Optional[dict] = None,
+                          network_settings: Optional[dict] = None) -> FlowResult:
+    """
+    Run home -> search -> filter for one query in its own context
+
+    Args:
+        browser (Browser): Shared async browser
+        query (str): Search term
+        transmission (str): Transmission filter option, e.g. 'Manual'
+        context_options (dict, optional): Keyword arguments for browser.new_context
+        network_settings (dict, optional): 'network' section of config.json
+
+    Returns:
+        FlowResult: Counts, duration and error text (empty on success)
+    """
+    start = time.perf_counter()
+    context = await browser.new_context(**(context_options or {}))
+    try:
+        if network_settings:
+            await install_request_router_async(context, network_settings)
+        page = await context.new_page()
+
+        home = AsyncEBayHomePage(page)
+        await home.navigate_to_home()
+        await home.search_for_item(query)
+
+        results = AsyncEBaySearchResultsPage(page)
+        count = await results.validate_results_and_count(query)
+        filtered_count = await results.apply_transmission_and_get_count(transmission)
+        return FlowResult(query, count, filtered_count, time.perf_counter() - start)
+    except Exception as e:
+        logger.error("Flow for '%s' failed: %s", query, e)
+        return FlowResult(query, 0, 0, time.perf_counter() - start, error=str(e))
+    finally:
+        await context.close()
+
+
+async def run_search_flows(queries: List[str], transmission: str, concurrency: int = 10,
+                           launch_options: Optional[dict] = None,
+                           context_options: Optional[dict] = None,
+                           network_settings: Optional[dict] = None,
+                           server_settings: Optional[dict] = None) -> List[FlowResult]:
+    """
+    Run many search-and-filter flows concurrently against one browser
+
+    Args:
+        queries (List[str]): Search terms, one flow each
+        transmission (str): Transmission filter option applied in every flow
+        concurrency (int): Maximum number of flows (contexts) open at once
+        launch_options (dict, optional): Keyword arguments for chromium.launch
+        context_options (dict, optional): Keyword arguments for browser.new_context
+        network_settings (dict, optional): 'network' section of config.json
+        server_settings (dict, optional): 'browser_server' section; connect to a running server when enabled
+
+    Returns:
+        List[FlowResult]: Results in the same order as queries
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async with async_playwright() as playwright:
+        server_settings = server_settings or {}
+        endpoint_file = server_settings.get("endpoint_file", DEFAULT_ENDPOINT_FILE) if server_settings.get("enabled", False) else None
+        browser = await connect_or_launch_async(playwright.chromium, launch_options, endpoint_file,
+                                                timeout=server_settings.get("connect_timeout", 5000))
+
+        async def bounded(query: str) -> FlowResult:
+            async with semaphore:
+                return await run_search_flow(browser, query, transmission, context_options, network_settings)
+
+        try:
+            return await asyncio.gather(*(bounded(q) for q in queries))
+        finally:
+            await browser.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; returns a process exit code"""
+    parser = argparse.ArgumentParser(description="Run eBay search-and-filter flows concurrently")
+    parser.add_argument("queries", nargs="*", help="Search terms (default: test_data.search_term)")
+    parser.add_argument("--transmission", help="Transmission filter option (default: test_data.filters.transmission)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Maximum flows in flight")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--config", help="Settings file to use instead of config.json")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", dest="overrides",
+                        help="Override a setting by dotted key, e.g. timeouts.navigation=90000 (repeatable)")
+    args = parser.parse_args(argv)
+
+    try:
+        settings = use_settings(Settings.load(args.config, cli_overrides(args.overrides)))
+    except ValueError as exc:
+        parser.error(str(exc))
+    SELECTOR_CACHE.configure(settings.get("selectors.cache_file", DEFAULT_CACHE_FILE))
+    queries = args.queries or [settings.test_data.search_term]
+    args.transmission = args.transmission or settings.test_data.transmission
+
+    TestLogger.setup_logger(log_file="async_runner.log", log_level=settings.logging.log_level,
+                            queued=settings.logging.queue, batch_size=settings.logging.batch_size)
+    start = time.perf_counter()
+    results = asyncio.run(run_search_flows(
+        queries,
+        args.transmission,
+        concurrency=args.concurrency,
+        launch_options=settings.launch_options,
+        context_options=settings.get("browser_pool.context_options"),
+        network_settings=settings.section("network"),
+        server_settings=settings.section("browser_server"),
+    ))
+    elapsed = time.perf_counter() - start
+    TestLogger.stop_listener()
+
+    for r in results:
+        status = "PASS" if r.passed else "FAIL"
+        print(f"{status}  {r.query!r}: {r.count} results, {r.filtered_count} {args.transmission} ({r.duration:.1f}s) {r.error}")
+    print(f"{len(results)} flows in {elapsed:.1f}s (concurrency {args.concurrency})")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump([dict(r._asdict(), passed=r.passed) for r in results], f, indent=2)
+
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
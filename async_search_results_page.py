@@ -0,0 +1,316 @@
+"""
+Async eBay Search Results Page Object
+Handles interactions with the search results page and filtering on playwright.async_api
+"""
+
+from async_base_page import AsyncBasePage
+from facet_index import PARSE_FACETS_JS, FacetIndex
+from listings import ListingSet
+from playwright.async_api import Page
+from search_query import SearchQuery
+from search_results_page import EBaySearchResultsPage, ResultsState, parse_result_count
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEBaySearchResultsPage(AsyncBasePage):
+    """Async Page Object for eBay Search Results Page (same surface as EBaySearchResultsPage)"""
+
+    # Selectors and extraction script (shared with the sync page object)
+    RESULT_ITEMS = EBaySearchResultsPage.RESULT_ITEMS
+    RESULT_ITEMS_TITLES = EBaySearchResultsPage.RESULT_ITEMS_TITLES
+    RESULT_COUNT_TEXT = EBaySearchResultsPage.RESULT_COUNT_TEXT
+    FILTER_PANEL = EBaySearchResultsPage.FILTER_PANEL
+    FILTER_MODE_URL = EBaySearchResultsPage.FILTER_MODE_URL
+    FILTER_MODE_UI = EBaySearchResultsPage.FILTER_MODE_UI
+    TRANSMISSION_ASPECT = EBaySearchResultsPage.TRANSMISSION_ASPECT
+    PAGE_TYPE = EBaySearchResultsPage.PAGE_TYPE
+    VITALS_PAGE_TYPE = EBaySearchResultsPage.VITALS_PAGE_TYPE
+    FACET_CACHE_SIZE = EBaySearchResultsPage.FACET_CACHE_SIZE
+    EXTRACT_LISTINGS_JS = EBaySearchResultsPage.EXTRACT_LISTINGS_JS
+
+    def __init__(self, page: Page):
+        """
+        Initialize async eBay Search Results Page
+        """
+        super().__init__(page)
+        self._state = ResultsState(self.FACET_CACHE_SIZE)
+
+    async def get_search_result_count(self) -> int:
+        """
+        Get the number of search results
+        """
+        logger.info("Getting search result count")
+
+        try:
+            count_text = await self.get_text(self.RESULT_COUNT_TEXT)
+            logger.info("Result count text: %s", count_text)
+
+            result_count = parse_result_count(count_text)
+            if result_count is not None:
+                logger.info("Total search results: %s", result_count)
+                return result_count
+            else:
+                logger.warning("Could not extract count from text: %s", count_text)
+                return 0
+
+        except Exception as e:
+            logger.error("Error getting result count: %s", e)
+            return 0
+
+    async def are_search_results_displayed(self) -> bool:
+        """
+        Check if search results are displayed
+        """
+        logger.info("Validating search results are displayed")
+
+        try:
+            results_visible = await self.wait_for_element(self.RESULT_ITEMS, timeout=self.results_timeout)
+
+            if results_visible:
+                count = await self.get_element_count(self.RESULT_ITEMS)
+                logger.info("Found %s result items displayed", count)
+                return count > 0
+            else:
+                logger.warning("No search results found")
+                return False
+
+        except Exception as e:
+            logger.error("Error validating search results: %s", e)
+            return False
+
+    async def get_displayed_result_count(self) -> int:
+        """
+        Get the number of results currently displayed on page
+        """
+        try:
+            count = await self.get_element_count(self.RESULT_ITEMS)
+            logger.info("Results displayed on page: %s", count)
+            return count
+        except Exception as e:
+            logger.error("Error counting displayed results: %s", e)
+            return 0
+
+    async def get_facet_index(self, refresh: bool = False) -> FacetIndex:
+        """
+        Get the left rail facet index for the current results, parsing it at most once per query URL
+        """
+        key = self.current_query().to_url()
+        cached, wait = self._state.cached_facets(key, refresh)
+        if cached is not None:
+            return cached
+
+        logger.info("Parsing filter panel into facet index")
+        try:
+            if wait:
+                await self.waits.for_selector(self.FILTER_PANEL, state="attached", timeout=self.page_ready_timeout)
+            raw = await self.page.evaluate(PARSE_FACETS_JS, EBaySearchResultsPage.facet_selectors())
+        except Exception as e:
+            logger.warning("No filter panel on %s: %s", self.page.url, e)
+            raw = []
+        return self._state.store_facets(key, self.page.url, raw)
+
+    async def apply_facet(self, facet: str, option: str) -> bool:
+        """
+        Apply a left rail option by index lookup, following its link in one navigation
+        """
+        found = (await self.get_facet_index()).get(facet, option)
+        if found is None or not found.href:
+            logger.info("%s: %s not in facet index, composing the filter URL instead", facet, option)
+            return await self.apply_aspect_filter(facet, option)
+        if found.selected:
+            logger.info("%s: %s already selected", facet, option)
+            return True
+
+        logger.info("Applying %s: %s from facet index (%s results)", facet, option, found.count)
+        return await self.open_url(found.href)
+
+    def facet_count_matches(self, facet: str, option: str, total: int) -> Optional[bool]:
+        """
+        Check a facet option's advertised count against a filtered total
+        """
+        return self._state.facet_count_matches(facet, option, total)
+
+    def invalidate_results(self) -> None:
+        """Drop cached listings and the current query's facet index after the results change"""
+        self.invalidate_listings()
+        self._state.drop_facets(self.current_query().to_url())
+
+    def current_query(self) -> SearchQuery:
+        """
+        Get the search and filters of the current results page as a SearchQuery
+        """
+        return SearchQuery.from_url(self.page.url)
+
+    async def open_query(self, query: SearchQuery) -> bool:
+        """
+        Navigate straight to the results of a search query
+        """
+        logger.info("Opening search query: %s", query.to_url())
+        return await self.open_url(query.to_url())
+
+    async def open_url(self, url: str) -> bool:
+        """
+        Navigate to a results URL (query or facet link) and wait for the results to render
+        """
+        try:
+            async with self.waits.record("open_results", url):
+                await self.page.goto(url, wait_until="domcontentloaded")
+            self.invalidate_results()
+            await self.waits.for_selector(self.RESULT_COUNT_TEXT, state="attached")
+            return True
+        except Exception as e:
+            logger.error("Error opening results URL: %s", e)
+            return False
+
+    async def apply_aspect_filter(self, aspect: str, *values: str) -> bool:
+        """
+        Add an aspect filter (e.g. Transmission=Manual) to the current search with one navigation
+        """
+        logger.info("Applying %s filter via URL: %s", aspect, values)
+        query = self.current_query().with_aspect(aspect, *values)
+        query.page_number = None
+        return await self.open_query(query)
+
+    async def filter_by_transmission(self, transmission_type: str, mode: str = FILTER_MODE_URL) -> bool:
+        """
+        Filter search results by transmission type ('url' navigation or 'ui' clicks)
+        """
+        if mode == self.FILTER_MODE_UI:
+            applied = await self.filter_by_transmission_ui(transmission_type)
+        else:
+            applied = await self.apply_facet(self.TRANSMISSION_ASPECT, transmission_type)
+        if applied:
+            await self.collect_web_vitals(self.VITALS_PAGE_TYPE, f"filter:{transmission_type}")
+        return applied
+
+    async def filter_by_transmission_ui(self, transmission_type: str) -> bool:
+        """
+        Filter search results by clicking the transmission option in the left rail
+        """
+        logger.info("Applying transmission filter: %s", transmission_type)
+
+        try:
+            if not await self.wait_for_element(self.FILTER_PANEL, timeout=self.page_ready_timeout):
+                logger.error("Filter panel did not load")
+                return False
+
+            logger.info("Looking for Transmission filter section")
+            try:
+                transmission_section = self.page.get_by_text("Transmission")
+                if await transmission_section.count() > 0:
+                    await transmission_section.first.click()
+                    logger.info("Clicked Transmission filter to expand")
+            except Exception as e:
+                logger.warning("Could not expand transmission filter button: %s", e)
+
+            logger.info("Looking for %s option", transmission_type)
+            option_locator = self.page.get_by_text(transmission_type)
+            try:
+                await self.waits.for_locator(option_locator, timeout=self.filter_option_timeout)
+            except Exception:
+                logger.warning("%s option not found in filter", transmission_type)
+                return False
+
+            signature = await self.waits.content_signature(self.RESULT_COUNT_TEXT)
+            await option_locator.first.click()
+            logger.info("Selected %s transmission option", transmission_type)
+            await self.waits.for_content_change(self.RESULT_COUNT_TEXT, signature, ready_selector=self.RESULT_ITEMS)
+            self.invalidate_results()
+            logger.info("Filter applied successfully")
+            return True
+
+        except Exception as e:
+            logger.error("Error applying transmission filter: %s", e)
+            return False
+
+    async def extract_listings(self) -> ListingSet:
+        """
+        Extract every result card on the page in a single round trip
+
+        Returns:
+            ListingSet: Columnar set with one row per result card
+        """
+        logger.info("Extracting listings from results page")
+
+        try:
+            columns = await self.page.evaluate(self.EXTRACT_LISTINGS_JS, EBaySearchResultsPage.listing_selectors())
+        except Exception as e:
+            logger.error("Error extracting listings: %s", e)
+            return ListingSet()
+
+        return self._state.store_listings(self.page.url, ListingSet.from_columns(columns or {}))
+
+    async def get_listings(self, refresh: bool = False) -> ListingSet:
+        """
+        Get listings from the current snapshot, extracting only when needed
+        """
+        snapshot = None if refresh else self._state.listings(self.page.url)
+        return snapshot if snapshot is not None else await self.extract_listings()
+
+    def invalidate_listings(self) -> None:
+        """Drop the cached listings snapshot (e.g. after results change)"""
+        self._state.drop_listings()
+
+    async def get_result_titles(self, limit: int = 10) -> list:
+        """
+        Get titles of search results
+        """
+        logger.info("Getting result titles (limit: %s)", limit)
+
+        titles = (await self.get_listings()).titles()[:limit]
+        logger.info("Retrieved %s result titles", len(titles))
+        return titles
+
+    async def validate_results_contain_keyword(self, keyword: str) -> bool:
+        """
+        Validate that search results contain a specific keyword
+        """
+        logger.info("Validating results contain keyword: %s", keyword)
+
+        try:
+            titles = await self.get_result_titles(limit=20)
+            keyword_lower = keyword.lower()
+
+            matching_results = [t for t in titles if keyword_lower in t.lower()]
+
+            if matching_results:
+                logger.info("Found %s results containing '%s'", len(matching_results), keyword)
+                return True
+            else:
+                logger.warning("No results containing '%s' found", keyword)
+                return False
+
+        except Exception as e:
+            logger.error("Error validating keyword in results: %s", e)
+            return False
+
+    async def validate_results_and_count(self, keyword: str = None) -> int:
+        """
+        High-level helper: validate that results are displayed, optionally verify keyword, and return total count
+        """
+        if not await self.are_search_results_displayed():
+            return 0
+
+        count = await self.get_search_result_count()
+        if keyword:
+            try:
+                await self.validate_results_contain_keyword(keyword)
+            except Exception:
+                logger.warning("Keyword validation raised an exception but continuing to return count")
+        return count
+
+    async def apply_transmission_and_get_count(self, transmission_type: str, mode: str = FILTER_MODE_URL) -> int:
+        """
+        High-level helper: apply transmission filter and return filtered count
+        """
+        applied = await self.filter_by_transmission(transmission_type, mode)
+        if not applied:
+            return 0
+
+        count = await self.get_search_result_count()
+        if self.facet_count_matches(self.TRANSMISSION_ASPECT, transmission_type, count) is False:
+            logger.warning("Filtered count %s differs from the %s facet count", count, transmission_type)
+        return count
@@ -2,100 +2,223 @@
 Base Page Object class providing common Playwright actions
 """
 
-from playwright.sync_api import Page, Browser, BrowserContext
+from playwright.sync_api import Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeoutError
 from typing import Optional
 import logging
 
+from instrumentation import timed
+from network_router import RequestRouter, get_request_router, install_request_router
+from selector_chain import SELECTOR_CACHE, SelectorChain, resolve_chain
+from settings import get_settings
+from wait_engine import WaitEngine
+from web_vitals import COLLECT_VITALS_JS, VITALS, VITALS_READY_JS
+
 logger = logging.getLogger(__name__)
 
 
 class BasePage:
 
+    # Selector cache section for this page object's SelectorChain attributes
+    PAGE_TYPE = "page"
+
     def __init__(self, page: Page):
         """
         Initialize BasePage with a Playwright Page object
         """
         self.page = page
-        self.timeout = 30000  # Default timeout in milliseconds
+        # timeouts (ms) come from the session settings (config.json timeouts + overrides)
+        timeouts = get_settings().timeouts
+        self.timeout = timeouts.default
+        self.navigation_timeout = timeouts.navigation
+        self.page_ready_timeout = timeouts.page_ready
+        self.results_timeout = timeouts.results
+        self.filter_option_timeout = timeouts.filter_option
+        self.element_timeout = timeouts.element_wait
+        page.set_default_timeout(self.timeout)
+        page.set_default_navigation_timeout(self.navigation_timeout)
+        self.waits = WaitEngine(page, self.timeout)
+
+    def get_wait_timings(self) -> dict:
+        """
+        Get per-wait-type statistics recorded by the wait engine
+        """
+        summary = self.waits.summary()
+        logger.info("Wait timings: %s", summary)
+        return summary
+
+    @property
+    def router(self) -> Optional[RequestRouter]:
+        """Request router installed on this page's context, if any"""
+        return get_request_router(self.page.context)
+
+    def install_request_router(self, settings: dict) -> Optional[RequestRouter]:
+        """
+        Block or stub unneeded requests for this page's context
+
+        Args:
+            settings (dict): 'network' section of config.json
+
+        Returns:
+            Optional[RequestRouter]: Installed router, or None if routing is disabled
+        """
+        return install_request_router(self.page.context, settings)
+
+    def get_network_savings(self) -> dict:
+        """
+        Get the requests and estimated bytes saved by the request router
+        """
+        router = self.router
+        savings = router.summary() if router else {}
+        logger.info("Network savings: %s", savings)
+        return savings
+
+    def collect_web_vitals(self, page_type: str, label: str) -> Optional[dict]:
+        """
+        Sample web performance metrics of the current document and check them against budgets
+
+        Args:
+            page_type (str): Budget section in config.json web_vitals.budgets ('home', 'search_results')
+            label (str): When the sample is taken (e.g. 'navigate', 'filter')
+
+        Returns:
+            Optional[dict]: Recorded sample, or None if web vitals are disabled or unavailable
+        """
+        if not VITALS.enabled:
+            return None
+        try:
+            try:
+                # the observers' LCP entry, not a full load; settle_ms caps the wait
+                self.page.wait_for_function(VITALS_READY_JS, timeout=VITALS.settle_ms)
+            except PlaywrightTimeoutError:
+                logger.debug("No LCP entry within %s ms, sampling without it", VITALS.settle_ms)
+            metrics = self.page.evaluate(COLLECT_VITALS_JS)
+        except Exception as e:
+            logger.warning("Could not collect web vitals: %s", e)
+            return None
+        return VITALS.record(page_type, label, self.page.url, metrics)
+
+    def resolve(self, selector: str, timeout: Optional[int] = None, state: str = "visible") -> Optional[str]:
+        """
+        Resolve a SelectorChain to its first matching candidate (plain selectors are returned as-is)
+
+        Args:
+            selector (str): CSS selector or SelectorChain
+            timeout (int, optional): Milliseconds to wait for any candidate (default: element wait timeout)
+            state (str): 'visible' or 'attached'
+
+        Returns:
+            Optional[str]: Concrete selector, or None if no candidate matched in time
+        """
+        if not isinstance(selector, SelectorChain):
+            return selector
+        return resolve_chain(self.page, selector, self.PAGE_TYPE, timeout or self.element_timeout, state)
+
+    def _selector(self, selector: str, probe: bool = True) -> str:
+        """Concrete selector for a primitive: a chain's winner from this run, else a probe (or the candidates' union)"""
+        if not isinstance(selector, SelectorChain):
+            return selector
+        resolved = SELECTOR_CACHE.verified(self.PAGE_TYPE, selector.name)
+        if resolved is None and probe:
+            resolved = self.resolve(selector)
+        return resolved or selector
 
+    @timed()
     def navigate(self, url: str) -> None:
         """
         Navigate to a given URL
         """
-        logger.info(f"Navigating to: {url}")
+        logger.info("Navigating to: %s", url)
         self.page.goto(url)
-        logger.info(f"Successfully navigated to: {url}")
+        logger.info("Successfully navigated to: %s", url)
 
+    @timed()
     def click(self, selector: str) -> None:
         """
         Click on an element identified by selector
         """
-        logger.info(f"Clicking element: {selector}")
+        selector = self._selector(selector)
+        logger.info("Clicking element: %s", selector)
         self.page.click(selector)
 
+    @timed()
     def fill(self, selector: str, text: str) -> None:
         """
         Fill text input field
         """
-        logger.info(f"Filling text into {selector}: {text}")
+        selector = self._selector(selector)
+        logger.info("Filling text into %s: %s", selector, text)
         self.page.fill(selector, text)
 
+    @timed(false_is_error=True)
     def wait_for_element(self, selector: str, timeout: Optional[int] = None) -> bool:
         """
         Wait for element to be visible
         """
-        timeout = timeout or self.timeout
+        timeout = timeout or self.element_timeout
+        if isinstance(selector, SelectorChain):
+            # the chain probe is the wait: all candidates are checked together
+            logger.info("Waiting for element: %s (%s candidates)", selector.name, len(selector.candidates))
+            return self.resolve(selector, timeout) is not None
         try:
-            logger.info(f"Waiting for element: {selector}")
+            logger.info("Waiting for element: %s", selector)
             self.page.wait_for_selector(selector, timeout=timeout)
             return True
         except Exception as e:
-            logger.error(f"Element not found: {selector} - {str(e)}")
+            logger.error("Element not found: %s - %s", selector, e)
             return False
 
+    @timed()
     def is_element_visible(self, selector: str) -> bool:
         """
         Check if element is visible
         """
+        selector = self._selector(selector, probe=False)
         try:
             return self.page.is_visible(selector)
         except Exception:
             return False
 
+    @timed()
     def get_text(self, selector: str) -> str:
         """
         Get text content of an element
         """
-        logger.info(f"Getting text from: {selector}")
+        selector = self._selector(selector)
+        logger.info("Getting text from: %s", selector)
         return self.page.text_content(selector) or ""
 
+    @timed()
     def get_attribute(self, selector: str, attribute: str) -> Optional[str]:
         """
         Get attribute value of an element
         """
-        logger.info(f"Getting attribute '{attribute}' from: {selector}")
+        selector = self._selector(selector)
+        logger.info("Getting attribute '%s' from: %s", attribute, selector)
         return self.page.get_attribute(selector, attribute)
 
+    @timed()
     def press_key(self, key: str) -> None:
         """
         Press a keyboard key
         """
-        logger.info(f"Pressing key: {key}")
+        logger.info("Pressing key: %s", key)
         self.page.press("body", key)
 
+    @timed()
     def take_screenshot(self, filename: str) -> None:
         """
         Take a screenshot of the current page
         """
-        logger.info(f"Taking screenshot: {filename}")
+        logger.info("Taking screenshot: %s", filename)
         self.page.screenshot(path=filename)
 
+    @timed()
     def get_page_title(self) -> str:
         """
         Get the page title
         """
         title = self.page.title()
-        logger.info(f"Page title: {title}")
+        logger.info("Page title: %s", title)
         return title
 
     def get_page_url(self) -> str:
@@ -103,38 +226,45 @@ class BasePage:
         Get the current page URL
         """
         url = self.page.url
-        logger.info(f"Current URL: {url}")
+        logger.info("Current URL: %s", url)
         return url
 
+    @timed()
     def scroll_to_bottom(self) -> None:
         """Scroll to bottom of page"""
         logger.info("Scrolling to bottom of page")
         self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
 
+    @timed()
     def scroll_to_element(self, selector: str) -> None:
         """
         Scroll to a specific element
         """
-        logger.info(f"Scrolling to element: {selector}")
+        selector = self._selector(selector)
+        logger.info("Scrolling to element: %s", selector)
         self.page.locator(selector).scroll_into_view_if_needed()
 
+    @timed()
     def wait_for_load_state(self, state: str = "domcontentloaded") -> None:
         """
         Wait for page load state
         Args:
             state (str): Load state ('domcontentloaded', 'load', 'networkidle')
         """
-        logger.info(f"Waiting for load state: {state}")
+        logger.info("Waiting for load state: %s", state)
         self.page.wait_for_load_state(state)
 
+    @timed()
     def get_element_count(self, selector: str) -> int:
         """
         Get count of elements matching selector
         """
+        selector = self._selector(selector)
         count = self.page.locator(selector).count()
-        logger.info(f"Found {count} elements matching: {selector}")
+        logger.info("Found %s elements matching: %s", count, selector)
         return count
 
+    @timed()
     def close_page(self) -> None:
         """Close the current page"""
         logger.info("Closing page")
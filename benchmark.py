@@ -0,0 +1,394 @@
+"""
+Page object micro-benchmarks
+Serves the synthetic site at several sizes and measures the latency and Playwright
+API calls of page object operations; results are written as JSON
+and compared against a saved baseline to flag regressions
+
+Usage:
+    python benchmark.py                          # compare with the saved baseline
+    python benchmark.py --sizes 60 240 1000 --repeat 30 --save-baseline
+    python benchmark.py --case results.get_result_titles --threshold 0.1
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+import logging
+
+from playwright.sync_api import Page, sync_playwright
+
+from browser_server import DEFAULT_ENDPOINT_FILE, connect_or_launch
+from home_page import EBayHomePage
+from search_query import SearchQuery
+from search_results_page import EBaySearchResultsPage
+from selector_chain import SELECTOR_CACHE
+from settings import Settings, cli_overrides, use_settings
+from synthetic_site import SyntheticSite
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = (60, 240, 1000)
+DEFAULT_BASELINE_FILE = "reports/benchmarks/baseline.json"
+BENCHMARK_QUERY = "mazda mx-5"
+
+
+class BenchmarkCase(NamedTuple):
+    """
+    One measured operation
+
+    prepare(page, site_url) brings the page into the case's start state (untimed, before
+    every sample) and returns the page object; run(page_object) is the timed call.
+    """
+
+    name: str
+    prepare: Callable[[Page, str], object]
+    run: Callable[[object], object]
+
+
+class BenchmarkResult(NamedTuple):
+    """Latency and Playwright call statistics of one case at one site size"""
+
+    case: str
+    size: int
+    samples: int
+    median_ms: float
+    mean_ms: float
+    p95_ms: float
+    min_ms: float
+    api_calls: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.case}@{self.size}"
+
+
+class Regression(NamedTuple):
+    """A metric of a case that got worse than its baseline"""
+
+    case: str
+    size: int
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def describe(self) -> str:
+        return f"{self.case}@{self.size} {self.metric}: {self.baseline:g} -> {self.current:g} ({self.ratio:.2f}x)"
+
+
+def _on_home(page: Page, site_url: str) -> EBayHomePage:
+    page.goto(site_url, wait_until="domcontentloaded")
+    return EBayHomePage(page)
+
+
+def _on_results(page: Page, site_url: str) -> EBaySearchResultsPage:
+    # a fresh page object per sample, so listing snapshots and facet indexes start cold
+    page.goto(SearchQuery(BENCHMARK_QUERY, site_url).to_url(), wait_until="domcontentloaded")
+    return EBaySearchResultsPage(page)
+
+
+Results = EBaySearchResultsPage
+
+CASES: List[BenchmarkCase] = [
+    BenchmarkCase("base.navigate", lambda page, url: EBayHomePage(page), lambda p: p.navigate(p.page_url)),
+    BenchmarkCase("base.fill", _on_home, lambda p: p.fill(p.SEARCH_INPUT, BENCHMARK_QUERY)),
+    BenchmarkCase("base.wait_for_element", _on_results, lambda p: p.wait_for_element(Results.RESULT_ITEMS)),
+    BenchmarkCase("base.is_element_visible", _on_results, lambda p: p.is_element_visible(Results.FILTER_PANEL)),
+    BenchmarkCase("base.get_text", _on_results, lambda p: p.get_text(Results.RESULT_COUNT_TEXT)),
+    BenchmarkCase("base.get_attribute", _on_results,
+                  lambda p: p.get_attribute(Results.NEXT_PAGE_LINK, "aria-disabled")),
+    BenchmarkCase("base.get_element_count", _on_results, lambda p: p.get_element_count(Results.RESULT_ITEMS)),
+    BenchmarkCase("results.get_search_result_count", _on_results, lambda p: p.get_search_result_count()),
+    BenchmarkCase("results.get_result_titles", _on_results, lambda p: p.get_result_titles(limit=50)),
+    BenchmarkCase("results.validate_results_and_count", _on_results,
+                  lambda p: p.validate_results_and_count(BENCHMARK_QUERY)),
+    BenchmarkCase("results.filter_by_transmission", _on_results, lambda p: p.filter_by_transmission("Manual")),
+]
+
+
+def _is_api_object(value) -> bool:
+    """True for Playwright sync API objects (Page, Locator, ElementHandle, BrowserContext, ...)"""
+    return type(value).__module__.startswith("playwright.sync_api")
+
+
+def _unwrap(value):
+    return value._target if isinstance(value, _Counted) else value
+
+
+class CallCounter:
+    """
+    Counts Playwright API method calls made through a wrapped page and the API objects it hands out
+
+    This is a chattiness proxy, not a protocol message count: local calls such as
+    page.locator() are counted, properties such as locator.first are not, and one call
+    can exchange several messages with the driver.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def wrap(self, value):
+        """Wrap a Playwright API object so its method calls are counted (other values pass through)"""
+        return _Counted(value, self) if _is_api_object(value) else value
+
+
+class _Counted:
+    """Proxy of one Playwright API object; every method call counts as one call"""
+
+    __slots__ = ("_target", "_counter", "__weakref__")
+
+    def __init__(self, target, counter: CallCounter):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_counter", counter)
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if not callable(value):
+            # properties such as page.context or locator.first hand out API objects too
+            return self._counter.wrap(value)
+
+        def call(*args, **kwargs):
+            self._counter.calls += 1
+            result = value(*[_unwrap(a) for a in args], **{k: _unwrap(v) for k, v in kwargs.items()})
+            return self._counter.wrap(result)
+
+        return call
+
+    # the context-manager protocol is looked up on the type, never through __getattr__, so
+    # `with context:` on a wrapped Browser/BrowserContext needs these to be forwarded;
+    # page.expect_*() managers are not API objects and pass through unwrapped
+    def __enter__(self):
+        return self._counter.wrap(self._target.__enter__())
+
+    def __exit__(self, *exc):
+        return self._target.__exit__(*exc)
+
+    def __repr__(self) -> str:
+        return f"Counted({self._target!r})"
+
+
+def measure(page: Page, site_url: str, case: BenchmarkCase, size: int, repeat: int = 20,
+            warmup: int = 2) -> BenchmarkResult:
+    """
+    Time a case
+
+    Args:
+        page (Page): Page to run on
+        site_url (str): Synthetic site root
+        case (BenchmarkCase): Operation to measure
+        size (int): Site size (recorded with the result)
+        repeat (int): Timed samples
+        warmup (int): Untimed runs first (selector cache, JIT, HTTP cache)
+
+    Returns:
+        BenchmarkResult: Statistics over the timed samples; api_calls is the median number of Playwright
+        API method calls the operation made (counted through CallCounter)
+    """
+    counter = CallCounter()
+    counted_page = counter.wrap(page)
+    durations = []
+    calls = []
+    for i in range(warmup + repeat):
+        target = case.prepare(counted_page, site_url)
+        before = counter.calls
+        start = time.perf_counter()
+        case.run(target)
+        elapsed = (time.perf_counter() - start) * 1000
+        if i >= warmup:
+            durations.append(elapsed)
+            calls.append(counter.calls - before)
+    durations.sort()
+    return BenchmarkResult(
+        case=case.name,
+        size=size,
+        samples=repeat,
+        median_ms=round(statistics.median(durations), 3),
+        mean_ms=round(statistics.fmean(durations), 3),
+        p95_ms=round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 3),
+        min_ms=round(durations[0], 3),
+        api_calls=int(statistics.median(calls)),
+    )
+
+
+def run_benchmarks(settings: Settings, sizes: Sequence[int] = DEFAULT_SIZES, repeat: int = 20, warmup: int = 2,
+                   facet_groups: int = 12, facet_options: int = 40,
+                   cases: Optional[Sequence[str]] = None) -> List[BenchmarkResult]:
+    """
+    Run the cases against the synthetic site at every size
+
+    Args:
+        settings (Settings): Session settings (launch options, timeouts, browser server)
+        sizes: Result cards per page, one site per size
+        repeat (int): Timed samples per case
+        warmup (int): Untimed runs per case
+        facet_groups (int): Filler facets in the rail
+        facet_options (int): Options per filler facet
+        cases: Case names to run (default: all)
+
+    Returns:
+        List[BenchmarkResult]: One result per case and size
+    """
+    selected = [c for c in CASES if not cases or c.name in cases]
+    server_cfg = settings.section("browser_server")
+    endpoint_file = server_cfg.get("endpoint_file", DEFAULT_ENDPOINT_FILE) if server_cfg.get("enabled", False) else None
+    results = []
+    with sync_playwright() as playwright:
+        browser = connect_or_launch(playwright.chromium, settings.launch_options, endpoint_file,
+                                    timeout=server_cfg.get("connect_timeout", 5000))
+        try:
+            for size in sizes:
+                with SyntheticSite(size, facet_groups, facet_options) as site:
+                    # page objects read the site root from the settings
+                    use_settings(Settings({**settings.data, "base_url": site.url}, source=settings.source))
+                    context = browser.new_context()
+                    page = context.new_page()
+                    try:
+                        for case in selected:
+                            result = measure(page, site.url, case, size, repeat, warmup)
+                            logger.info("%s: median %.2fms p95 %.2fms, %s Playwright API calls",
+                                        result.key, result.median_ms, result.p95_ms, result.api_calls)
+                            results.append(result)
+                    finally:
+                        context.close()
+        finally:
+            use_settings(settings)
+            browser.close()
+    return results
+
+
+def save_results(path: str, results: Sequence[BenchmarkResult], **metadata) -> Path:
+    """
+    Write results as JSON
+
+    Args:
+        path (str): Output file
+        results: Benchmark results
+        metadata: Extra top-level fields (e.g. repeat)
+
+    Returns:
+        Path: Written file
+    """
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    data = {"created": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+            **metadata, "results": [r._asdict() for r in results]}
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    logger.info("Benchmark results written: %s", out)
+    return out
+
+
+def load_results(path: str) -> Dict[str, BenchmarkResult]:
+    """
+    Read a results file
+
+    Returns:
+        Dict[str, BenchmarkResult]: Results by 'case@size' (empty if the file is missing)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    results = [BenchmarkResult(**row) for row in data.get("results", [])]
+    return {r.key: r for r in results}
+
+
+def compare(baseline: Dict[str, BenchmarkResult], current: Sequence[BenchmarkResult], threshold: float = 0.25,
+            min_delta_ms: float = 2.0) -> List[Regression]:
+    """
+    Find cases that got slower or chattier than the baseline
+
+    A median latency counts as a regression when it exceeds the baseline by more than
+    the threshold and by more than min_delta_ms (timer noise on sub-millisecond calls).
+    Playwright API call counts are deterministic, so any increase counts.
+
+    Args:
+        baseline (dict): Baseline results by 'case@size'
+        current: Results of this run
+        threshold (float): Allowed relative slowdown (0.25 = 25%)
+        min_delta_ms (float): Ignore slowdowns smaller than this
+
+    Returns:
+        List[Regression]: Regressions (cases missing from the baseline are skipped)
+    """
+    regressions = []
+    for result in current:
+        before = baseline.get(result.key)
+        if before is None:
+            continue
+        delta = result.median_ms - before.median_ms
+        if delta > before.median_ms * threshold and delta > min_delta_ms:
+            regressions.append(Regression(result.case, result.size, "median_ms", before.median_ms, result.median_ms))
+        if result.api_calls > before.api_calls:
+            regressions.append(Regression(result.case, result.size, "api_calls", before.api_calls,
+                                          result.api_calls))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; returns a process exit code (1 if a regression was found)"""
+    parser = argparse.ArgumentParser(description="Benchmark page object operations against a synthetic site")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Result cards per page (default: benchmarks.sizes)")
+    parser.add_argument("--repeat", type=int, help="Timed samples per case (default: benchmarks.repeat)")
+    parser.add_argument("--case", action="append", dest="cases", help="Only run this case (repeatable)")
+    parser.add_argument("--baseline", help="Baseline file (default: benchmarks.baseline_file)")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--threshold", type=float, help="Allowed relative slowdown (default: benchmarks.threshold)")
+    parser.add_argument("--output", help="Also write this run's results to this path")
+    parser.add_argument("--config", help="Settings file to use instead of config.json")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", dest="overrides",
+                        help="Override a setting by dotted key, e.g. browser_config.headless=false (repeatable)")
+    args = parser.parse_args(argv)
+
+    try:
+        settings = use_settings(Settings.load(args.config, cli_overrides(args.overrides)))
+    except ValueError as exc:
+        parser.error(str(exc))
+    # synthetic-site selector winners stay in memory instead of the shared selector cache file
+    SELECTOR_CACHE.configure(None)
+    bench_cfg = settings.section("benchmarks")
+    sizes = args.sizes or bench_cfg.get("sizes", list(DEFAULT_SIZES))
+    repeat = args.repeat or bench_cfg.get("repeat", 20)
+    baseline_file = args.baseline or bench_cfg.get("baseline_file", DEFAULT_BASELINE_FILE)
+    threshold = args.threshold if args.threshold is not None else bench_cfg.get("threshold", 0.25)
+
+    results = run_benchmarks(settings, sizes, repeat, warmup=bench_cfg.get("warmup", 2),
+                             facet_groups=bench_cfg.get("facet_groups", 12),
+                             facet_options=bench_cfg.get("facet_options", 40), cases=args.cases)
+    metadata = {"sizes": sizes, "repeat": repeat}
+    if args.output:
+        save_results(args.output, results, **metadata)
+
+    baseline = load_results(baseline_file)
+    print(f"{'case':<38} {'size':>5} {'median ms':>10} {'p95 ms':>9} {'api calls':>9} {'baseline':>9}")
+    for r in results:
+        before = baseline.get(r.key)
+        print(f"{r.case:<38} {r.size:>5} {r.median_ms:>10.2f} {r.p95_ms:>9.2f} {r.api_calls:>9} "
+              f"{before.median_ms if before else '-':>9}")
+
+    if args.save_baseline:
+        save_results(baseline_file, results, **metadata)
+        print(f"Baseline saved: {baseline_file}")
+        return 0
+    if not baseline:
+        print(f"No baseline at {baseline_file}; run with --save-baseline to create one")
+        return 0
+    regressions = compare(baseline, results, threshold, bench_cfg.get("min_delta_ms", 2.0))
+    for regression in regressions:
+        print(f"REGRESSION  {regression.describe()}")
+    print(f"{len(results)} measurements, {len(regressions)} regression(s) over {threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    raise SystemExit(main())
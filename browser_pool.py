@@ -0,0 +1,104 @@
+"""
+Warm browser context pool
+Keeps pre-created contexts (each with an open page) ready so tests skip context startup
+"""
+
+import time
+from collections import deque
+from typing import Callable, Iterable, Optional
+import logging
+
+from playwright.sync_api import Browser, BrowserContext
+
+logger = logging.getLogger(__name__)
+
+
+class ContextPool:
+    """Pool of warm browser contexts shared by the tests of one worker"""
+
+    def __init__(
+        self,
+        browser: Browser,
+        size: int = 2,
+        context_options: Optional[dict] = None,
+        on_create: Iterable[Callable[[BrowserContext], None]] = (),
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            browser (Browser): Browser launched once for the session/worker
+            size (int): Number of contexts kept warm
+            context_options (dict, optional): Keyword arguments for browser.new_context
+            on_create: Callables run on each new context (e.g. request router installation)
+        """
+        self.browser = browser
+        self.size = max(1, size)
+        self.context_options = dict(context_options or {})
+        self.on_create = list(on_create)
+        self._idle = deque()
+        self._in_use = set()
+        self.created = 0
+        self.acquire_wait_ms = []
+
+    def _create_context(self) -> BrowserContext:
+        context = self.browser.new_context(**self.context_options)
+        for hook in self.on_create:
+            hook(context)
+        context.new_page()
+        self.created += 1
+        return context
+
+    def fill(self) -> None:
+        """Create contexts until the pool holds `size` warm contexts"""
+        while len(self._idle) < self.size:
+            self._idle.append(self._create_context())
+
+    def acquire(self) -> BrowserContext:
+        """
+        Take a warm context from the pool, creating one only if refilling failed
+
+        Returns:
+            BrowserContext: Clean context with one open page
+        """
+        start = time.perf_counter()
+        context = self._idle.popleft() if self._idle else self._create_context()
+        self._in_use.add(context)
+        self.acquire_wait_ms.append((time.perf_counter() - start) * 1000)
+        return context
+
+    def release(self, context: BrowserContext) -> None:
+        """
+        Close a context after a test and warm its replacement
+
+        The used context is closed rather than cleared: a new context is the
+        only reset that also drops localStorage, IndexedDB, service workers
+        and open pages. The replacement (new_context, on_create hooks and
+        new_page) is created here, during the finished test's teardown, so the
+        pool stays at `size` and the next test's setup only takes a context;
+        the sync API cannot create contexts off the calling thread.
+
+        Args:
+            context (BrowserContext): Context obtained from acquire
+        """
+        self._in_use.discard(context)
+        try:
+            context.close()
+        except Exception as e:
+            logger.warning("Error closing pooled context: %s", e)
+        try:
+            self.fill()
+        except Exception as e:
+            # acquire falls back to creating a context on demand
+            logger.warning("Error refilling context pool: %s", e)
+
+    def close(self) -> None:
+        """Close every pooled and in-use context"""
+        for context in list(self._idle) + list(self._in_use):
+            try:
+                context.close()
+            except Exception:
+                pass
+        self._idle.clear()
+        self._in_use.clear()
+        logger.info("Context pool closed after creating %s contexts", self.created)
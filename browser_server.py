@@ -0,0 +1,285 @@
+"""
+Shared local browser server
+Keeps one Chromium running between pytest invocations; sessions connect to it over a
+local websocket and fall back to launching their own browser when it is not running
+
+Usage:
+    python browser_server.py start [--headed] [--port 0]
+    python browser_server.py status
+    python browser_server.py stop
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINT_FILE = "reports/browser_server.json"
+DEFAULT_LOG_FILE = "logs/browser_server.log"
+
+# Line the public `playwright launch-server` command prints once the server listens
+WS_ENDPOINT_PREFIX = "ws://"
+
+
+def _camel_case(options: dict) -> dict:
+    """Python launch option names (slow_mo) to their JS names (slowMo)"""
+    converted = {}
+    for key, value in options.items():
+        head, *rest = key.split("_")
+        converted[head + "".join(part.capitalize() for part in rest)] = value
+    return converted
+
+
+def _signal_group(pid: int, sig: int) -> None:
+    """Signal the server's process group (the playwright CLI wrapper and its driver)"""
+    try:
+        os.killpg(pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _read_ws_endpoint(log_file: str, offset: int) -> Optional[str]:
+    """First websocket endpoint logged after offset, or None if the server has not printed it yet"""
+    try:
+        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+            f.seek(offset)
+            for line in f:
+                if line.startswith(WS_ENDPOINT_PREFIX):
+                    return line.strip()
+    except OSError:
+        pass
+    return None
+
+
+def _write_endpoint(endpoint_file: str, info: dict) -> None:
+    path = Path(endpoint_file)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(info, f, indent=2)
+    os.replace(tmp, path)
+
+
+def read_endpoint(endpoint_file: str = DEFAULT_ENDPOINT_FILE) -> Optional[dict]:
+    """
+    Get the running server's endpoint info
+
+    A file left behind by a server that is no longer running is removed.
+
+    Returns:
+        Optional[dict]: {ws_endpoint, pid, browser, started_at, options}, or None if no server is running
+    """
+    path = Path(endpoint_file)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not _pid_alive(int(info.get("pid", 0))):
+        logger.info("Removing stale browser server endpoint %s", path)
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+    return info
+
+
+def start_server(launch_options: Optional[dict] = None, endpoint_file: str = DEFAULT_ENDPOINT_FILE,
+                 port: int = 0, log_file: str = DEFAULT_LOG_FILE, timeout: float = 60) -> dict:
+    """
+    Start the browser server in the background (or return the one already running)
+
+    Args:
+        launch_options (dict, optional): Chromium launch options (browser_config section)
+        endpoint_file (str): Where the websocket endpoint is published
+        port (int): Websocket port (0 picks a free one)
+        log_file (str): Server output
+        timeout (float): Seconds to wait for the endpoint
+
+    Returns:
+        dict: Endpoint info as read_endpoint returns it
+
+    Raises:
+        RuntimeError: If the server exits or does not publish its endpoint in time
+    """
+    running = read_endpoint(endpoint_file)
+    if running:
+        return running
+
+    # listen on loopback only; the random ws path keeps other local users out
+    options = {**_camel_case(launch_options or {}), "host": "127.0.0.1"}
+    if port:
+        options["port"] = port
+    Path(endpoint_file).parent.mkdir(parents=True, exist_ok=True)
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    options_file = Path(endpoint_file).with_suffix(".options.json")
+    with open(options_file, 'w', encoding='utf-8') as f:
+        json.dump(options, f)
+    # the public CLI of the installed Playwright package, so its driver (and protocol version)
+    # always matches the Python client; its own session lets stop_server signal the whole group
+    with open(log_file, 'a') as log:
+        offset = log.tell()
+        process = subprocess.Popen([sys.executable, "-m", "playwright", "launch-server", "--browser", "chromium",
+                                    "--config", str(options_file)],
+                                   stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                                   start_new_session=True)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        ws_endpoint = _read_ws_endpoint(log_file, offset)
+        if ws_endpoint:
+            info = {"ws_endpoint": ws_endpoint, "pid": process.pid, "browser": "chromium",
+                    "started_at": datetime.now(timezone.utc).isoformat(), "options": options}
+            _write_endpoint(endpoint_file, info)
+            logger.info("Browser server started: %s (pid %s)", ws_endpoint, process.pid)
+            return info
+        if process.poll() is not None:
+            raise RuntimeError(f"Browser server exited with code {process.returncode}; see {log_file}")
+        time.sleep(0.1)
+    _signal_group(process.pid, signal.SIGTERM)
+    raise RuntimeError(f"Browser server did not print its endpoint within {timeout}s; see {log_file}")
+
+
+def stop_server(endpoint_file: str = DEFAULT_ENDPOINT_FILE, timeout: float = 10) -> bool:
+    """
+    Stop the running server
+
+    Returns:
+        bool: True if a server was running and has stopped
+    """
+    info = read_endpoint(endpoint_file)
+    if not info:
+        return False
+    pid = int(info["pid"])
+    _signal_group(pid, signal.SIGTERM)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not _pid_alive(pid):
+            try:
+                Path(endpoint_file).unlink()
+            except OSError:
+                pass
+            return True
+        time.sleep(0.1)
+    logger.warning("Browser server (pid %s) did not stop within %ss", pid, timeout)
+    return False
+
+
+def _usable_server(browser_type, launch_options: Optional[dict], endpoint_file: Optional[str]) -> Optional[dict]:
+    """Endpoint info of a running server that matches the browser type and headless mode"""
+    info = read_endpoint(endpoint_file) if endpoint_file else None
+    if not info or info.get("browser") != browser_type.name:
+        return None
+    wanted = (launch_options or {}).get("headless", True)
+    if info.get("options", {}).get("headless", True) != wanted:
+        logger.info("Browser server runs with headless=%s, launching locally for headless=%s",
+                    not wanted, wanted)
+        return None
+    return info
+
+
+def connect_or_launch(browser_type, launch_options: Optional[dict] = None,
+                      endpoint_file: Optional[str] = DEFAULT_ENDPOINT_FILE, timeout: int = 5000):
+    """
+    Connect to the running browser server, or launch a local browser
+
+    Contexts created on a connected browser are isolated like local ones; closing
+    the returned browser only disconnects from the server.
+
+    Args:
+        browser_type: Playwright sync BrowserType (e.g. playwright.chromium)
+        launch_options (dict, optional): Used for the local fallback launch
+        endpoint_file (str, optional): Server endpoint file (None always launches locally)
+        timeout (int): Milliseconds to wait for the connection
+
+    Returns:
+        Browser: Connected or launched browser
+    """
+    info = _usable_server(browser_type, launch_options, endpoint_file)
+    if info:
+        try:
+            browser = browser_type.connect(info["ws_endpoint"], timeout=timeout)
+            logger.info("Connected to browser server %s (launch options of the server apply)", info["ws_endpoint"])
+            return browser
+        except Exception as e:
+            logger.warning("Could not connect to browser server %s, launching locally: %s", info["ws_endpoint"], e)
+    return browser_type.launch(**(launch_options or {}))
+
+
+async def connect_or_launch_async(browser_type, launch_options: Optional[dict] = None,
+                                  endpoint_file: Optional[str] = DEFAULT_ENDPOINT_FILE, timeout: int = 5000):
+    """Async counterpart of connect_or_launch for playwright.async_api browser types"""
+    info = _usable_server(browser_type, launch_options, endpoint_file)
+    if info:
+        try:
+            browser = await browser_type.connect(info["ws_endpoint"], timeout=timeout)
+            logger.info("Connected to browser server %s (launch options of the server apply)", info["ws_endpoint"])
+            return browser
+        except Exception as e:
+            logger.warning("Could not connect to browser server %s, launching locally: %s", info["ws_endpoint"], e)
+    return await browser_type.launch(**(launch_options or {}))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; returns a process exit code"""
+    from settings import get_settings
+
+    settings = get_settings()
+    server_cfg = settings.section("browser_server")
+    parser = argparse.ArgumentParser(description="Manage the shared local browser server")
+    parser.add_argument("--endpoint-file", default=server_cfg.get("endpoint_file", DEFAULT_ENDPOINT_FILE),
+                        help="Endpoint file sessions read (default: browser_server.endpoint_file)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    start = commands.add_parser("start", help="Launch Chromium as a background server")
+    start.add_argument("--headed", action="store_true", help="Show the browser window")
+    start.add_argument("--port", type=int, default=0, help="Websocket port (default: any free port)")
+    commands.add_parser("status", help="Show the running server")
+    commands.add_parser("stop", help="Stop the running server")
+    args = parser.parse_args(argv)
+
+    if args.command == "start":
+        launch_options = settings.launch_options
+        if args.headed:
+            launch_options["headless"] = False
+        try:
+            info = start_server(launch_options, args.endpoint_file, port=args.port)
+        except RuntimeError as e:
+            print(e)
+            return 1
+        print(f"Browser server running: {info['ws_endpoint']} (pid {info['pid']})")
+    elif args.command == "status":
+        info = read_endpoint(args.endpoint_file)
+        if not info:
+            print("Browser server is not running")
+            return 1
+        print(f"Browser server running: {info['ws_endpoint']} (pid {info['pid']}, since {info['started_at']})")
+    elif args.command == "stop":
+        if not stop_server(args.endpoint_file):
+            print("Browser server is not running")
+            return 1
+        print("Browser server stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(main())
@@ -3,7 +3,19 @@ from pathlib import Path
 from datetime import datetime
 import pytest
 from html import escape
-from logger_report import TestLogger, TestReport
+from instrumentation import RECORDER, attribute_to
+from logger_report import TestLogCapture, TestLogger, TestReport, get_worker_id
+from browser_pool import ContextPool
+from browser_server import DEFAULT_ENDPOINT_FILE, connect_or_launch
+from network_router import get_request_router, install_request_router
+from replay import MODES as REPLAY_MODES, apply_replay, har_path_for
+from run_history import DEFAULT_DATABASE, RunHistory
+from selector_chain import DEFAULT_CACHE_FILE, SELECTOR_CACHE
+from screenshot_pipeline import ScreenshotPolicy, ScreenshotWriter
+from settings import Settings, cli_overrides, use_settings
+from storage_state import StorageStateManager
+from trace_recorder import TracePolicy, start_test_chunk, start_tracing, stop_test_chunk
+from web_vitals import VITALS, failed_budgets, install_web_vitals, warned_budgets
 
 # try to import pytest-html builder
 try:
@@ -14,47 +26,361 @@ except Exception:
 # module-level holder for generated session html log and TestReport instance
 GENERATED_SESSION_HTML = None
 TEST_REPORT = None
+SCREENSHOT_WRITER = None
+TRACE_POLICY = TracePolicy()
+# buffers the running test's log lines for its report (attached to the root logger by the logger fixture)
+LOG_CAPTURE = TestLogCapture()
+# setup/call durations of the running test, recorded with its result
+STEP_DURATIONS = pytest.StashKey[dict]()
+# fixtures that mean a test drives a browser; sessions without any write no logs or reports
+BROWSER_FIXTURES = {"page", "context", "browser", "pooled_page", "pooled_context", "context_pool"}
+
+
+class XdistRunPlugin:
+    """Hands the controller's run id to every xdist worker (registered only when xdist is installed)."""
+
+    def pytest_configure_node(self, node):
+        node.workerinput["ebay_run_id"] = node.config.ebay_run_id
+
+
+def pytest_configure(config):
+    """Load the session settings and assign a run id shared by the controller and all xdist workers."""
+    config.addinivalue_line(
+        "markers", "duration_budget(seconds): keep the test's trace when its call phase runs longer than this")
+    try:
+        config.ebay_settings = use_settings(Settings.load(config.getoption("--ebay-config"),
+                                                          cli_overrides(config.getoption("--ebay-set"))))
+    except ValueError as exc:
+        raise pytest.UsageError(str(exc))
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        config.ebay_run_id = workerinput["ebay_run_id"]
+    else:
+        config.ebay_run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        config.ebay_run_started = datetime.now()
+        if config.pluginmanager.hasplugin("xdist"):
+            config.pluginmanager.register(XdistRunPlugin(), "ebay_xdist_run")
+
+
+def _is_xdist_worker(config):
+    return hasattr(config, "workerinput")
+
+
+def _shard_dir(run_id):
+    return Path("reports") / "shards" / f"test_{run_id}"
+
+
+def _collects_browser_tests(session):
+    """True if any collected test uses a browser fixture (pure unit runs leave no artifacts behind)."""
+    return any(BROWSER_FIXTURES & set(getattr(item, "fixturenames", ())) for item in session.items)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    """On the xdist controller, merge worker report shards into one TestReport HTML."""
+    global GENERATED_SESSION_HTML
+    config = session.config
+    if _is_xdist_worker(config):
+        return
+    shard_dir = _shard_dir(config.ebay_run_id)
+    shards = sorted(shard_dir.glob("*.jsonl")) if shard_dir.exists() else []
+    if not shards:
+        return
+    try:
+        merged = TestReport.merge_shards(shards, report_file=f"test_{config.ebay_run_id}.html",
+                                         start_time=config.ebay_run_started, run_id=config.ebay_run_id)
+        merged.generate_report()
+        GENERATED_SESSION_HTML = str(merged.report_path)
+        config.ebay_log_html = GENERATED_SESSION_HTML
+        _record_history(config.ebay_settings, merged)
+    except Exception as exc:
+        logging.getLogger(__name__).exception("Failed to merge worker report shards: %s", exc)
+
+
+def _record_history(settings, report):
+    """Ingest a finished report's JSON-lines results into the run history database."""
+    history_cfg = settings.section("history")
+    if not history_cfg.get("enabled", False) or not report.results_path.exists():
+        return
+    history = RunHistory(history_cfg.get("database", DEFAULT_DATABASE))
+    try:
+        history.ingest_jsonl(str(report.results_path), run_id=report.run_id)
+    finally:
+        history.close()
+
+
+def pytest_addoption(parser):
+    """Register project command line options."""
+    group = parser.getgroup("ebay", "eBay automation framework")
+    group.addoption(
+        "--ebay-replay",
+        action="store",
+        default=None,
+        choices=REPLAY_MODES,
+        help="Record eBay traffic to HAR bundles or replay it offline (overrides config.json replay.mode)",
+    )
+    group.addoption(
+        "--ebay-config",
+        action="store",
+        default=None,
+        help="Settings file to use instead of config.json",
+    )
+    group.addoption(
+        "--ebay-set",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Override a setting by dotted key, e.g. timeouts.navigation=90000 (repeatable; wins over EBAY_* env)",
+    )
+
+
+@pytest.fixture(scope="session")
+def settings(pytestconfig):
+    """Validated session settings: config.json with EBAY_* environment and --ebay-set overrides."""
+    return pytestconfig.ebay_settings
+
+
+@pytest.fixture(scope="session")
+def ebay_config(settings):
+    """Effective configuration as a plain dict (sections as in config.json)."""
+    return settings.data
+
+
+def _replay_mode(request, ebay_config):
+    """Replay mode from --ebay-replay, falling back to config.json replay.mode."""
+    return request.config.getoption("--ebay-replay") or ebay_config.get("replay", {}).get("mode", "off")
+
+
+def _apply_test_replay(request, ebay_config, context):
+    """Attach the test's HAR bundle to a context according to the replay mode (the request router keeps running first)."""
+    replay_cfg = ebay_config.get("replay", {})
+    har_path = har_path_for(replay_cfg.get("har_dir", "fixtures/har"), request.node.name)
+    mode = _replay_mode(request, ebay_config)
+    apply_replay(context, mode, har_path, url_filter=replay_cfg.get("url_filter"))
+    # pooled contexts got their router at creation; move it ahead of the HAR route so
+    # blocked requests are neither recorded nor looked up in the bundle
+    router = get_request_router(context)
+    if router and mode != "off":
+        router.reinstall(context)
+
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args, settings):
+    """Launch options from the browser_config settings; pytest-playwright CLI flags (--headed, --slowmo) win."""
+    return {**settings.launch_options, **browser_type_launch_args}
+
+
+@pytest.fixture(scope="session")
+def launch_browser(launch_browser, browser_type, browser_type_launch_args, connect_options, settings):
+    """Connect to the shared browser server (python browser_server.py start) when one runs, else launch."""
+    server_cfg = settings.section("browser_server")
+    if connect_options or not server_cfg.get("enabled", False):
+        return launch_browser
+
+    def launch(**kwargs):
+        # tests asking for their own launch arguments get their own browser
+        if kwargs:
+            return launch_browser(**kwargs)
+        return connect_or_launch(browser_type, browser_type_launch_args,
+                                 server_cfg.get("endpoint_file", DEFAULT_ENDPOINT_FILE),
+                                 timeout=server_cfg.get("connect_timeout", 5000))
+
+    return launch
+
+
+@pytest.fixture(scope="session")
+def trace_policy(settings):
+    """Failure-only tracing settings from the tracing section."""
+    global TRACE_POLICY
+    TRACE_POLICY = TracePolicy.from_config(settings.section("tracing"))
+    return TRACE_POLICY
+
+
+@pytest.fixture(scope="session")
+def context_pool(request, browser, settings, ebay_config, trace_policy):
+    """Warm contexts for this session/worker, created from the session browser."""
+    pool_cfg = ebay_config.get("browser_pool", {})
+    network_cfg = ebay_config.get("network", {})
+
+    def install_router(context):
+        install_request_router(context, network_cfg)
+
+    on_create = [install_router]
+    context_options = dict(pool_cfg.get("context_options") or {})
+    # returning-visitor cookies/localStorage (not while replaying: the warm-up visit would go online)
+    state_cfg = settings.section("storage_state")
+    if state_cfg.get("enabled", False) and _replay_mode(request, ebay_config) == "off":
+        # the warm-up visit must load third-party consent providers (e.g. OneTrust on the
+        # cookielaw CDN), so it only skips heavy media, never hosts, scripts or stylesheets
+        warmup_network = {"enabled": network_cfg.get("enabled", False),
+                          "block_resource_types": ["image", "media", "font"]}
+        snapshot = StorageStateManager.from_config(state_cfg).get(
+            browser, settings.base_url, context_options,
+            setup=lambda context: install_request_router(context, warmup_network))
+        if snapshot:
+            context_options["storage_state"] = str(snapshot)
+    if ebay_config.get("web_vitals", {}).get("enabled", False):
+        on_create.append(install_web_vitals)
+    if trace_policy.enabled:
+        # tracing starts while the context is warmed up; tests only open and close chunks
+        on_create.append(lambda context: start_tracing(context, trace_policy))
+    pool = ContextPool(
+        browser,
+        size=pool_cfg.get("size", 2),
+        context_options=context_options,
+        on_create=on_create,
+    )
+    pool.fill()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def pooled_context(request, context_pool, ebay_config, logger):
+    """Clean pooled context for one test; replaced with a fresh warm context afterwards."""
+    context = context_pool.acquire()
+    _apply_test_replay(request, ebay_config, context)
+    start_test_chunk(context, request.node.nodeid)
+    yield context
+    # normally closed (and kept or discarded) by pytest_runtest_makereport; discard leftovers
+    stop_test_chunk(context)
+    router = get_request_router(context)
+    if router:
+        logger.info("Request router for %s: %s", request.node.name, router.summary())
+    context_pool.release(context)
+
+
+@pytest.fixture
+def pooled_page(pooled_context):
+    """The pre-opened page of the test's pooled context."""
+    return pooled_context.pages[0]
+
+
+@pytest.fixture(autouse=True)
+def replay_routing(request, ebay_config):
+    """Route the test's browser context through a HAR bundle when record/replay is enabled."""
+    if _replay_mode(request, ebay_config) == "off" or not {"page", "context"} & set(request.fixturenames):
+        yield
+        return
+
+    _apply_test_replay(request, ebay_config, request.getfixturevalue("context"))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def request_routing(request, ebay_config, replay_routing, logger):
+    """Install the request router on the test's context (registered after replay so it runs first)."""
+    network_cfg = ebay_config.get("network", {})
+    if not network_cfg.get("enabled", False) or not {"page", "context"} & set(request.fixturenames):
+        yield None
+        return
+
+    router = install_request_router(request.getfixturevalue("context"), network_cfg)
+    yield router
+    if router:
+        logger.info("Request router for %s: %s", request.node.name, router.summary())
+
+
+@pytest.fixture(autouse=True)
+def web_vitals_capture(request, logger):
+    """Observe web performance metrics on the test's context when web_vitals is enabled."""
+    if not VITALS.enabled or not {"page", "context"} & set(request.fixturenames):
+        return
+    install_web_vitals(request.getfixturevalue("context"))
 
-@pytest.fixture(scope="session", autouse=True)
-def logger(request):
-    """Configure session logger via logger_report and create a TestReport for results."""
-    logs_dir = Path("logs")
-    logs_dir.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_name = f"test_{timestamp}.log"
-    log_path = logs_dir / log_name
-    request.config.ebay_log_file = str(log_path)
+@pytest.fixture(autouse=True)
+def trace_chunks(request, trace_policy):
+    """Record a trace chunk on the test's pytest-playwright context (pooled contexts do this themselves)."""
+    playwright_tracing = request.config.getoption("--tracing", default="off")
+    if not trace_policy.enabled or playwright_tracing != "off" or not {"page", "context"} & set(request.fixturenames):
+        yield
+        return
 
-    # Use TestLogger to set up handlers consistently for this project
-    logger = TestLogger.setup_logger(log_file=log_name, log_level="DEBUG")
-    logger.info("=== TEST SESSION START: %s ===", timestamp)
+    context = request.getfixturevalue("context")
+    start_tracing(context, trace_policy)
+    start_test_chunk(context, request.node.nodeid)
+    yield
+    stop_test_chunk(context)
 
-    # create TestReport instance to be used during the session
+
+@pytest.fixture(scope="session", autouse=True)
+def logger(request, settings):
+    """Configure session logger via logger_report and create a TestReport for results."""
+    run_id = request.config.ebay_run_id
+    worker = get_worker_id()
+    is_worker = _is_xdist_worker(request.config)
+    # worker-scoped names so parallel workers never share a log or report file
+    log_name = f"test_{run_id}_{worker}.log" if is_worker else f"test_{run_id}.log"
+    log_path = Path("logs") / log_name
     global TEST_REPORT
-    TEST_REPORT = TestReport(report_file=f"{log_path.stem}.html")
+    TEST_REPORT = None
+
+    # unit-only runs (e.g. --ignore=test_simple_flow.py) keep pytest's own log handling and
+    # write no session log, report, action timings or history into the working tree
+    browser_run = _collects_browser_tests(request.session)
+    if browser_run:
+        request.config.ebay_log_file = str(log_path)
+        # Use TestLogger to set up handlers consistently for this project
+        # queued mode: the test thread only enqueues records, a listener thread writes them
+        log_settings = settings.logging
+        logger = TestLogger.setup_logger(log_file=log_name, log_level=log_settings.log_level,
+                                         queued=log_settings.queue, batch_size=log_settings.batch_size)
+    else:
+        logger = logging.getLogger()
+    logger.addHandler(LOG_CAPTURE)
+    logger.info("=== TEST SESSION START: %s (%s) ===", run_id, worker)
+
+    # create TestReport instance to be used during the session; workers write
+    # shards that the controller merges in pytest_sessionfinish
+    if browser_run:
+        shard_file = _shard_dir(run_id) / f"{worker}.jsonl" if is_worker else None
+        TEST_REPORT = TestReport(report_file=f"{log_path.stem}.html", shard_file=shard_file, run_id=run_id)
     request.config.ebay_test_report = TEST_REPORT
 
+    RECORDER.enabled = settings.get("instrumentation.enabled", True)
+    VITALS.configure(settings.section("web_vitals"), routed=settings.get("network.enabled", False))
+    SELECTOR_CACHE.configure(settings.get("selectors.cache_file", DEFAULT_CACHE_FILE))
+
+    # screenshots are encoded and written off the test thread
+    global SCREENSHOT_WRITER
+    SCREENSHOT_WRITER = ScreenshotWriter(ScreenshotPolicy.from_config(settings.section("screenshots")))
+
     yield logger
 
     logger.info("=== TEST SESSION END ===")
 
-    # finalize TestReport -> generate HTML report
+    # report links point at screenshot files, so finish writing them first
+    SCREENSHOT_WRITER.close()
+
+    if not browser_run:
+        logger.removeHandler(LOG_CAPTURE)
+        return
+
+    if RECORDER.enabled:
+        try:
+            RECORDER.export_json(str(Path("reports") / f"{log_path.stem}_actions.json"), run_id=run_id, worker=worker)
+        except Exception as exc:
+            logger.exception("Failed to export action timings: %s", exc)
+
+    # finalize TestReport -> generate HTML report (the controller does this for xdist workers)
     global GENERATED_SESSION_HTML
     try:
-        if TEST_REPORT:
+        if TEST_REPORT and not is_worker:
             TEST_REPORT.generate_report()
             if TEST_REPORT.report_path.exists():
                 GENERATED_SESSION_HTML = str(TEST_REPORT.report_path)
                 request.config.ebay_log_html = GENERATED_SESSION_HTML
                 logger.info("Generated HTML session report: %s", GENERATED_SESSION_HTML)
+                _record_history(settings, TEST_REPORT)
             else:
                 request.config.ebay_log_html = None
     except Exception as exc:
         logger.exception("Failed to generate session HTML report: %s", exc)
         request.config.ebay_log_html = None
 
-    # flush and (TestLogger.setup_logger) already manages handlers; ensure flush
+    # write out the queued records, then close the remaining handlers
+    TestLogger.stop_listener()
     for h in logger.handlers[:]:
         try:
             h.flush()
@@ -67,116 +393,149 @@ def logger(request):
 
 @pytest.fixture(autouse=True)
 def per_test_logging(logger, request):
-    """Log start/end of each test and flush handlers so log file is populated immediately."""
+    """Log start/end of each test (the queue listener flushes the log file per batch)."""
     logger.info(">>> START TEST: %s", request.node.name)
-    for h in logger.handlers:
-        try:
-            h.flush()
-        except Exception:
-            pass
     yield
     logger.info("<<< END TEST: %s", request.node.name)
-    for h in logger.handlers:
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Attribute action timings and web vitals recorded during this test to its node id."""
+    with attribute_to(item.nodeid):
+        yield
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Start buffering this test's log lines (setup, call and teardown)."""
+    LOG_CAPTURE.start(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):
+    """Stop buffering once the test's teardown has logged and drop its action timings."""
+    yield
+    LOG_CAPTURE.stop()
+    RECORDER.pop_test(item.nodeid)
+    VITALS.pop_test(item.nodeid)
+
+
+def _screenshot_target(item):
+    """Page to screenshot for a test, or None."""
+    # Prefer pytest-playwright 'page' (or the pooled page), else context->pages[0], else browser->contexts()[0].pages[0]
+    page = item.funcargs.get("page") or item.funcargs.get("pooled_page")
+    context = item.funcargs.get("context") or item.funcargs.get("pooled_context")
+    browser = item.funcargs.get("browser")
+
+    target = None
+    if page is not None:
+        target = page
+    elif context is not None:
+        pages = getattr(context, "pages", None)
+        if pages:
+            target = pages[0]
+    elif browser is not None:
         try:
-            h.flush()
+            contexts = getattr(browser, "contexts", None)
+            if callable(contexts):
+                contexts = contexts()
+            if contexts:
+                pages = getattr(contexts[0], "pages", None)
+                if pages:
+                    target = pages[0]
         except Exception:
-            pass
+            target = None
+    return target if target is not None and hasattr(target, "screenshot") else None
 
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Attach screenshot and session log to report for both pass and fail (on 'call')."""
+    """Attach a screenshot (per the screenshots policy) and the test's log lines to the report on 'call'."""
     outcome = yield
     report = outcome.get_result()
 
+    item.stash.setdefault(STEP_DURATIONS, {})[report.when] = report.duration
     if report.when != "call":
         return
 
-    screenshots_dir = Path("screenshots")
-    screenshots_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # web performance budgets: 'fail' violations fail a passing test, 'warn' ones mark it WARNING
+    vitals = VITALS.pop_test(item.nodeid)
+    over_budget = failed_budgets(vitals)
+    if over_budget and report.passed:
+        report.outcome = "failed"
+        report.longrepr = "Web performance budget exceeded:\n" + "\n".join(over_budget)
+    budget_warnings = warned_budgets(vitals)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     name = item.name
     suffix = report.outcome  # "passed" or "failed"
-    screenshot_file = screenshots_dir / f"{name}_{suffix}_{timestamp}.png"
+    screenshot_file = None
 
     logger = item.funcargs.get("logger", logging.getLogger("ebay_tests"))
 
-    # Prefer pytest-playwright 'page', else context->pages[0], else browser->contexts()[0].pages[0]
-    page = item.funcargs.get("page")
-    context = item.funcargs.get("context")
-    browser = item.funcargs.get("browser")
-
+    capture = SCREENSHOT_WRITER is not None and SCREENSHOT_WRITER.policy.should_capture(report.outcome)
     try:
-        target = None
-        if page is not None:
-            target = page
-        elif context is not None:
-            pages = getattr(context, "pages", None)
-            if pages:
-                target = pages[0]
-        elif browser is not None:
-            try:
-                contexts = getattr(browser, "contexts", None)
-                if callable(contexts):
-                    contexts = contexts()
-                if contexts:
-                    pages = getattr(contexts[0], "pages", None)
-                    if pages:
-                        target = pages[0]
-            except Exception:
-                target = None
-
-        if target and hasattr(target, "screenshot"):
-            try:
-                # sync API: page.screenshot(path=...)
-                target.screenshot(path=str(screenshot_file))
+        target = _screenshot_target(item) if capture else None
+        if target is not None:
+            # only the capture runs here; encoding and the disk write happen on the writer thread
+            screenshot_file = SCREENSHOT_WRITER.capture(target, f"{name}_{suffix}_{get_worker_id()}_{timestamp}")
+            if screenshot_file:
                 logger.info("Captured screenshot for %s: %s", report.outcome, screenshot_file)
-            except Exception as e:
-                logger.exception("Failed to capture screenshot: %s", e)
-        else:
+        elif capture:
             logger.debug("No page/context/browser available to capture screenshot for %s", report.outcome)
     except Exception as e:
         logger.exception("Error while attempting screenshot capture: %s", e)
 
-    # Ensure logs are flushed before attaching
-    try:
-        for h in logger.handlers:
-            try:
-                h.flush()
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    # Attach screenshot and session log contents to pytest-html report extras (if plugin present)
+    # keep the test's trace chunk only if it failed or ran over its duration budget
+    trace_file = None
+    context = item.funcargs.get("context") or item.funcargs.get("pooled_context")
+    if TRACE_POLICY.enabled and context is not None:
+        marker = item.get_closest_marker("duration_budget")
+        budget = marker.args[0] if marker and marker.args else None
+        keep = TRACE_POLICY.should_keep(report.failed, report.duration, budget)
+        path = TRACE_POLICY.trace_path(name, f"{get_worker_id()}_{timestamp}") if keep else None
+        trace_file = stop_test_chunk(context, path)
+
+    # Attach screenshot and this test's log lines to pytest-html report extras (if plugin present)
     try:
         from pytest_html import extras
 
         extra = getattr(report, "extra", [])
 
-        if screenshot_file.exists():
-            extra.append(extras.image(str(screenshot_file), mime_type="image/png"))
+        if trace_file:
+            extra.append(extras.url(trace_file.as_posix(), name="trace"))
+
+        if screenshot_file:
+            extra.append(extras.image(str(screenshot_file), mime_type=SCREENSHOT_WRITER.policy.mime_type))
 
-        log_path = getattr(item.config, "ebay_log_file", None)
-        if log_path and Path(log_path).exists():
-            raw = Path(log_path).read_text(encoding="utf-8")
-            max_len = 10000
-            if len(raw) > max_len:
-                raw = "...(truncated)...\n" + raw[-max_len:]
-            extra.append(extras.text(raw, name="session_log"))
+        if LOG_CAPTURE.test_name == item.nodeid:
+            extra.append(extras.text(LOG_CAPTURE.text(), name="test_log"))
 
         # record per-test result into TestReport (for the custom HTML report)
         try:
             if TEST_REPORT:
                 status = "PASS" if report.outcome == "passed" else "FAIL" if report.outcome == "failed" else report.outcome.upper()
+                if status == "PASS" and budget_warnings:
+                    status = "WARNING"
                 message = ""
                 try:
                     # prefer the longrepr text on failures
                     message = report.longreprtext if report.failed else ""
                 except Exception:
                     message = ""
-                screenshot_value = str(screenshot_file) if screenshot_file.exists() else ""
-                TEST_REPORT.add_result(test_name=item.nodeid, status=status, message=message, screenshot=screenshot_value)
+                if budget_warnings:
+                    message = "\n".join(filter(None, [message, "Web performance budget warnings:"] + budget_warnings))
+                screenshot_value = str(screenshot_file) if screenshot_file else ""
+                artifacts = {"log": getattr(item.config, "ebay_log_file", "")}
+                if screenshot_value:
+                    artifacts["screenshot"] = screenshot_value
+                if trace_file:
+                    artifacts["trace"] = trace_file.as_posix()
+                TEST_REPORT.add_result(test_name=item.nodeid, status=status, message=message,
+                                       screenshot=screenshot_value, duration=report.duration,
+                                       steps=dict(item.stash[STEP_DURATIONS]), artifacts=artifacts,
+                                       actions=RECORDER.pop_test(item.nodeid), vitals=vitals)
         except Exception:
             pass
 
@@ -224,7 +583,7 @@ def pytest_html_results_table_row(report, cells):
 
 
 def pytest_html_results_table_html(report, data):
-    """Render images and session log (and link to generated HTML session log) in the Links column."""
+    """Render images, trace links and the test log (and link to generated HTML session log) in the Links column."""
     if html is None:
         return
     try:
@@ -243,9 +602,12 @@ def pytest_html_results_table_html(report, data):
                 content = e.get("content", "")
                 if mime.startswith("image"):
                     cont.append(html.div(html.img(src=content, style="max-width:240px;margin:4px 0;")))
-                elif name == "session_log" or e.get("type") == "text":
+                elif name == "trace":
+                    cont.append(html.div(html.a("Playwright trace", href=content, target="_blank"),
+                                         " (open with: playwright show-trace)"))
+                elif name == "test_log" or e.get("type") == "text":
                     text = escape(content if isinstance(content, str) else str(content))
-                    cont.append(html.details(html.summary("session_log"), html.pre(text)))
+                    cont.append(html.details(html.summary("test_log"), html.pre(text)))
             else:
                 try:
                     cont.append(html.div(str(e)))
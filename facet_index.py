@@ -0,0 +1,129 @@
+"""
+Facet index for the search results left rail
+Parses every facet, option, count, link and selection state in one pass
+so filter lookups no longer need a DOM scan
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+
+class FacetOption(NamedTuple):
+    """One selectable value of a facet (e.g. Transmission -> Manual)"""
+
+    label: str
+    count: Optional[int]
+    href: str
+    selected: bool
+
+
+# Walks the rail once and returns [{facet, options: [{label, count, href, selected}]}]
+PARSE_FACETS_JS = """
+(sel) => {
+    const rail = document.querySelector(sel.panel);
+    if (!rail) return [];
+    const text = (el) => (el && el.textContent ? el.textContent.replace(/\\s+/g, " ").trim() : "");
+    const facets = [];
+    rail.querySelectorAll(sel.group).forEach((group) => {
+        const facet = text(group.querySelector(sel.title));
+        if (!facet) return;
+        const options = [];
+        group.querySelectorAll(sel.option).forEach((option) => {
+            const countText = text(option.querySelector(sel.count));
+            const digits = countText.replace(/,/g, "").match(/\\d+/);
+            const label = text(option.querySelector(sel.label) || option).replace(countText, "").trim();
+            if (!label) return;
+            const input = option.querySelector("input[type=checkbox], input[type=radio]");
+            const selected = !!(input && input.checked)
+                || option.getAttribute("aria-checked") === "true"
+                || option.getAttribute("aria-current") === "true";
+            options.push({ label: label, count: digits ? parseInt(digits[0], 10) : null,
+                           href: option.href || "", selected: selected });
+        });
+        if (options.length) facets.push({ facet: facet, options: options });
+    });
+    return facets;
+}
+"""
+
+
+def _key(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+class FacetIndex:
+    """facet -> option -> FacetOption lookup built from one rail parse"""
+
+    def __init__(self, url: str, facets: Dict[str, Dict[str, FacetOption]]):
+        """
+        Args:
+            url (str): Results page URL the rail was parsed from
+            facets (dict): Facet name -> option label -> FacetOption
+        """
+        self.url = url
+        self._facets = facets
+        self._lookup = {
+            _key(name): {_key(label): option for label, option in options.items()}
+            for name, options in facets.items()
+        }
+
+    @classmethod
+    def from_raw(cls, url: str, raw: List[dict]) -> "FacetIndex":
+        """
+        Build an index from PARSE_FACETS_JS output
+
+        Args:
+            url (str): Results page URL
+            raw (list): [{facet, options: [{label, count, href, selected}]}]
+
+        Returns:
+            FacetIndex: Parsed index (the first group wins if a facet name repeats)
+        """
+        facets: Dict[str, Dict[str, FacetOption]] = {}
+        for group in raw or []:
+            options = facets.setdefault(group["facet"], {})
+            for o in group.get("options", []):
+                options.setdefault(o["label"], FacetOption(o["label"], o.get("count"), o.get("href", ""),
+                                                           bool(o.get("selected"))))
+        return cls(url, facets)
+
+    def facet_names(self) -> List[str]:
+        """Get facet names in rail order"""
+        return list(self._facets)
+
+    def options(self, facet: str) -> Dict[str, FacetOption]:
+        """Get the options of a facet (case-insensitive name), or {} if absent"""
+        for name, options in self._facets.items():
+            if _key(name) == _key(facet):
+                return options
+        return {}
+
+    def get(self, facet: str, option: str) -> Optional[FacetOption]:
+        """Look up one option (case- and whitespace-insensitive)"""
+        return self._lookup.get(_key(facet), {}).get(_key(option))
+
+    def selected(self) -> Dict[str, List[str]]:
+        """Get the selected option labels per facet"""
+        return {name: [label for label, o in options.items() if o.selected]
+                for name, options in self._facets.items()
+                if any(o.selected for o in options.values())}
+
+    def count_matches(self, facet: str, option: str, total: int) -> Optional[bool]:
+        """
+        Check that an option's advertised count equals a results total
+
+        Returns:
+            Optional[bool]: None if the option or its count is unknown
+        """
+        found = self.get(facet, option)
+        if found is None or found.count is None:
+            return None
+        return found.count == total
+
+    def __contains__(self, facet: str) -> bool:
+        return _key(facet) in self._lookup
+
+    def __len__(self) -> int:
+        return len(self._facets)
+
+    def __repr__(self) -> str:
+        return f"FacetIndex({len(self)} facets, url={self.url!r})"
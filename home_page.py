@@ -4,6 +4,8 @@ Handles interactions with the eBay home page
 """
 
 from base_page import BasePage
+from selector_chain import SelectorChain
+from settings import get_settings
 from playwright.sync_api import Page
 import logging
 
@@ -14,18 +16,32 @@ class EBayHomePage(BasePage):
     """Page Object for eBay Home Page"""
 
     # Selectors
-    SEARCH_INPUT = 'input[placeholder="Search for anything"]'
+    SEARCH_INPUT = SelectorChain(
+        "search_input",
+        'input[placeholder="Search for anything"]',
+        'input#gh-ac',
+        'input[name="_nkw"]',
+        'form#gh-f input[type="text"]',
+    )
     SEARCH_BUTTON = 'button[type="submit"]'
     EBAY_LOGO = 'a[href="https://www.ebay.com/"]'
+    RESULTS_URL_PATTERN = "**/sch/**"
+
+    # Selector cache section
+    PAGE_TYPE = "home"
+    # Budget sections in config.json web_vitals.budgets
+    VITALS_PAGE_TYPE = "home"
+    RESULTS_VITALS_PAGE_TYPE = "search_results"
 
     def __init__(self, page: Page):
         super().__init__(page)
-        self.page_url = "https://www.ebay.com/"
+        self.page_url = get_settings().base_url
 
     def navigate_to_home(self) -> None:
         """Navigate to eBay home page"""
         self.navigate(self.page_url)
         logger.info("Navigated to eBay home page")
+        self.collect_web_vitals(self.VITALS_PAGE_TYPE, "navigate")
 
     def is_home_page_loaded(self) -> bool:
         """
@@ -35,7 +51,7 @@ class EBayHomePage(BasePage):
 
         try:
             # Check if search input is visible
-            search_visible = self.wait_for_element(self.SEARCH_INPUT, timeout=15000)
+            search_visible = self.wait_for_element(self.SEARCH_INPUT, timeout=self.page_ready_timeout)
 
             if search_visible:
                 logger.info("eBay home page loaded successfully")
@@ -45,14 +61,14 @@ class EBayHomePage(BasePage):
                 return False
 
         except Exception as e:
-            logger.error(f"Error validating home page: {str(e)}")
+            logger.error("Error validating home page: %s", e)
             return False
 
     def search_for_item(self, search_term: str) -> None:
         """
         Search for an item on eBay
         """
-        logger.info(f"Searching for: {search_term}")
+        logger.info("Searching for: %s", search_term)
 
         try:
             # Ensure on home page
@@ -61,18 +77,19 @@ class EBayHomePage(BasePage):
 
             # Fill search input
             self.fill(self.SEARCH_INPUT, search_term)
-            logger.info(f"Entered search term: {search_term}")
+            logger.info("Entered search term: %s", search_term)
 
             # Click search button
             self.click(self.SEARCH_BUTTON)
             logger.info("Clicked search button")
 
-            # Wait for results page to load
-            self.wait_for_load_state("")
+            # Wait for the results document itself, not every subresource
+            self.waits.for_url(self.RESULTS_URL_PATTERN, wait_until="domcontentloaded")
             logger.info("Search results page loaded")
+            self.collect_web_vitals(self.RESULTS_VITALS_PAGE_TYPE, "search")
 
         except Exception as e:
-            logger.error(f"Error during search: {str(e)}")
+            logger.error("Error during search: %s", e)
             raise
 
     def get_page_header_text(self) -> str:
@@ -81,8 +98,8 @@ class EBayHomePage(BasePage):
         """
         try:
             header_text = self.get_text("body > header")
-            logger.info(f"Header text: {header_text}")
+            logger.info("Header text: %s", header_text)
             return header_text
         except Exception as e:
-            logger.error(f"Error getting header text: {str(e)}")
+            logger.error("Error getting header text: %s", e)
             return ""
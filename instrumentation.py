@@ -0,0 +1,262 @@
+"""
+Latency instrumentation for page object primitives
+Times every decorated call and aggregates it into fixed-bucket histograms per
+(page object, action, selector), for the whole session and for the running test
+"""
+
+import bisect
+import functools
+import inspect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bucket bounds in milliseconds; the last bucket is open-ended
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+ActionKey = Tuple[str, str, str]  # (page object class, action, selector)
+
+# Test that timed calls and web vitals samples are attributed to; asyncio tasks inherit
+# the value of the code that created them, so concurrent flows keep their caller's test
+CURRENT_TEST: ContextVar[str] = ContextVar("current_test", default="")
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count, total, min, max and error count"""
+
+    __slots__ = ("count", "errors", "total_ms", "min_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, duration_ms: float, ok: bool = True) -> None:
+        """Record one call"""
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        if not ok:
+            self.errors += 1
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's calls to this one"""
+        self.count += other.count
+        self.errors += other.errors
+        self.total_ms += other.total_ms
+        self.min_ms = min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def percentile(self, pct: float) -> float:
+        """
+        Estimate a percentile from the buckets
+
+        Returns:
+            float: Upper bound of the bucket holding the percentile, capped at the observed max
+        """
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                bound = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.min_ms, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "buckets": self.buckets,
+        }
+
+
+def current_test_id() -> str:
+    """Id of the test being attributed in this context ('' outside attribute_to)"""
+    return CURRENT_TEST.get()
+
+
+@contextmanager
+def attribute_to(test_id: str) -> Iterator[str]:
+    """
+    Attribute timings and samples recorded in this context to a test
+
+    Args:
+        test_id (str): Test id, e.g. a pytest node id
+
+    Yields:
+        str: The test id
+    """
+    token = CURRENT_TEST.set(test_id)
+    try:
+        yield test_id
+    finally:
+        CURRENT_TEST.reset(token)
+
+
+class ActionRecorder:
+    """Session and per-test action histograms (one process-wide instance: RECORDER)"""
+
+    def __init__(self):
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._session: Dict[ActionKey, LatencyHistogram] = {}
+        self._tests: Dict[str, Dict[ActionKey, LatencyHistogram]] = {}
+
+    def record(self, page_class: str, action: str, selector: str, duration_ms: float, ok: bool = True) -> None:
+        """
+        Record one timed call against the session and the running test
+
+        Args:
+            page_class (str): Page object class name
+            action (str): Primitive name (click, fill, ...)
+            selector (str): Selector or URL the call targeted ('' if none)
+            duration_ms (float): Wall time of the call
+            ok (bool): False if the call raised or reported failure
+        """
+        key = (page_class, action, selector)
+        test_id = current_test_id()
+        with self._lock:
+            hist = self._session.get(key)
+            if hist is None:
+                hist = self._session[key] = LatencyHistogram()
+            hist.add(duration_ms, ok)
+            if test_id:
+                per_test = self._tests.setdefault(test_id, {})
+                hist = per_test.get(key)
+                if hist is None:
+                    hist = per_test[key] = LatencyHistogram()
+                hist.add(duration_ms, ok)
+
+    @staticmethod
+    def _rows(histograms: Dict[ActionKey, LatencyHistogram]) -> List[dict]:
+        rows = [dict(page=k[0], action=k[1], selector=k[2], **h.to_dict()) for k, h in histograms.items()]
+        return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+    def test_summary(self, test_id: str) -> List[dict]:
+        """Get a test's action rows, most total time first"""
+        with self._lock:
+            return self._rows(dict(self._tests.get(test_id, {})))
+
+    def pop_test(self, test_id: str) -> List[dict]:
+        """Get a test's action rows and drop them (the session histograms keep the calls)"""
+        with self._lock:
+            return self._rows(self._tests.pop(test_id, {}))
+
+    def session_summary(self) -> List[dict]:
+        """Get the session's action rows, most total time first"""
+        with self._lock:
+            return self._rows(dict(self._session))
+
+    def by_action(self) -> Dict[str, dict]:
+        """Get session histograms merged per action (all selectors and page objects)"""
+        merged: Dict[str, LatencyHistogram] = {}
+        with self._lock:
+            for (_, action, _), hist in self._session.items():
+                merged.setdefault(action, LatencyHistogram()).merge(hist)
+        return {action: hist.to_dict() for action, hist in merged.items()}
+
+    def export_json(self, path: str, **metadata) -> Path:
+        """
+        Write the session histograms to a JSON file
+
+        Args:
+            path (str): Output file
+            metadata: Extra top-level fields (e.g. run_id, worker)
+
+        Returns:
+            Path: Written file
+        """
+        out = Path(path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        data = {**metadata, "bucket_bounds_ms": list(BUCKET_BOUNDS_MS),
+                "by_action": self.by_action(), "actions": self.session_summary()}
+        with open(out, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        logger.info("Action timings exported: %s", out)
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._session.clear()
+            self._tests.clear()
+
+
+RECORDER = ActionRecorder()
+
+
+def timed(action: Optional[str] = None, false_is_error: bool = False):
+    """
+    Decorator timing a page object method into RECORDER
+
+    The first string argument is recorded as the selector. A call that raises
+    is counted as an error. Works on sync and async methods.
+
+    Args:
+        action (str, optional): Name to record (defaults to the method name)
+        false_is_error (bool): Also count a False return as an error (e.g. a wait that timed out)
+    """
+    def decorator(func):
+        name = action or func.__name__
+
+        def _selector(args) -> str:
+            if len(args) < 2 or not isinstance(args[1], str):
+                return ""
+            # selector chains are recorded by their logical name rather than every candidate
+            return getattr(args[1], "name", args[1])
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not RECORDER.enabled:
+                    return await func(*args, **kwargs)
+                ok = False
+                start = time.perf_counter()
+                try:
+                    result = await func(*args, **kwargs)
+                    ok = not (false_is_error and result is False)
+                    return result
+                finally:
+                    RECORDER.record(type(args[0]).__name__, name, _selector(args),
+                                    (time.perf_counter() - start) * 1000, ok)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not RECORDER.enabled:
+                return func(*args, **kwargs)
+            ok = False
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                ok = not (false_is_error and result is False)
+                return result
+            finally:
+                RECORDER.record(type(args[0]).__name__, name, _selector(args),
+                                (time.perf_counter() - start) * 1000, ok)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,283 @@
+"""
+Listing records extracted from eBay search results
+Provides the Listing record type and the columnar ListingSet container
+"""
+
+import math
+import re
+from array import array
+from collections import Counter
+from statistics import median
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+
+class Listing(NamedTuple):
+    """Typed record for a single search result card"""
+
+    item_id: str
+    title: str
+    price: Optional[float]
+    price_text: str
+    url: str
+    subtitle: str
+    shipping: str
+    location: str
+
+
+# Model years as they appear in car listing titles ("2006 Mazda MX-5 Miata")
+YEAR_PATTERN = re.compile(r"\b(19[5-9]\d|20[0-4]\d)\b")
+
+TEXT_FIELDS = ("item_id", "title", "price_text", "url", "subtitle", "shipping", "location")
+
+
+def _title_year(title: str) -> int:
+    """Return the first model year found in a title, or 0 if none"""
+    match = YEAR_PATTERN.search(title)
+    return int(match.group(1)) if match else 0
+
+
+class ListingSet:
+    """
+    Column-oriented store for extracted listings
+
+    Each field is held in its own column (text fields as lists, price and
+    year as typed arrays), so large result sets cost one slot per value
+    instead of one dict or object per listing. Records are materialised
+    as Listing tuples only when iterated or indexed.
+    """
+
+    __slots__ = TEXT_FIELDS + ("price", "year")
+
+    def __init__(self):
+        """Create an empty ListingSet"""
+        for name in TEXT_FIELDS:
+            setattr(self, name, [])
+        self.price = array("d")  # NaN marks a missing price
+        self.year = array("H")   # 0 marks a title without a year
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, list]) -> "ListingSet":
+        """
+        Build a ListingSet from column lists (as returned by page extraction)
+
+        Args:
+            columns (dict): Field name -> list of values, all the same length
+
+        Returns:
+            ListingSet: New set holding the given columns
+        """
+        listing_set = cls()
+        size = len(columns.get("item_id") or [])
+        for name in TEXT_FIELDS:
+            values = columns.get(name) or [""] * size
+            getattr(listing_set, name).extend((v or "").strip() for v in values)
+        prices = columns.get("price") or [None] * size
+        listing_set.price.extend(math.nan if p is None else float(p) for p in prices)
+        listing_set.year.extend(_title_year(t) for t in listing_set.title)
+        return listing_set
+
+    @classmethod
+    def from_listings(cls, listings: Iterable[Listing]) -> "ListingSet":
+        """
+        Build a ListingSet from Listing records
+
+        Args:
+            listings (Iterable[Listing]): Records to store
+
+        Returns:
+            ListingSet: New set holding the records
+        """
+        listing_set = cls()
+        listing_set.extend(listings)
+        return listing_set
+
+    def append(self, listing: Listing) -> None:
+        """
+        Append a single Listing record
+
+        Args:
+            listing (Listing): Record to append
+        """
+        for name in TEXT_FIELDS:
+            getattr(self, name).append(getattr(listing, name))
+        self.price.append(math.nan if listing.price is None else listing.price)
+        self.year.append(_title_year(listing.title))
+
+    def extend(self, listings: Union["ListingSet", Iterable[Listing]]) -> None:
+        """
+        Append many listings, column by column when given another ListingSet
+
+        Args:
+            listings: Another ListingSet or an iterable of Listing records
+        """
+        if isinstance(listings, ListingSet):
+            for name in self.__slots__:
+                getattr(self, name).extend(getattr(listings, name))
+            return
+        for listing in listings:
+            self.append(listing)
+
+    def __len__(self) -> int:
+        return len(self.item_id)
+
+    def _record(self, index: int) -> Listing:
+        price = self.price[index]
+        return Listing(
+            item_id=self.item_id[index],
+            title=self.title[index],
+            price=None if math.isnan(price) else price,
+            price_text=self.price_text[index],
+            url=self.url[index],
+            subtitle=self.subtitle[index],
+            shipping=self.shipping[index],
+            location=self.location[index],
+        )
+
+    def __iter__(self) -> Iterator[Listing]:
+        for index in range(len(self)):
+            yield self._record(index)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Listing, "ListingSet"]:
+        if isinstance(key, slice):
+            sliced = ListingSet()
+            for name in self.__slots__:
+                getattr(sliced, name).extend(getattr(self, name)[key])
+            return sliced
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("ListingSet index out of range")
+        return self._record(key)
+
+    def __repr__(self) -> str:
+        return f"ListingSet({len(self)} listings)"
+
+    def take(self, indices: Iterable[int]) -> "ListingSet":
+        """
+        Build a new ListingSet from the rows at the given indices
+
+        Args:
+            indices (Iterable[int]): Row positions to keep, in output order
+
+        Returns:
+            ListingSet: Selected rows
+        """
+        indices = list(indices)
+        selected = ListingSet()
+        for name in self.__slots__:
+            source = getattr(self, name)
+            getattr(selected, name).extend(source[i] for i in indices)
+        return selected
+
+    def filter(
+        self,
+        predicate: Optional[Callable[[Listing], bool]] = None,
+        keyword: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        year: Optional[int] = None,
+    ) -> "ListingSet":
+        """
+        Filter listings, checking column conditions before building any record
+
+        Args:
+            predicate (callable, optional): Extra per-record check on Listing tuples
+            keyword (str, optional): Case-insensitive substring required in the title
+            min_price (float, optional): Lowest price to keep (listings without a price are dropped)
+            max_price (float, optional): Highest price to keep (listings without a price are dropped)
+            year (int, optional): Model year parsed from the title
+
+        Returns:
+            ListingSet: Matching rows
+        """
+        keyword_lower = keyword.lower() if keyword else None
+        has_price_bound = min_price is not None or max_price is not None
+        indices = []
+        for i in range(len(self)):
+            if keyword_lower and keyword_lower not in self.title[i].lower():
+                continue
+            if has_price_bound:
+                price = self.price[i]
+                if math.isnan(price):
+                    continue
+                if min_price is not None and price < min_price:
+                    continue
+                if max_price is not None and price > max_price:
+                    continue
+            if year is not None and self.year[i] != year:
+                continue
+            if predicate is not None and not predicate(self._record(i)):
+                continue
+            indices.append(i)
+        return self.take(indices)
+
+    def dedup(self) -> "ListingSet":
+        """
+        Drop repeated item ids, keeping the first occurrence
+
+        Rows without an item id are always kept.
+
+        Returns:
+            ListingSet: Rows with unique item ids
+        """
+        seen = set()
+        indices = []
+        for i, item_id in enumerate(self.item_id):
+            if item_id:
+                if item_id in seen:
+                    continue
+                seen.add(item_id)
+            indices.append(i)
+        return self.take(indices)
+
+    def titles(self) -> List[str]:
+        """Get the non-empty titles in row order"""
+        return [t for t in self.title if t]
+
+    def count(self) -> int:
+        """Get the number of listings"""
+        return len(self)
+
+    def _known_prices(self) -> List[float]:
+        return [p for p in self.price if not math.isnan(p)]
+
+    def min_price(self) -> Optional[float]:
+        """Get the lowest known price, or None if no listing has a price"""
+        prices = self._known_prices()
+        return min(prices) if prices else None
+
+    def max_price(self) -> Optional[float]:
+        """Get the highest known price, or None if no listing has a price"""
+        prices = self._known_prices()
+        return max(prices) if prices else None
+
+    def median_price(self) -> Optional[float]:
+        """Get the median known price, or None if no listing has a price"""
+        prices = self._known_prices()
+        return median(prices) if prices else None
+
+    def price_stats(self) -> Dict[str, Optional[float]]:
+        """
+        Get count, min, median and max price in one pass over the price column
+
+        Returns:
+            dict: Keys count, priced, min, median, max
+        """
+        prices = sorted(self._known_prices())
+        return {
+            "count": len(self),
+            "priced": len(prices),
+            "min": prices[0] if prices else None,
+            "median": median(prices) if prices else None,
+            "max": prices[-1] if prices else None,
+        }
+
+    def year_histogram(self) -> Dict[int, int]:
+        """
+        Get the number of listings per model year parsed from titles
+
+        Returns:
+            dict: Year -> listing count, sorted by year (titles without a year are skipped)
+        """
+        counts = Counter(y for y in self.year if y)
+        return dict(sorted(counts.items()))
@@ -3,23 +3,229 @@ Logging and Reporting module for test execution
 Provides test logger and HTML report generation
 """
 
+import atexit
+import copy
+import heapq
+import json
 import logging
 import os
+import queue
+import threading
+from collections import deque
+from logging.handlers import QueueHandler
 from datetime import datetime
+from html import escape
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from web_vitals import summarize as summarize_vitals
+
+
+def get_worker_id() -> str:
+    """
+    Get the pytest-xdist worker id of this process
+
+    Returns:
+        str: Worker id such as 'gw0', or 'main' when not running under xdist
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class TestLogCapture(logging.Handler):
+    """Buffer the log lines of the running test so its report gets exactly those lines"""
+
+    def __init__(self, max_records: int = 2000, level: int = logging.NOTSET):
+        """
+        Initialize the capture handler
+
+        Args:
+            max_records (int): Keep at most this many lines per test (oldest dropped first)
+            level (int): Minimum level to capture
+        """
+        super().__init__(level)
+        self.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+        self._records = deque(maxlen=max_records)
+        self._dropped = 0
+        self.test_name: Optional[str] = None
+
+    def start(self, test_name: str) -> None:
+        """Start a fresh buffer for a test"""
+        with self.lock:
+            self._records.clear()
+            self._dropped = 0
+            self.test_name = test_name
+
+    def stop(self) -> str:
+        """Stop capturing and return the test's log text"""
+        text = self.text()
+        with self.lock:
+            self._records.clear()
+            self._dropped = 0
+            self.test_name = None
+        return text
+
+    def text(self) -> str:
+        """Get the lines captured so far for the current test"""
+        with self.lock:
+            records = list(self._records)
+            dropped = self._dropped
+        # records are formatted here, once, rather than as each line is logged
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        if dropped:
+            lines.insert(0, f"...({dropped} earlier lines dropped)...")
+        return "\n".join(lines)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # called with self.lock held (logging.Handler.handle)
+        if self.test_name is None:
+            return
+        try:
+            if len(self._records) == self._records.maxlen:
+                self._dropped += 1
+            # formatted later in text(), so mutable args are rendered now
+            self._records.append(freeze_record(record))
+        except Exception:
+            self.handleError(record)
+
+
+# Argument types whose value cannot change between the logging call and formatting
+IMMUTABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def freeze_record(record: logging.LogRecord) -> logging.LogRecord:
+    """
+    Make a record safe to format later, on another thread
+
+    Records whose args are all immutable are returned as-is; anything else (dicts,
+    lists, page objects) is formatted now into a copy, so later changes to the
+    arguments cannot alter the logged line.
+    """
+    args = record.args
+    if not args:
+        return record
+    values = args.values() if isinstance(args, dict) else args
+    if all(isinstance(v, IMMUTABLE_ARG_TYPES) for v in values):
+        return record
+    frozen = copy.copy(record)
+    frozen.msg = record.getMessage()
+    frozen.args = None
+    return frozen
+
+
+class LazyQueueHandler(QueueHandler):
+    """Queue records so message formatting happens on the listener thread where that is safe"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler.prepare formats every message on the calling thread; the queue
+        # never leaves this process, so records with immutable args are handed over
+        # untouched and formatted by the listener, the rest are formatted here
+        return freeze_record(record)
+
+
+class BatchingQueueListener:
+    """Drain queued records on a background thread in batches, flushing the handlers once per batch"""
+
+    _STOP = object()
+
+    def __init__(self, log_queue, *handlers, batch_size: int = 256):
+        """
+        Args:
+            log_queue: Queue fed by a LazyQueueHandler
+            handlers: Handlers that write without flushing (BufferedFileHandler, BufferedStreamHandler)
+            batch_size (int): Most records written between flushes
+        """
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the listener thread"""
+        self._thread = threading.Thread(target=self._run, name="log-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write everything queued so far, then stop the thread"""
+        if self._thread is None:
+            return
+        self.queue.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Pass a record to every handler whose level it meets"""
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            for record in batch:
+                if record is self._STOP:
+                    stop = True
+                else:
+                    self.handle(record)
+            for handler in self.handlers:
+                handler.flush()
+            if stop:
+                return
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the caller (BatchingQueueListener)"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that leaves flushing to the caller (BatchingQueueListener)"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        BufferedStreamHandler.emit(self, record)
 
 
 class TestLogger:
     """Configure and manage logging for test execution"""
 
+    # Listener of the queued mode (None when logging synchronously)
+    listener: Optional[BatchingQueueListener] = None
+
     @staticmethod
-    def setup_logger(log_file: str = "test_execution.log", log_level: str = "INFO") -> logging.Logger:
+    def setup_logger(log_file: str = "test_execution.log", log_level: str = "INFO",
+                     queued: bool = False, batch_size: int = 256) -> logging.Logger:
         """
         Setup logger for test execution
 
         Args:
             log_file (str): Path to log file
             log_level (str): Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            queued (bool): Only queue records on the calling thread; a background listener
+                formats them and writes the file and console in batches
+            batch_size (int): Most records written between flushes in queued mode
 
         Returns:
             logging.Logger: Configured logger instance
@@ -29,192 +235,191 @@ class TestLogger:
         logs_dir.mkdir(exist_ok=True)
 
         log_path = logs_dir / log_file
+        level = getattr(logging, log_level.upper())
 
         # Configure logging
         logger = logging.getLogger()
-        logger.setLevel(getattr(logging, log_level.upper()))
+        logger.setLevel(level)
 
-        # Remove existing handlers
+        # Remove existing handlers (a previous listener writes what it has queued first)
+        TestLogger.stop_listener()
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
 
-        # File handler
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(getattr(logging, log_level.upper()))
+        # File and console handlers
+        if queued:
+            file_handler = BufferedFileHandler(log_path)
+            console_handler = BufferedStreamHandler()
+        else:
+            file_handler = logging.FileHandler(log_path)
+            console_handler = logging.StreamHandler()
+        file_handler.setLevel(level)
+        console_handler.setLevel(level)
 
         # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
 
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
-
-        logger.info(f"Logging initialized - Log file: {log_path}")
+        if queued:
+            log_queue = queue.SimpleQueue()
+            listener = BatchingQueueListener(log_queue, file_handler, console_handler, batch_size=batch_size)
+            listener.start()
+            TestLogger.listener = listener
+            logger.addHandler(LazyQueueHandler(log_queue))
+        else:
+            logger.addHandler(file_handler)
+            logger.addHandler(console_handler)
+
+        logger.info("Logging initialized - Log file: %s%s", log_path, " (queued)" if queued else "")
         return logger
 
+    @staticmethod
+    def stop_listener() -> None:
+        """Write out everything queued, then stop the listener and close its handlers"""
+        listener = TestLogger.listener
+        if listener is None:
+            return
+        TestLogger.listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
 
-class TestReport:
-    """Generate HTML test execution report"""
-
-    def __init__(self, report_file: str = "test_report.html"):
-        """
-        Initialize report generator
-
-        Args:
-            report_file (str): Path to HTML report file
-        """
-        reports_dir = Path("reports")
-        reports_dir.mkdir(exist_ok=True)
-        self.report_path = reports_dir / report_file
-        self.test_results = []
-        self.start_time = datetime.now()
-
-    def add_result(self, test_name: str, status: str, message: str = "", screenshot: str = "") -> None:
-        """
-        Add test result to report
-
-        Args:
-            test_name (str): Name of the test step
-            status (str): Status (PASS, FAIL, WARNING)
-            message (str): Result message
-            screenshot (str): Path to screenshot
-        """
-        result = {
-            "name": test_name,
-            "status": status,
-            "message": message,
-            "screenshot": screenshot,
-            "timestamp": datetime.now().isoformat()
-        }
-        self.test_results.append(result)
 
-    def generate_report(self) -> None:
-        """Generate HTML report from collected results"""
-        end_time = datetime.now()
-        duration = (end_time - self.start_time).total_seconds()
+# Records still queued at interpreter exit are written before logging shuts down
+atexit.register(TestLogger.stop_listener)
 
-        total_tests = len(self.test_results)
-        passed_tests = len([r for r in self.test_results if r["status"] == "PASS"])
-        failed_tests = len([r for r in self.test_results if r["status"] == "FAIL"])
-        warning_tests = len([r for r in self.test_results if r["status"] == "WARNING"])
 
-        html_content = f"""
-<!DOCTYPE html>
+# Written once when the report is opened; rows stream in after it and the summary
+# (only known at the end) is moved to the top with CSS order
+REPORT_HEADER = """<!DOCTYPE html>
 <html>
 <head>
     <title>Test Execution Report</title>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <style>
-        body {{
+        body {
             font-family: Arial, sans-serif;
             margin: 20px;
             background-color: #f5f5f5;
-        }}
-        .header {{
+        }
+        .report {
+            display: flex;
+            flex-direction: column;
+        }
+        .header {
+            order: -2;
             background-color: #333;
             color: white;
             padding: 20px;
             border-radius: 5px;
             margin-bottom: 20px;
-        }}
-        .summary {{
+        }
+        .summary {
+            order: -1;
             display: flex;
             gap: 20px;
             margin-bottom: 20px;
             flex-wrap: wrap;
-        }}
-        .summary-box {{
+        }
+        .summary-box {
             background-color: white;
             padding: 15px;
             border-radius: 5px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             min-width: 150px;
-        }}
-        .summary-label {{
+        }
+        .summary-label {
             font-weight: bold;
             color: #666;
             font-size: 0.9em;
-        }}
-        .summary-value {{
+        }
+        .summary-value {
             font-size: 1.8em;
             font-weight: bold;
             margin-top: 5px;
-        }}
-        .pass {{ color: #28a745; }}
-        .fail {{ color: #dc3545; }}
-        .warning {{ color: #ffc107; }}
-        .results {{
+        }
+        .pass { color: #28a745; }
+        .fail { color: #dc3545; }
+        .warning { color: #ffc107; }
+        .results {
             background-color: white;
             border-radius: 5px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .result-item {{
+        }
+        .result-item {
             border-bottom: 1px solid #eee;
             padding: 15px;
             display: flex;
             align-items: flex-start;
             gap: 15px;
-        }}
-        .result-item:last-child {{
+        }
+        .result-item:last-child {
             border-bottom: none;
-        }}
-        .status-badge {{
+        }
+        .status-badge {
             padding: 5px 10px;
             border-radius: 3px;
             font-weight: bold;
             color: white;
             min-width: 60px;
             text-align: center;
-        }}
-        .status-badge.pass {{
+        }
+        .status-badge.pass {
             background-color: #28a745;
-        }}
-        .status-badge.fail {{
+        }
+        .status-badge.fail {
             background-color: #dc3545;
-        }}
-        .status-badge.warning {{
+        }
+        .status-badge.warning {
             background-color: #ffc107;
             color: black;
-        }}
-        .result-content {{
+        }
+        .result-content {
             flex-grow: 1;
-        }}
-        .result-name {{
+        }
+        .result-name {
             font-weight: bold;
             margin-bottom: 5px;
             color: #333;
-        }}
-        .result-message {{
+        }
+        .result-message {
             color: #666;
             font-size: 0.9em;
             margin-bottom: 5px;
-        }}
-        .result-timestamp {{
+            white-space: pre-wrap;
+        }
+        .result-timestamp {
+            color: #999;
+            font-size: 0.8em;
+        }
+        .result-vitals {
+            color: #666;
+            font-size: 0.8em;
+            margin-top: 3px;
+        }
+        .result-vitals.over-budget {
+            color: #dc3545;
+        }
+        .result-actions {
             color: #999;
             font-size: 0.8em;
-        }}
-        .screenshot-link {{
+            margin-top: 3px;
+        }
+        .screenshot-link {
             color: #007bff;
             text-decoration: none;
             font-size: 0.9em;
             margin-top: 5px;
             display: inline-block;
-        }}
-        .screenshot-link:hover {{
+        }
+        .screenshot-link:hover {
             text-decoration: underline;
-        }}
-        .footer {{
+        }
+        .footer {
             margin-top: 20px;
             padding: 15px;
             background-color: white;
@@ -222,70 +427,234 @@ class TestReport:
             text-align: center;
             color: #666;
             font-size: 0.9em;
-        }}
+        }
     </style>
 </head>
 <body>
+<div class="report">
     <div class="header">
         <h1>Test Execution Report</h1>
         <p>eBay Automation Framework - Mazda MX-5 Search & Filter Test</p>
     </div>
 
+    <div class="results">
+"""
+
+
+# Slowest page object actions shown under each result row
+ACTIONS_PER_ROW = 3
+
+
+class TestReport:
+    """Stream an HTML test execution report: header once, one row per result, summary at the end"""
+
+    def __init__(self, report_file: str = "test_report.html", shard_file: Optional[str] = None,
+                 run_id: Optional[str] = None):
+        """
+        Initialize report generator
+
+        Args:
+            report_file (str): Path to HTML report file; results are also written as JSON lines
+                next to it (same name, .jsonl)
+            shard_file (str, optional): Path of a JSON-lines shard to append each result to
+                (used by xdist workers, which write no HTML; the controller merges shards into one report)
+            run_id (str, optional): Id stored with every result (defaults to the start time)
+        """
+        reports_dir = Path("reports")
+        reports_dir.mkdir(exist_ok=True)
+        self.report_path = reports_dir / report_file
+        self.results_path = self.report_path.with_suffix(".jsonl")
+        self.shard_path = Path(shard_file) if shard_file else None
+        if self.shard_path:
+            self.shard_path.parent.mkdir(parents=True, exist_ok=True)
+        self.start_time = datetime.now()
+        self.run_id = run_id or self.start_time.strftime("%Y%m%d_%H%M%S_%f")
+
+        # running totals instead of a results list, so memory stays flat
+        self.total_tests = 0
+        self.status_counts = {}
+        self.workers = set()
+        self.busy_time = 0.0
+        self._html = None
+        self._jsonl = None
+        self._finished = False
+        # files are opened lazily, so pin them to the current directory now
+        self._report_file = self.report_path.resolve()
+        self._jsonl_file = (self.shard_path or self.results_path).resolve()
+
+    def add_result(self, test_name: str, status: str, message: str = "", screenshot: str = "",
+                   duration: float = 0.0, worker: Optional[str] = None,
+                   steps: Optional[Dict[str, float]] = None, artifacts: Optional[Dict[str, str]] = None,
+                   actions: Optional[List[dict]] = None, vitals: Optional[List[dict]] = None) -> None:
+        """
+        Add test result to report
+
+        Args:
+            test_name (str): Name of the test step
+            status (str): Status (PASS, FAIL, WARNING)
+            message (str): Result message
+            screenshot (str): Path to screenshot
+            duration (float): Test duration in seconds
+            worker (str, optional): xdist worker that ran the test (defaults to this process)
+            steps (dict, optional): Step name -> duration in seconds (e.g. setup, call)
+            artifacts (dict, optional): Artifact kind -> path (e.g. log, trace)
+            actions (list, optional): Page object action timings (instrumentation rows, slowest first)
+            vitals (list, optional): Web performance samples with their budget violations
+        """
+        result = {
+            "run_id": self.run_id,
+            "name": test_name,
+            "status": status,
+            "message": message,
+            "screenshot": screenshot,
+            "duration": duration,
+            "worker": worker or get_worker_id(),
+            "timestamp": datetime.now().isoformat(),
+            "steps": steps or {},
+            "artifacts": artifacts or {},
+            "actions": actions or [],
+            "vitals": vitals or [],
+        }
+        self._append(result)
+
+    def _append(self, result: dict) -> None:
+        """Count a result, write its JSON line (shard or results file) and, unless sharding, its report row"""
+        result.setdefault("run_id", self.run_id)
+        self.total_tests += 1
+        self.status_counts[result["status"]] = self.status_counts.get(result["status"], 0) + 1
+        self.workers.add(result.get("worker", "main"))
+        self.busy_time += result.get("duration", 0.0) or 0.0
+
+        if self._jsonl is None:
+            self._jsonl = open(self._jsonl_file, 'a', encoding='utf-8')
+        self._jsonl.write(json.dumps(result) + "\n")
+        self._jsonl.flush()
+        if not self.shard_path:
+            self._write(self._row_html(result))
+
+    def _write(self, text: str) -> None:
+        """Append to the HTML file, writing the header first; flushed so a crashed run keeps its rows"""
+        if self._finished:
+            raise RuntimeError(f"Report {self.report_path} is already finished")
+        if self._html is None:
+            self._html = open(self._report_file, 'w', encoding='utf-8')
+            self._html.write(REPORT_HEADER)
+        self._html.write(text)
+        self._html.flush()
+
+    @staticmethod
+    def _row_html(result: dict) -> str:
+        """Render one result row"""
+        status = escape(result["status"])
+        screenshot = ""
+        if result.get("screenshot"):
+            screenshot = f'                <a href="{escape(result["screenshot"])}" class="screenshot-link">View Screenshot</a>\n'
+        trace = (result.get("artifacts") or {}).get("trace")
+        if trace:
+            screenshot += f'                <a href="{escape(trace)}" class="screenshot-link">View Trace</a>\n'
+        actions = ""
+        if result.get("actions"):
+            slowest = " &middot; ".join(
+                f"{escape(a['action'])}({escape(a['selector'])}) {a['count']}&times; {a['total_ms']:.0f}ms"
+                for a in result["actions"][:ACTIONS_PER_ROW])
+            actions = f'                <div class="result-actions">{slowest}</div>\n'
+        vitals = "".join(
+            f'                <div class="result-vitals{" over-budget" if sample["violations"] else ""}">'
+            f'{escape(summarize_vitals(sample))}</div>\n'
+            for sample in result.get("vitals") or [])
+        return f"""        <div class="result-item">
+            <div class="status-badge {status.lower()}">{status}</div>
+            <div class="result-content">
+                <div class="result-name">{escape(result['name'])}</div>
+                <div class="result-message">{escape(result.get('message') or '')}</div>
+                <div class="result-timestamp">{escape(result['timestamp'])} &middot; {escape(result.get('worker', 'main'))} &middot; {result.get('duration', 0.0):.2f}s</div>
+{vitals}{actions}{screenshot}            </div>
+        </div>
+"""
+
+    @classmethod
+    def merge_shards(cls, shard_files: Iterable[Path], report_file: str,
+                     start_time: Optional[datetime] = None, run_id: Optional[str] = None) -> "TestReport":
+        """
+        Combine worker shards into a single report
+
+        Args:
+            shard_files (Iterable[Path]): JSON-lines shards written by workers
+            report_file (str): Path to the merged HTML report file
+            start_time (datetime, optional): Run start time used for the total duration
+            run_id (str, optional): Id of the run the shards belong to
+
+        Returns:
+            TestReport: Report holding every worker's results, ordered by timestamp
+        """
+        report = cls(report_file=report_file, run_id=run_id)
+        if start_time:
+            report.start_time = start_time
+        files = [open(shard, 'r', encoding='utf-8') for shard in shard_files]
+        try:
+            # each shard is already in timestamp order, so a streaming k-way merge is enough
+            streams = [(json.loads(line) for line in f if line.strip()) for f in files]
+            for result in heapq.merge(*streams, key=lambda r: r.get("timestamp", "")):
+                report._append(result)
+        finally:
+            for f in files:
+                f.close()
+        return report
+
+    def generate_report(self) -> None:
+        """Finish the report: write the summary and footer and close the files (shards are just closed)"""
+        if self._jsonl is not None:
+            self._jsonl.close()
+            self._jsonl = None
+        if self.shard_path or self._finished:
+            return
+
+        end_time = datetime.now()
+        duration = (end_time - self.start_time).total_seconds()
+
+        self._write(f"""    </div>
+
     <div class="summary">
         <div class="summary-box">
             <div class="summary-label">Total Tests</div>
-            <div class="summary-value">{total_tests}</div>
+            <div class="summary-value">{self.total_tests}</div>
         </div>
         <div class="summary-box">
             <div class="summary-label">Passed</div>
-            <div class="summary-value pass">{passed_tests}</div>
+            <div class="summary-value pass">{self.status_counts.get("PASS", 0)}</div>
         </div>
         <div class="summary-box">
             <div class="summary-label">Failed</div>
-            <div class="summary-value fail">{failed_tests}</div>
+            <div class="summary-value fail">{self.status_counts.get("FAIL", 0)}</div>
         </div>
         <div class="summary-box">
             <div class="summary-label">Warnings</div>
-            <div class="summary-value warning">{warning_tests}</div>
+            <div class="summary-value warning">{self.status_counts.get("WARNING", 0)}</div>
         </div>
         <div class="summary-box">
             <div class="summary-label">Duration</div>
             <div class="summary-value">{duration:.2f}s</div>
         </div>
-    </div>
-
-    <div class="results">
-"""
-
-        for result in self.test_results:
-            status_lower = result["status"].lower()
-            html_content += f"""
-        <div class="result-item">
-            <div class="status-badge {status_lower}">{result['status']}</div>
-            <div class="result-content">
-                <div class="result-name">{result['name']}</div>
-                <div class="result-message">{result['message']}</div>
-                <div class="result-timestamp">{result['timestamp']}</div>
-"""
-            if result["screenshot"]:
-                html_content += f'                <a href="{result["screenshot"]}" class="screenshot-link">View Screenshot</a>\n'
-
-            html_content += """            </div>
+        <div class="summary-box">
+            <div class="summary-label">Workers</div>
+            <div class="summary-value">{len(self.workers)}</div>
+        </div>
+        <div class="summary-box">
+            <div class="summary-label">Test Time</div>
+            <div class="summary-value">{self.busy_time:.2f}s</div>
         </div>
-"""
-
-        html_content += f"""
     </div>
 
     <div class="footer">
         <p>Report generated on {end_time.strftime('%Y-%m-%d %H:%M:%S')}</p>
         <p>Total Duration: {duration:.2f} seconds</p>
     </div>
+</div>
 </body>
 </html>
-""".format(end_time=end_time, duration=duration)
-
-        with open(self.report_path, 'w') as f:
-            f.write(html_content)
+""")
+        self._html.close()
+        self._html = None
+        self._finished = True
 
-        logging.info(f"Report generated: {self.report_path}")
+        logging.info("Report generated: %s", self.report_path)
@@ -0,0 +1,282 @@
+"""
+Request routing for browser contexts
+Blocks or stubs traffic the page objects never read (images, fonts, ads, trackers)
+"""
+
+import weakref
+from collections import Counter
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+import logging
+
+from playwright.sync_api import BrowserContext, Request, Route
+
+logger = logging.getLogger(__name__)
+
+# Rough transfer sizes used to estimate bytes saved; a blocked request is
+# never sent, so its real size is unknown
+DEFAULT_ESTIMATED_BYTES = {
+    "image": 40000,
+    "media": 250000,
+    "font": 30000,
+    "script": 25000,
+    "stylesheet": 10000,
+    "document": 20000,
+    "xhr": 2000,
+    "fetch": 2000,
+    "other": 2000,
+}
+
+# Empty bodies served instead of aborting, so pages that expect these
+# resources keep working
+STUB_CONTENT_TYPES = {
+    "script": "application/javascript",
+    "stylesheet": "text/css",
+    "xhr": "application/json",
+    "fetch": "application/json",
+}
+
+# One router per context, so page objects sharing a page never route twice
+_ROUTERS = weakref.WeakKeyDictionary()
+
+
+class RequestRouter:
+    """Decide per request whether to allow, block or stub it, and count the savings"""
+
+    def __init__(
+        self,
+        block_resource_types: Iterable[str] = (),
+        block_url_patterns: Iterable[str] = (),
+        block_third_party: bool = False,
+        first_party_domains: Iterable[str] = (),
+        stub_resource_types: Iterable[str] = (),
+        estimated_bytes: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the router
+
+        Args:
+            block_resource_types: Playwright resource types to block (image, font, media, ...)
+            block_url_patterns: fnmatch-style patterns matched against the full URL
+            block_third_party (bool): Block hosts outside first_party_domains
+            first_party_domains: Domains (and their subdomains) treated as first party
+            stub_resource_types: Blocked types answered with an empty 200 instead of aborted
+            estimated_bytes (dict, optional): Per resource type size estimates for savings
+        """
+        self.block_resource_types = set(block_resource_types)
+        self.block_url_patterns = list(block_url_patterns)
+        self.block_third_party = block_third_party
+        self.first_party_domains = [d.lower().lstrip(".") for d in first_party_domains]
+        self.stub_resource_types = set(stub_resource_types)
+        self.estimated_bytes = dict(DEFAULT_ESTIMATED_BYTES, **(estimated_bytes or {}))
+
+        self.requests_seen = 0
+        self.requests_blocked = 0
+        self.requests_stubbed = 0
+        self.bytes_saved = 0
+        self.blocked_by_reason = Counter()
+
+    @classmethod
+    def from_config(cls, settings: dict) -> "RequestRouter":
+        """
+        Build a router from the 'network' section of config.json
+
+        Args:
+            settings (dict): Network routing settings
+
+        Returns:
+            RequestRouter: Configured router
+        """
+        return cls(
+            block_resource_types=settings.get("block_resource_types", []),
+            block_url_patterns=settings.get("block_url_patterns", []),
+            block_third_party=settings.get("block_third_party", False),
+            first_party_domains=settings.get("first_party_domains", []),
+            stub_resource_types=settings.get("stub_resource_types", []),
+            estimated_bytes=settings.get("estimated_bytes"),
+        )
+
+    def is_first_party(self, url: str) -> bool:
+        """
+        Check whether a URL belongs to a first-party domain
+
+        Args:
+            url (str): Request URL
+
+        Returns:
+            bool: True for first-party hosts and non-network schemes (data:, blob:)
+        """
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            return True
+        host = (parsed.hostname or "").lower()
+        return any(host == d or host.endswith("." + d) for d in self.first_party_domains)
+
+    def block_reason(self, url: str, resource_type: str, is_main_navigation: bool = False) -> Optional[str]:
+        """
+        Get the reason a request should be blocked
+
+        Args:
+            url (str): Request URL
+            resource_type (str): Playwright resource type
+            is_main_navigation (bool): True for top-level document navigations (never blocked)
+
+        Returns:
+            Optional[str]: 'resource_type', 'url_pattern' or 'third_party', or None to allow
+        """
+        if is_main_navigation:
+            return None
+        if resource_type in self.block_resource_types:
+            return "resource_type"
+        if any(fnmatchcase(url, pattern) for pattern in self.block_url_patterns):
+            return "url_pattern"
+        if self.block_third_party and not self.is_first_party(url):
+            return "third_party"
+        return None
+
+    def _decide(self, request: Request) -> Optional[str]:
+        """Classify a request and update the counters; returns the block reason or None"""
+        self.requests_seen += 1
+        resource_type = request.resource_type
+        try:
+            is_main_navigation = request.is_navigation_request() and request.frame.parent_frame is None
+        except Exception:
+            is_main_navigation = False
+
+        reason = self.block_reason(request.url, resource_type, is_main_navigation)
+        if reason is not None:
+            self.requests_blocked += 1
+            self.blocked_by_reason[reason] += 1
+            self.bytes_saved += self.estimated_bytes.get(resource_type, self.estimated_bytes["other"])
+            if resource_type in self.stub_resource_types:
+                self.requests_stubbed += 1
+        return reason
+
+    def _stub_content_type(self, request: Request) -> Optional[str]:
+        """Content type for a stubbed response, or None if the request should be aborted"""
+        if request.resource_type in self.stub_resource_types:
+            return STUB_CONTENT_TYPES.get(request.resource_type, "text/plain")
+        return None
+
+    def handle(self, route: Route, request: Request) -> None:
+        """Route handler: block, stub or fall through to the next handler"""
+        if self._decide(request) is None:
+            route.fallback()
+            return
+        content_type = self._stub_content_type(request)
+        if content_type:
+            route.fulfill(status=200, body="", content_type=content_type)
+        else:
+            route.abort("blockedbyclient")
+
+    async def handle_async(self, route, request) -> None:
+        """Route handler for playwright.async_api contexts"""
+        if self._decide(request) is None:
+            await route.fallback()
+            return
+        content_type = self._stub_content_type(request)
+        if content_type:
+            await route.fulfill(status=200, body="", content_type=content_type)
+        else:
+            await route.abort("blockedbyclient")
+
+    def _log_installed(self) -> None:
+        logger.info("Request router installed (types=%s, patterns=%s, third_party=%s)",
+                    sorted(self.block_resource_types), len(self.block_url_patterns), self.block_third_party)
+
+    def install(self, context: BrowserContext) -> None:
+        """
+        Route every request of a context (and all its pages) through this router
+
+        Args:
+            context (BrowserContext): Context to route
+        """
+        context.route("**/*", self.handle)
+        self._log_installed()
+
+    def reinstall(self, context: BrowserContext) -> None:
+        """
+        Register the handler again so it runs before routes added after install
+
+        Playwright runs the most recently registered route first; a HAR route
+        added to a pooled context at acquire time would otherwise see blocked
+        requests before the router does.
+
+        Args:
+            context (BrowserContext): Context the router is installed on
+        """
+        context.unroute("**/*", self.handle)
+        context.route("**/*", self.handle)
+
+    async def install_async(self, context) -> None:
+        """
+        Route every request of an async_api context through this router
+
+        Args:
+            context: playwright.async_api BrowserContext to route
+        """
+        await context.route("**/*", self.handle_async)
+        self._log_installed()
+
+    def summary(self) -> dict:
+        """
+        Get request and byte savings so far
+
+        Returns:
+            dict: Counts of seen/blocked/stubbed requests, estimated bytes saved and reasons
+        """
+        return {
+            "requests_seen": self.requests_seen,
+            "requests_blocked": self.requests_blocked,
+            "requests_stubbed": self.requests_stubbed,
+            "bytes_saved_estimate": self.bytes_saved,
+            "blocked_by_reason": dict(self.blocked_by_reason),
+        }
+
+
+def install_request_router(context: BrowserContext, settings: dict) -> Optional[RequestRouter]:
+    """
+    Install a router on a context once, using the 'network' config section
+
+    Args:
+        context (BrowserContext): Context to route
+        settings (dict): Network routing settings ('enabled' false disables routing)
+
+    Returns:
+        Optional[RequestRouter]: The context's router, or None if routing is disabled
+    """
+    if context in _ROUTERS:
+        return _ROUTERS[context]
+    if not settings.get("enabled", False):
+        return None
+    router = RequestRouter.from_config(settings)
+    router.install(context)
+    _ROUTERS[context] = router
+    return router
+
+
+async def install_request_router_async(context, settings: dict) -> Optional[RequestRouter]:
+    """
+    Async counterpart of install_request_router for playwright.async_api contexts
+
+    Args:
+        context: playwright.async_api BrowserContext to route
+        settings (dict): Network routing settings ('enabled' false disables routing)
+
+    Returns:
+        Optional[RequestRouter]: The context's router, or None if routing is disabled
+    """
+    if context in _ROUTERS:
+        return _ROUTERS[context]
+    if not settings.get("enabled", False):
+        return None
+    router = RequestRouter.from_config(settings)
+    await router.install_async(context)
+    _ROUTERS[context] = router
+    return router
+
+
+def get_request_router(context: BrowserContext) -> Optional[RequestRouter]:
+    """Get the router installed on a context, if any"""
+    return _ROUTERS.get(context)
@@ -0,0 +1,72 @@
+"""
+Offline record/replay support for browser contexts
+Records eBay traffic into HAR bundles and serves it back through context routing
+"""
+
+import re
+from pathlib import Path
+from typing import Optional
+import logging
+
+from playwright.sync_api import BrowserContext
+
+logger = logging.getLogger(__name__)
+
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+MODES = (MODE_OFF, MODE_RECORD, MODE_REPLAY)
+
+
+def har_path_for(har_dir: str, test_name: str) -> Path:
+    """
+    Get the HAR bundle path for a test
+
+    Args:
+        har_dir (str): Directory holding HAR bundles
+        test_name (str): pytest node name (e.g. 'test_search_and_filter[chromium]')
+
+    Returns:
+        Path: Zip bundle path ('<har_dir>/<safe test name>.har.zip')
+    """
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", test_name).strip("_")
+    return Path(har_dir) / f"{safe_name}.har.zip"
+
+
+def apply_replay(context: BrowserContext, mode: str, har_path: Path, url_filter: Optional[str] = None) -> None:
+    """
+    Attach HAR recording or replay routing to a browser context
+
+    Record mode captures every matching response into the bundle, which
+    Playwright writes when the context closes. Replay mode serves matching
+    responses from the bundle and aborts matching requests it does not
+    contain; URLs outside url_filter were never recorded, so they are left
+    to the other routes (e.g. the request router) in both modes.
+
+    Args:
+        context (BrowserContext): Context to route (applies to all its pages)
+        mode (str): 'off', 'record' or 'replay'
+        har_path (Path): HAR bundle to write or read
+        url_filter (str, optional): Glob limiting which URLs are recorded and replayed
+
+    Raises:
+        ValueError: If mode is unknown
+        FileNotFoundError: If replaying and the bundle does not exist
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown replay mode '{mode}', expected one of {MODES}")
+
+    if mode == MODE_OFF:
+        return
+
+    if mode == MODE_RECORD:
+        har_path.parent.mkdir(parents=True, exist_ok=True)
+        logger.info("Recording traffic to HAR bundle: %s", har_path)
+        context.route_from_har(har_path, url=url_filter, update=True, update_mode="minimal")
+        return
+
+    if not har_path.exists():
+        raise FileNotFoundError(f"No HAR bundle to replay at {har_path}; run once with --ebay-replay=record")
+
+    logger.info("Replaying traffic from HAR bundle: %s", har_path)
+    context.route_from_har(har_path, url=url_filter, not_found="abort")
@@ -0,0 +1,291 @@
+"""
+Run history store for test results
+Ingests TestReport JSON-lines results into a local SQLite database so durations,
+slowdowns and flaky tests can be queried across many runs
+
+Usage:
+    python run_history.py ingest reports/test_20260131_231136.jsonl
+    python run_history.py durations --runs 50
+    python run_history.py slow --recent 5 --baseline 20
+    python run_history.py flaky --runs 20
+"""
+
+import argparse
+import json
+import math
+import sqlite3
+from pathlib import Path
+from statistics import median
+from typing import Iterable, List, NamedTuple, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATABASE = "reports/run_history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    source TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    test_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration REAL NOT NULL,
+    worker TEXT,
+    finished_at TEXT NOT NULL,
+    message TEXT,
+    steps TEXT,
+    artifacts TEXT,
+    PRIMARY KEY (run_id, test_id)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_results_test_time ON results(test_id, finished_at);
+"""
+
+
+class DurationStats(NamedTuple):
+    """Duration percentiles of one test over a window of runs"""
+
+    test_id: str
+    runs: int
+    p50: float
+    p95: float
+    max: float
+
+
+class Slowdown(NamedTuple):
+    """A test whose recent median duration grew past a threshold"""
+
+    test_id: str
+    baseline: float
+    recent: float
+    ratio: float
+
+
+class Flakiness(NamedTuple):
+    """A test that both passed and failed in a window of runs"""
+
+    test_id: str
+    runs: int
+    failures: int
+    flips: int
+
+    @property
+    def flip_rate(self) -> float:
+        """Share of consecutive run pairs where the outcome changed"""
+        return self.flips / (self.runs - 1) if self.runs > 1 else 0.0
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile
+
+    Args:
+        values (list): Sorted values
+        pct (float): Percentile 0-100
+
+    Returns:
+        float: Value at the percentile (0.0 for no values)
+    """
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+class RunHistory:
+    """SQLite store of per-test results, one row per test per run"""
+
+    def __init__(self, database: str = DEFAULT_DATABASE):
+        """
+        Open (and create if needed) the history database
+
+        Args:
+            database (str): SQLite file path
+        """
+        self.path = Path(database)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript(SCHEMA)
+
+    def ingest(self, records: Iterable[dict], run_id: Optional[str] = None, source: str = "") -> int:
+        """
+        Store one run's results (re-ingesting a run replaces its rows)
+
+        Args:
+            records (Iterable[dict]): TestReport result records
+            run_id (str, optional): Run id for records that carry none
+            source (str): Where the records came from (e.g. the JSONL path)
+
+        Returns:
+            int: Number of results stored
+        """
+        rows = []
+        runs = {}
+        for r in records:
+            rid = r.get("run_id") or run_id
+            if not rid:
+                raise ValueError(f"Result for {r.get('name')} has no run_id and none was given")
+            finished_at = r.get("timestamp", "")
+            runs[rid] = min(runs.get(rid, finished_at), finished_at)
+            rows.append((rid, r["name"], r["status"], float(r.get("duration") or 0.0), r.get("worker"), finished_at,
+                         r.get("message", ""), json.dumps(r.get("steps") or {}), json.dumps(r.get("artifacts") or {})))
+
+        with self.connection:
+            for rid, started_at in runs.items():
+                self.connection.execute(
+                    "INSERT INTO runs (run_id, started_at, source) VALUES (?, ?, ?) "
+                    "ON CONFLICT(run_id) DO UPDATE SET started_at = MIN(started_at, excluded.started_at)",
+                    (rid, started_at, source))
+            self.connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        logger.info("Ingested %s results from %s run(s) into %s", len(rows), len(runs), self.path)
+        return len(rows)
+
+    def ingest_jsonl(self, results_file: str, run_id: Optional[str] = None) -> int:
+        """
+        Store the results of a TestReport JSON-lines file
+
+        Args:
+            results_file (str): Path to the .jsonl results (written next to the HTML report)
+            run_id (str, optional): Run id for records that carry none
+
+        Returns:
+            int: Number of results stored
+        """
+        with open(results_file, 'r', encoding='utf-8') as f:
+            return self.ingest((json.loads(line) for line in f if line.strip()), run_id=run_id,
+                               source=str(results_file))
+
+    def _recent_run_ids(self, runs: Optional[int]) -> List[str]:
+        """Run ids newest first, limited to the last `runs` runs"""
+        sql = "SELECT run_id FROM runs ORDER BY started_at DESC"
+        params = ()
+        if runs:
+            sql += " LIMIT ?"
+            params = (runs,)
+        return [row[0] for row in self.connection.execute(sql, params)]
+
+    def _history(self, runs: Optional[int], test_id: Optional[str] = None):
+        """(test_id, status, duration) rows of the window, oldest first per test"""
+        run_ids = self._recent_run_ids(runs)
+        if not run_ids:
+            return []
+        placeholders = ",".join("?" * len(run_ids))
+        sql = (f"SELECT test_id, status, duration FROM results WHERE run_id IN ({placeholders})"
+               + (" AND test_id = ?" if test_id else "") + " ORDER BY test_id, finished_at")
+        return self.connection.execute(sql, (*run_ids, *((test_id,) if test_id else ()))).fetchall()
+
+    def _grouped(self, runs: Optional[int], test_id: Optional[str] = None):
+        grouped = {}
+        for tid, status, duration in self._history(runs, test_id):
+            grouped.setdefault(tid, []).append((status, duration))
+        return grouped
+
+    def duration_stats(self, runs: Optional[int] = None, test_id: Optional[str] = None) -> List[DurationStats]:
+        """
+        Get p50/p95/max durations per test
+
+        Args:
+            runs (int, optional): Only the last N runs (default: all)
+            test_id (str, optional): Only this test
+
+        Returns:
+            List[DurationStats]: Slowest p95 first
+        """
+        stats = []
+        for tid, history in self._grouped(runs, test_id).items():
+            durations = sorted(d for _, d in history)
+            stats.append(DurationStats(tid, len(durations), percentile(durations, 50), percentile(durations, 95),
+                                       durations[-1]))
+        return sorted(stats, key=lambda s: s.p95, reverse=True)
+
+    def slowdowns(self, recent: int = 5, baseline: int = 20, threshold: float = 1.25,
+                  min_seconds: float = 0.5) -> List[Slowdown]:
+        """
+        Find tests whose median duration over the last runs grew against the runs before
+
+        Args:
+            recent (int): Runs in the recent window
+            baseline (int): Runs before those used as the baseline
+            threshold (float): Report when recent / baseline median >= threshold
+            min_seconds (float): Ignore tests whose recent median is below this
+
+        Returns:
+            List[Slowdown]: Largest ratio first
+        """
+        found = []
+        for tid, history in self._grouped(recent + baseline).items():
+            if len(history) <= recent:
+                continue
+            before = [d for _, d in history[:-recent]]
+            after = [d for _, d in history[-recent:]]
+            base, now = median(before), median(after)
+            if base > 0 and now >= min_seconds and now / base >= threshold:
+                found.append(Slowdown(tid, base, now, now / base))
+        return sorted(found, key=lambda s: s.ratio, reverse=True)
+
+    def flaky_tests(self, runs: int = 20) -> List[Flakiness]:
+        """
+        Find tests that both passed and failed in the last runs
+
+        Args:
+            runs (int): Runs in the window
+
+        Returns:
+            List[Flakiness]: Most outcome flips first
+        """
+        found = []
+        for tid, history in self._grouped(runs).items():
+            outcomes = [status == "PASS" for status, _ in history]
+            failures = outcomes.count(False)
+            if 0 < failures < len(outcomes):
+                flips = sum(1 for a, b in zip(outcomes, outcomes[1:]) if a != b)
+                found.append(Flakiness(tid, len(outcomes), failures, flips))
+        return sorted(found, key=lambda f: (f.flips, f.failures), reverse=True)
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; returns a process exit code"""
+    parser = argparse.ArgumentParser(description="Query the test run history database")
+    parser.add_argument("--database", default=DEFAULT_DATABASE, help=f"SQLite file (default: {DEFAULT_DATABASE})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("ingest", help="Store TestReport .jsonl results")
+    ingest.add_argument("files", nargs="+")
+    durations = commands.add_parser("durations", help="p50/p95 durations per test")
+    durations.add_argument("--runs", type=int, help="Only the last N runs")
+    durations.add_argument("--test", help="Only this test id")
+    slow = commands.add_parser("slow", help="Tests that got slower")
+    slow.add_argument("--recent", type=int, default=5)
+    slow.add_argument("--baseline", type=int, default=20)
+    slow.add_argument("--threshold", type=float, default=1.25)
+    flaky = commands.add_parser("flaky", help="Tests that both passed and failed")
+    flaky.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    history = RunHistory(args.database)
+    try:
+        if args.command == "ingest":
+            for path in args.files:
+                print(f"{path}: {history.ingest_jsonl(path)} results")
+        elif args.command == "durations":
+            for s in history.duration_stats(args.runs, args.test):
+                print(f"{s.p50:8.2f}s p50 {s.p95:8.2f}s p95 {s.max:8.2f}s max  {s.runs:5d} runs  {s.test_id}")
+        elif args.command == "slow":
+            for s in history.slowdowns(args.recent, args.baseline, args.threshold):
+                print(f"{s.ratio:5.2f}x  {s.baseline:.2f}s -> {s.recent:.2f}s  {s.test_id}")
+        elif args.command == "flaky":
+            for f in history.flaky_tests(args.runs):
+                print(f"{f.failures}/{f.runs} failed, {f.flip_rate:.0%} flips  {f.test_id}")
+    finally:
+        history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,210 @@
+"""
+Screenshot capture pipeline for test reports
+Decides which tests get a screenshot, captures it compressed, and writes it to disk
+on a background worker so test teardown does not wait for encoding or I/O
+"""
+
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from io import BytesIO
+from pathlib import Path
+from typing import Optional
+import logging
+
+# Pillow is optional: only needed to re-encode screenshots as WebP
+try:
+    from PIL import Image
+except Exception:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "failure", "always", "sampled")
+CLIPS = ("viewport", "full_page", "element")
+FORMATS = ("png", "jpeg", "webp")
+MIME_TYPES = {"png": "image/png", "jpeg": "image/jpeg", "webp": "image/webp"}
+EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+# Marks files written by ScreenshotWriter; retention never touches anything else in the directory
+FILE_PREFIX = "capture_"
+
+
+class ScreenshotPolicy:
+    """Which tests are captured and how (clip, format, quality, retention)"""
+
+    def __init__(self, mode: str = "failure", sample_rate: float = 0.1, clip: str = "viewport",
+                 element_selector: Optional[str] = None, image_format: str = "jpeg", quality: int = 70,
+                 max_files: int = 200, directory: str = "screenshots"):
+        """
+        Initialize the policy
+
+        Args:
+            mode (str): 'off', 'failure' (failed tests only), 'always' or 'sampled'
+            sample_rate (float): Share of passing tests captured in 'sampled' mode (failures always are)
+            clip (str): 'viewport', 'full_page' or 'element'
+            element_selector (str, optional): Element to capture when clip is 'element'
+            image_format (str): 'png', 'jpeg' or 'webp' (WebP needs Pillow, else JPEG is used)
+            quality (int): JPEG/WebP quality 0-100
+            max_files (int): Keep at most this many captured screenshots in the directory (0 = unbounded)
+            directory (str): Output directory
+
+        Raises:
+            ValueError: If mode, clip or format is unknown
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown screenshot mode '{mode}', expected one of {MODES}")
+        if clip not in CLIPS:
+            raise ValueError(f"Unknown screenshot clip '{clip}', expected one of {CLIPS}")
+        if image_format not in FORMATS:
+            raise ValueError(f"Unknown screenshot format '{image_format}', expected one of {FORMATS}")
+        if image_format == "webp" and Image is None:
+            logger.warning("Pillow is not installed; writing JPEG screenshots instead of WebP")
+            image_format = "jpeg"
+
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.clip = clip
+        self.element_selector = element_selector
+        self.image_format = image_format
+        self.quality = quality
+        self.max_files = max_files
+        self.directory = Path(directory)
+
+    @classmethod
+    def from_config(cls, settings: dict) -> "ScreenshotPolicy":
+        """Build a policy from the 'screenshots' section of config.json"""
+        return cls(
+            mode=settings.get("mode", "failure"),
+            sample_rate=settings.get("sample_rate", 0.1),
+            clip=settings.get("clip", "viewport"),
+            element_selector=settings.get("element_selector"),
+            image_format=settings.get("format", "jpeg"),
+            quality=settings.get("quality", 70),
+            max_files=settings.get("max_files", 200),
+            directory=settings.get("directory", "screenshots"),
+        )
+
+    def should_capture(self, outcome: str) -> bool:
+        """
+        Decide whether to capture a test with the given outcome
+
+        Args:
+            outcome (str): pytest outcome ('passed', 'failed', 'skipped')
+        """
+        if self.mode == "off":
+            return False
+        if outcome == "failed" or self.mode == "always":
+            return True
+        if self.mode == "sampled":
+            return random.random() < self.sample_rate
+        return False
+
+    @property
+    def extension(self) -> str:
+        return EXTENSIONS[self.image_format]
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES[self.image_format]
+
+
+class ScreenshotWriter:
+    """Capture on the calling (browser) thread, encode and write on a background worker"""
+
+    def __init__(self, policy: ScreenshotPolicy):
+        """
+        Args:
+            policy (ScreenshotPolicy): Capture settings
+        """
+        self.policy = policy
+        self.policy.directory.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-writer")
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        # oldest first, so retention can drop files without rescanning the directory;
+        # only earlier captures are tracked, other files in the directory are left alone
+        existing = sorted(self.policy.directory.glob(f"{FILE_PREFIX}*.*"), key=lambda p: p.stat().st_mtime)
+        self._files = deque(existing)
+
+    def path_for(self, stem: str) -> Path:
+        """Get the output path for a screenshot file stem"""
+        return self.policy.directory / f"{FILE_PREFIX}{stem}.{self.policy.extension}"
+
+    def capture(self, page, stem: str) -> Optional[Path]:
+        """
+        Take a screenshot and queue it for writing
+
+        Only the browser round trip happens here; the returned path is
+        written by the background worker.
+
+        Args:
+            page: Playwright sync Page
+            stem (str): File name without extension
+
+        Returns:
+            Optional[Path]: Path the screenshot will be written to, or None if capture failed
+        """
+        policy = self.policy
+        # WebP is re-encoded from a lossless PNG by the worker
+        capture_type = "jpeg" if policy.image_format == "jpeg" else "png"
+        options = {"type": capture_type}
+        if capture_type == "jpeg":
+            options["quality"] = policy.quality
+
+        try:
+            if policy.clip == "element" and policy.element_selector:
+                element = page.locator(policy.element_selector).first
+                if element.count() > 0:
+                    data = element.screenshot(**options)
+                else:
+                    data = page.screenshot(**options)
+            else:
+                data = page.screenshot(full_page=policy.clip == "full_page", **options)
+        except Exception as e:
+            logger.error("Failed to capture screenshot: %s", e)
+            return None
+
+        path = self.path_for(stem)
+        future = self._executor.submit(self._write, path, data)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return path
+
+    def _discard(self, future) -> None:
+        """Done callback (runs on the worker thread): forget a written screenshot"""
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Worker: encode if needed, write, then enforce retention"""
+        try:
+            if self.policy.image_format == "webp":
+                with Image.open(BytesIO(data)) as image:
+                    image.save(path, format="WEBP", quality=self.policy.quality)
+            else:
+                path.write_bytes(data)
+        except Exception as e:
+            logger.error("Failed to write screenshot %s: %s", path, e)
+            return
+
+        self._files.append(path)
+        if self.policy.max_files:
+            while len(self._files) > self.policy.max_files:
+                oldest = self._files.popleft()
+                try:
+                    oldest.unlink()
+                except OSError:
+                    pass
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait for queued screenshots to be written"""
+        with self._pending_lock:
+            pending = set(self._pending)
+        if pending:
+            wait(pending, timeout=timeout)
+
+    def close(self) -> None:
+        """Write everything still queued and stop the worker"""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,227 @@
+"""
+Query x filter matrix scheduler
+Runs every (search term, filter combination) case from the test_data.matrix settings,
+searching each term once and opening its filtered result URLs in extra tabs of the
+same context, so N terms x M filters cost N searches plus N*M light navigations
+"""
+
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import logging
+
+from playwright.sync_api import Page
+
+from facet_index import FacetIndex
+from home_page import EBayHomePage
+from search_query import SearchQuery
+from search_results_page import EBaySearchResultsPage
+
+logger = logging.getLogger(__name__)
+
+# Aspect name -> selected values, e.g. (("Transmission", ("Manual",)),)
+Filters = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+def normalize_filters(filters: Dict[str, object]) -> Filters:
+    """
+    Turn a config filter combination into a hashable, ordered form
+
+    Args:
+        filters (dict): Aspect name -> value or list of values, e.g. {"Transmission": "Manual"}
+    """
+    return tuple((name, (values,) if isinstance(values, str) else tuple(values))
+                 for name, values in filters.items())
+
+
+def describe_filters(filters: Filters) -> str:
+    """Short label such as 'Transmission=Manual,Fuel Type=Petrol'"""
+    return ",".join(f"{name}={'|'.join(values)}" for name, values in filters)
+
+
+class MatrixCase(NamedTuple):
+    """One search term with one filter combination"""
+
+    query: str
+    filters: Filters
+
+    @property
+    def case_id(self) -> str:
+        return f"{self.query}[{describe_filters(self.filters)}]"
+
+
+class MatrixResult(NamedTuple):
+    """Counts of one matrix case"""
+
+    query: str
+    filters: Filters
+    base_count: int
+    count: int
+    url: str
+    duration: float
+    facet_matches: Optional[bool] = None
+    error: str = ""
+
+    @property
+    def passed(self) -> bool:
+        return not self.error and 0 <= self.count <= self.base_count
+
+    def describe(self) -> str:
+        return f"{self.query} [{describe_filters(self.filters)}]: {self.count} of {self.base_count}"
+
+
+def expand_matrix(settings: dict) -> List[MatrixCase]:
+    """
+    Build the cases of the test_data.matrix settings
+
+    Args:
+        settings (dict): {"queries": [...], "filters": [{aspect: value(s)}, ...]}
+
+    Returns:
+        List[MatrixCase]: Every query with every filter combination, grouped by query
+    """
+    filters = [normalize_filters(f) for f in settings.get("filters", [])]
+    return [MatrixCase(query, f) for query in settings.get("queries", []) for f in filters]
+
+
+def group_by_query(cases: Iterable[MatrixCase]) -> Dict[str, List[Filters]]:
+    """Group cases by search term, keeping first-seen order and dropping duplicate combinations"""
+    groups: Dict[str, List[Filters]] = {}
+    for case in cases:
+        variants = groups.setdefault(case.query, [])
+        if case.filters not in variants:
+            variants.append(case.filters)
+    return groups
+
+
+def filtered_url(base: SearchQuery, filters: Filters, index: Optional[FacetIndex] = None) -> str:
+    """
+    URL of the base search with a filter combination applied
+
+    A single option is taken from the base page's facet index when the rail lists it
+    (the link eBay itself would follow); anything else is composed from the query.
+
+    Args:
+        base (SearchQuery): Unfiltered search of the cached results page
+        filters (Filters): Combination to apply
+        index (FacetIndex, optional): Facet index of the base results page
+    """
+    if index is not None and len(filters) == 1 and len(filters[0][1]) == 1:
+        found = index.get(filters[0][0], filters[0][1][0])
+        if found is not None and found.href and not found.selected:
+            return found.href
+    query = base.copy()
+    for name, values in filters:
+        query.with_aspect(name, *values)
+    return query.to_url()
+
+
+class MatrixScheduler:
+    """Run matrix cases on one page: one search per term, filter variants in extra tabs"""
+
+    def __init__(self, page: Page, max_tabs: int = 4):
+        """
+        Args:
+            page (Page): Page used for the searches; its context hosts the filter tabs
+            max_tabs (int): Filtered result pages loading at the same time
+        """
+        self.page = page
+        self.max_tabs = max(1, max_tabs)
+        self.searches = 0
+        self.navigations = 0
+        self._tabs: List[Page] = []
+
+    def run(self, cases: Iterable[MatrixCase]) -> List[MatrixResult]:
+        """Run all cases, grouped by search term"""
+        results = []
+        try:
+            for query, variants in group_by_query(cases).items():
+                results.extend(self.run_query(query, variants))
+        finally:
+            self.close()
+        return results
+
+    def run_query(self, query: str, variants: List[Filters]) -> List[MatrixResult]:
+        """
+        Search a term once and check every filter variant against it
+
+        Args:
+            query (str): Search term
+            variants (List[Filters]): Filter combinations for this term
+
+        Returns:
+            List[MatrixResult]: One result per variant, in order
+        """
+        start = time.perf_counter()
+        home = EBayHomePage(self.page)
+        if not self.searches:
+            home.navigate_to_home()
+        # the header search box is on results pages too, so later terms skip the home page
+        home.search_for_item(query)
+        self.searches += 1
+
+        results_page = EBaySearchResultsPage(self.page)
+        base_count = results_page.validate_results_and_count(query)
+        base = results_page.current_query()
+        index = results_page.get_facet_index()
+        urls = [filtered_url(base, filters, index) for filters in variants]
+        logger.info("Matrix search '%s': %s results, %s filter variant(s) in %.2fs",
+                    query, base_count, len(variants), time.perf_counter() - start)
+
+        results = []
+        for offset in range(0, len(variants), self.max_tabs):
+            batch = list(zip(variants[offset:offset + self.max_tabs], urls[offset:offset + self.max_tabs]))
+            results.extend(self._run_batch(query, base_count, index, batch))
+        return results
+
+    def _tab(self, slot: int) -> Page:
+        while len(self._tabs) <= slot:
+            self._tabs.append(self.page.context.new_page())
+        return self._tabs[slot]
+
+    def _run_batch(self, query: str, base_count: int, index: FacetIndex,
+                   batch: List[Tuple[Filters, str]]) -> List[MatrixResult]:
+        """Start every navigation of the batch, then read each tab as it renders"""
+        started = []
+        for slot, (filters, url) in enumerate(batch):
+            tab = self._tab(slot)
+            start = time.perf_counter()
+            try:
+                tab.goto(url, wait_until="commit")
+                self.navigations += 1
+                started.append((filters, url, tab, start, ""))
+            except Exception as e:
+                started.append((filters, url, tab, start, str(e)))
+
+        results = []
+        for filters, url, tab, start, error in started:
+            count = 0
+            facet_matches = None
+            if not error:
+                tab_page = EBaySearchResultsPage(tab)
+                try:
+                    tab_page.waits.for_selector(tab_page.RESULT_COUNT_TEXT, state="attached")
+                    count = tab_page.get_search_result_count()
+                    if len(filters) == 1 and len(filters[0][1]) == 1:
+                        facet_matches = index.count_matches(filters[0][0], filters[0][1][0], count)
+                    tab_page.collect_web_vitals(tab_page.VITALS_PAGE_TYPE, f"matrix:{describe_filters(filters)}")
+                except Exception as e:
+                    error = str(e)
+            result = MatrixResult(query, filters, base_count, count, url, time.perf_counter() - start,
+                                  facet_matches, error)
+            if error:
+                logger.error("Matrix case %s failed: %s", result.describe(), error)
+            else:
+                logger.info("Matrix case %s (%.2fs)", result.describe(), result.duration)
+            if facet_matches is False:
+                logger.warning("Matrix case %s differs from the facet count", result.describe())
+            results.append(result)
+        return results
+
+    def close(self) -> None:
+        """Close the filter tabs"""
+        for tab in self._tabs:
+            try:
+                tab.close()
+            except Exception:
+                pass
+        self._tabs = []
@@ -0,0 +1,267 @@
+"""
+eBay search results URL builder
+Composes keyword, category, aspect filters, price, condition, sort and paging into one URL
+so page objects can jump straight to a filtered state with a single navigation
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urljoin, urlsplit
+
+SEARCH_PATH = "sch/i.html"
+
+# _sop values
+SORT_ORDERS = {
+    "best_match": 12,
+    "ending_soonest": 1,
+    "newly_listed": 10,
+    "price_low": 15,
+    "price_high": 16,
+    "distance": 7,
+}
+
+# LH_ItemCondition values
+CONDITIONS = {
+    "new": 1000,
+    "open_box": 1500,
+    "certified_refurbished": 2000,
+    "seller_refurbished": 2500,
+    "used": 3000,
+    "for_parts": 7000,
+}
+
+ITEMS_PER_PAGE = (60, 120, 240)
+
+# Parameters eBay reserves for the search itself; anything else is an aspect filter
+RESERVED_PARAMS = {"_nkw", "_sacat", "_udlo", "_udhi", "LH_ItemCondition", "_sop", "_ipg", "_pgn", "_from", "rt", "_trksid"}
+
+# Other eBay parameters (_odkw, _dcat, LH_BIN, ...) are kept verbatim, never decoded as aspects
+PASSTHROUGH_PREFIXES = ("_", "LH_")
+
+VALUE_SEPARATOR = "|"
+# Separator between the (double-encoded) values of one aspect in a raw query string
+RAW_VALUE_SEPARATOR = re.compile(r"%7C|\|", re.IGNORECASE)
+
+
+def _encode_aspect(text: str) -> str:
+    """eBay double-encodes aspect names and values ('Body Type' -> 'Body%2520Type')"""
+    return quote(quote(text, safe=""), safe="")
+
+
+def _decode_aspect(text: str) -> str:
+    return unquote(unquote(text))
+
+
+def _price(text: str) -> Optional[float]:
+    """_udlo/_udhi value as a number, or None if it is not one"""
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+class SearchQuery:
+    """Builder for eBay search results URLs"""
+
+    def __init__(self, keyword: str, base_url: str = "https://www.ebay.com/"):
+        """
+        Initialize the query
+
+        Args:
+            keyword (str): Search term (_nkw)
+            base_url (str): Site root, e.g. config.json base_url
+        """
+        self.keyword = keyword
+        self.base_url = base_url
+        self.category: int = 0
+        self.aspects: Dict[str, List[str]] = {}
+        self.min_price: Optional[float] = None
+        self.max_price: Optional[float] = None
+        self.conditions: List[int] = []
+        self.sort: Optional[int] = None
+        self.items_per_page: Optional[int] = None
+        self.page_number: Optional[int] = None
+        # (name, value) of other eBay parameters, still URL-encoded as they appeared
+        self.extra_params: List[Tuple[str, str]] = []
+
+    def in_category(self, category_id: int) -> "SearchQuery":
+        """Restrict to an eBay category id (e.g. 6001 Cars & Trucks)"""
+        self.category = int(category_id)
+        return self
+
+    def with_aspect(self, name: str, *values: str) -> "SearchQuery":
+        """Add aspect filter values, e.g. with_aspect('Transmission', 'Manual')"""
+        selected = self.aspects.setdefault(name, [])
+        selected.extend(v for v in values if v not in selected)
+        return self
+
+    def without_aspect(self, name: str) -> "SearchQuery":
+        """Remove an aspect filter"""
+        self.aspects.pop(name, None)
+        return self
+
+    def price_range(self, min_price: Optional[float] = None, max_price: Optional[float] = None) -> "SearchQuery":
+        """Limit results to a price range (either bound may be None)"""
+        self.min_price = min_price
+        self.max_price = max_price
+        return self
+
+    def with_condition(self, *conditions: str) -> "SearchQuery":
+        """
+        Filter by item condition
+
+        Args:
+            conditions: Names from CONDITIONS ('new', 'used', ...)
+
+        Raises:
+            ValueError: If a condition name is unknown
+        """
+        for name in conditions:
+            if name not in CONDITIONS:
+                raise ValueError(f"Unknown condition '{name}', expected one of {sorted(CONDITIONS)}")
+            if CONDITIONS[name] not in self.conditions:
+                self.conditions.append(CONDITIONS[name])
+        return self
+
+    def sorted_by(self, order: str) -> "SearchQuery":
+        """
+        Set the sort order
+
+        Args:
+            order (str): Name from SORT_ORDERS ('best_match', 'price_low', ...)
+
+        Raises:
+            ValueError: If the order name is unknown
+        """
+        if order not in SORT_ORDERS:
+            raise ValueError(f"Unknown sort order '{order}', expected one of {sorted(SORT_ORDERS)}")
+        self.sort = SORT_ORDERS[order]
+        return self
+
+    def per_page(self, count: int) -> "SearchQuery":
+        """
+        Set items per page
+
+        Raises:
+            ValueError: If count is not one of ITEMS_PER_PAGE
+        """
+        if count not in ITEMS_PER_PAGE:
+            raise ValueError(f"Items per page must be one of {ITEMS_PER_PAGE}, got {count}")
+        self.items_per_page = count
+        return self
+
+    def on_page(self, page_number: int) -> "SearchQuery":
+        """Select a results page (1-based)"""
+        self.page_number = max(1, int(page_number))
+        return self
+
+    def copy(self) -> "SearchQuery":
+        """Get an independent copy, e.g. to derive several filtered variants"""
+        clone = SearchQuery(self.keyword, self.base_url)
+        clone.category = self.category
+        clone.aspects = {name: list(values) for name, values in self.aspects.items()}
+        clone.min_price, clone.max_price = self.min_price, self.max_price
+        clone.conditions = list(self.conditions)
+        clone.sort, clone.items_per_page, clone.page_number = self.sort, self.items_per_page, self.page_number
+        clone.extra_params = list(self.extra_params)
+        return clone
+
+    def to_url(self) -> str:
+        """
+        Build the search results URL
+
+        Returns:
+            str: URL such as https://www.ebay.com/sch/i.html?_nkw=mazda+mx-5&_sacat=0&Transmission=Manual
+        """
+        params = [("_nkw", self.keyword), ("_sacat", str(self.category))]
+        if self.min_price is not None:
+            params.append(("_udlo", f"{self.min_price:g}"))
+        if self.max_price is not None:
+            params.append(("_udhi", f"{self.max_price:g}"))
+        if self.conditions:
+            params.append(("LH_ItemCondition", VALUE_SEPARATOR.join(str(c) for c in self.conditions)))
+        if self.sort is not None:
+            params.append(("_sop", str(self.sort)))
+        if self.items_per_page is not None:
+            params.append(("_ipg", str(self.items_per_page)))
+        if self.page_number is not None:
+            params.append(("_pgn", str(self.page_number)))
+
+        query = urlencode(params)
+        if self.extra_params:
+            query += "&" + "&".join(f"{name}={value}" for name, value in self.extra_params)
+        aspects = "&".join(
+            f"{_encode_aspect(name)}={quote(VALUE_SEPARATOR, safe='').join(_encode_aspect(v) for v in values)}"
+            for name, values in self.aspects.items() if values
+        )
+        if aspects:
+            query = f"{query}&{aspects}"
+        return f"{urljoin(self.base_url, SEARCH_PATH)}?{query}"
+
+    @classmethod
+    def from_url(cls, url: str) -> "SearchQuery":
+        """
+        Parse a search results URL back into a query
+
+        Args:
+            url (str): eBay /sch/ URL (e.g. the current results page URL)
+
+        Returns:
+            SearchQuery: Query reproducing the URL's search and filters
+        """
+        parts = urlsplit(url)
+        base_url = f"{parts.scheme}://{parts.netloc}/" if parts.netloc else "https://www.ebay.com/"
+        # keep aspect names/values raw here: they carry a second encoding layer
+        raw = [p.split("=", 1) if "=" in p else [p, ""] for p in parts.query.split("&") if p]
+        plain = dict(parse_qsl(parts.query, keep_blank_values=True))
+
+        query = cls(plain.get("_nkw", ""), base_url)
+        if plain.get("_sacat", "").isdigit():
+            query.category = int(plain["_sacat"])
+        if plain.get("_udlo"):
+            query.min_price = _price(plain["_udlo"])
+        if plain.get("_udhi"):
+            query.max_price = _price(plain["_udhi"])
+        if plain.get("LH_ItemCondition"):
+            query.conditions = [int(c) for c in plain["LH_ItemCondition"].split(VALUE_SEPARATOR) if c.isdigit()]
+        if plain.get("_sop", "").isdigit():
+            query.sort = int(plain["_sop"])
+        if plain.get("_ipg", "").isdigit():
+            query.items_per_page = int(plain["_ipg"])
+        if plain.get("_pgn", "").isdigit():
+            query.page_number = int(plain["_pgn"])
+
+        for name, value in raw:
+            if name in RESERVED_PARAMS or not value:
+                continue
+            if name.startswith(PASSTHROUGH_PREFIXES):
+                query.extra_params.append((name, value))
+                continue
+            # split before decoding: a literal '|' or '%' inside a value is still encoded here
+            values = [_decode_aspect(v) for v in RAW_VALUE_SEPARATOR.split(value)]
+            query.with_aspect(_decode_aspect(name), *values)
+        return query
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SearchQuery) and self.to_url() == other.to_url()
+
+    def __repr__(self) -> str:
+        return f"SearchQuery({self.to_url()!r})"
+
+
+def aspect_query(keyword: str, aspects: Dict[str, Iterable[str]], base_url: str = "https://www.ebay.com/") -> SearchQuery:
+    """
+    Shortcut for a keyword search with aspect filters
+
+    Args:
+        keyword (str): Search term
+        aspects (dict): Aspect name -> value or values, e.g. {"Transmission": "Manual"}
+        base_url (str): Site root
+
+    Returns:
+        SearchQuery: Query with the aspects applied
+    """
+    query = SearchQuery(keyword, base_url)
+    for name, values in aspects.items():
+        query.with_aspect(name, *([values] if isinstance(values, str) else values))
+    return query
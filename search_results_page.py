@@ -4,26 +4,245 @@ Handles interactions with the search results page and filtering
 """
 
 from base_page import BasePage
+from collections import OrderedDict
+from facet_index import PARSE_FACETS_JS, FacetIndex
+from listings import Listing, ListingSet
 from playwright.sync_api import Page
+from search_query import SearchQuery
+from selector_chain import SelectorChain
+from typing import Iterator, Optional, Tuple
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
 
+def parse_result_count(count_text: str) -> Optional[int]:
+    """
+    Extract the result count from heading text like "1,023 results"
+
+    Returns:
+        Optional[int]: First number in the text, or None if there is none
+    """
+    numbers = re.findall(r'\d+', count_text.replace(',', ''))
+    return int(numbers[0]) if numbers else None
+
+
+class ResultsState:
+    """
+    Listings snapshot and facet index cache of one results page object
+
+    Holds the logic that needs no browser calls, shared by EBaySearchResultsPage and
+    AsyncEBaySearchResultsPage so the two cannot drift apart.
+    """
+
+    def __init__(self, facet_cache_size: int = 32):
+        """
+        Args:
+            facet_cache_size (int): Most query URLs whose facet index is kept
+        """
+        self.facet_cache_size = facet_cache_size
+        self._facets: "OrderedDict[str, FacetIndex]" = OrderedDict()
+        self._listings: Optional[ListingSet] = None
+        self._listings_url: Optional[str] = None
+
+    def cached_facets(self, key: str, refresh: bool = False) -> Tuple[Optional[FacetIndex], bool]:
+        """
+        Look up the facet index of a query URL
+
+        Args:
+            key (str): Query URL (SearchQuery.to_url of the results page)
+            refresh (bool): Ignore a cached index
+
+        Returns:
+            Tuple[Optional[FacetIndex], bool]: Index to use as-is (None to parse the rail), and
+            whether to wait for the rail first (False once the query is known to have none)
+        """
+        index = self._facets.get(key)
+        if index is None:
+            return None, True
+        self._facets.move_to_end(key)
+        if len(index) and not refresh:
+            return index, False
+        return None, False
+
+    def store_facets(self, key: str, url: str, raw: list) -> FacetIndex:
+        """
+        Build and cache the facet index of a query URL from PARSE_FACETS_JS output
+
+        An empty index is cached too: it marks a query without a rail (zero results or a
+        rail-less layout), so later lookups re-read it without waiting again.
+        """
+        index = FacetIndex.from_raw(url, raw)
+        if not len(index):
+            logger.warning("Filter panel has no facets; re-reading it without waiting on later calls")
+        self._facets[key] = index
+        while len(self._facets) > self.facet_cache_size:
+            self._facets.popitem(last=False)
+        logger.info("Indexed %s facets: %s", len(index), index.facet_names())
+        return index
+
+    def drop_facets(self, key: str) -> None:
+        """Forget the facet index of a query URL"""
+        self._facets.pop(key, None)
+
+    def facet_count_matches(self, facet: str, option: str, total: int) -> Optional[bool]:
+        """
+        Check a facet option's advertised count against a filtered total
+
+        Uses the most recent cached index that has a count for the option.
+
+        Returns:
+            Optional[bool]: None if no cached index has a count for the option
+        """
+        for index in reversed(self._facets.values()):
+            matches = index.count_matches(facet, option, total)
+            if matches is not None:
+                logger.info("%s: %s facet count %s total %s", facet, option, 'matches' if matches else 'differs from', total)
+                return matches
+        return None
+
+    def listings(self, url: str) -> Optional[ListingSet]:
+        """Snapshot taken on this URL, or None if there is none"""
+        return self._listings if self._listings_url == url else None
+
+    def store_listings(self, url: str, listings: ListingSet) -> ListingSet:
+        """Keep listings extracted from a URL as the snapshot"""
+        self._listings = listings
+        self._listings_url = url
+        logger.info("Extracted %s listings", len(listings))
+        return listings
+
+    def drop_listings(self) -> None:
+        """Forget the listings snapshot"""
+        self._listings = None
+        self._listings_url = None
+
+
 class EBaySearchResultsPage(BasePage):
     """Page Object for eBay Search Results Page"""
 
     # Selectors for search results
-    RESULT_ITEMS = 'ul.srp-results div.su-card-container'
-    RESULT_ITEMS_TITLES = "ul.srp-results div.su-card-container__header span.su-styled-text.primary"
+    RESULT_ITEMS = SelectorChain(
+        "result_items",
+        'ul.srp-results div.su-card-container',
+        'ul.srp-results li.s-card',
+        'ul.srp-results li.s-item',
+        'ul.srp-results > li[data-listingid]',
+    )
+    RESULT_ITEMS_TITLES = SelectorChain(
+        "result_item_titles",
+        "ul.srp-results div.su-card-container__header span.su-styled-text.primary",
+        "ul.srp-results div.s-card__title span",
+        "ul.srp-results li.s-item .s-item__title",
+    )
     RESULT_COUNT_TEXT = 'h1.srp-controls__count-heading span:first-child'
     FILTER_PANEL = 'div.srp-rail__left'
 
+    # How filters are applied: 'url' navigates straight to the filtered URL,
+    # 'ui' clicks through the left rail (kept to validate the UI itself)
+    FILTER_MODE_URL = "url"
+    FILTER_MODE_UI = "ui"
+    TRANSMISSION_ASPECT = "Transmission"
+
+    # Selector cache section
+    PAGE_TYPE = "search_results"
+    # Budget section in config.json web_vitals.budgets
+    VITALS_PAGE_TYPE = "search_results"
+
+    # Left rail structure parsed by the facet index
+    FACET_GROUP = "li.x-refine__main__list"
+    FACET_TITLE = ".x-refine__item, h3"
+    FACET_OPTION = "a.x-refine__multi-select-link, a.x-refine__single-select-link"
+    FACET_OPTION_LABEL = ".cbx, .x-refine__multi-select-cbx, .x-refine__single-select-cbx"
+    FACET_OPTION_COUNT = ".x-refine__multi-select-histogram, .x-refine__single-select-histogram"
+    FACET_CACHE_SIZE = 32
+
+    # Card-relative selectors used by bulk extraction
+    CARD_TITLE = "div.su-card-container__header span.su-styled-text.primary"
+    CARD_LINK = "a.su-link[href*='/itm/'], a[href*='/itm/']"
+    CARD_PRICE = ".s-card__price"
+    CARD_SUBTITLE = ".s-card__subtitle"
+    CARD_ATTRIBUTE_ROWS = ".s-card__attribute-row"
+
+    # Reads every card in one page.evaluate call (one IPC round trip) and
+    # returns the fields column by column, ready for ListingSet.from_columns
+    EXTRACT_LISTINGS_JS = """
+    (sel) => {
+        const cols = {
+            item_id: [], title: [], price: [], price_text: [],
+            url: [], subtitle: [], shipping: [], location: [],
+        };
+        const text = (el) => (el && el.textContent ? el.textContent.trim() : "");
+        const parsePrice = (s) => {
+            const m = (s || "").replace(/,/g, "").match(/\\d+(?:\\.\\d+)?/);
+            return m ? parseFloat(m[0]) : null;
+        };
+        document.querySelectorAll(sel.items).forEach((card) => {
+            const link = card.querySelector(sel.link);
+            const url = link ? link.href : "";
+            const host = card.closest("[data-listingid]");
+            let itemId = host ? host.getAttribute("data-listingid") : "";
+            if (!itemId) {
+                const m = url.match(/\\/itm\\/(?:[^/?]*\\/)?(\\d+)/);
+                itemId = m ? m[1] : "";
+            }
+            const priceText = text(card.querySelector(sel.price));
+            let shipping = "";
+            let location = "";
+            card.querySelectorAll(sel.attributes).forEach((row) => {
+                const t = text(row);
+                const lower = t.toLowerCase();
+                if (!location && lower.startsWith("located in")) {
+                    location = t.replace(/^located in\\s*/i, "");
+                } else if (!shipping && (lower.includes("delivery") || lower.includes("shipping"))) {
+                    shipping = t;
+                }
+            });
+            cols.item_id.push(itemId);
+            cols.title.push(text(card.querySelector(sel.title)));
+            cols.price.push(parsePrice(priceText));
+            cols.price_text.push(priceText);
+            cols.url.push(url);
+            cols.subtitle.push(text(card.querySelector(sel.subtitle)));
+            cols.shipping.push(shipping);
+            cols.location.push(location);
+        });
+        return cols;
+    }
+    """
+
+    # Next-page link of the results pagination bar
+    NEXT_PAGE_LINK = "a.pagination__next"
+
+    # Listing columns plus the next-page URL, still in one round trip
+    EXTRACT_PAGE_JS = """
+    (sel) => {
+        const extract = %s;
+        const next = document.querySelector(sel.next);
+        const usable = next && next.href && next.getAttribute("aria-disabled") !== "true";
+        return { columns: extract(sel), next: usable ? next.href : null };
+    }
+    """ % EXTRACT_LISTINGS_JS
+
     def __init__(self, page: Page):
         """
         Initialize eBay Search Results Page
         """
         super().__init__(page)
+        self._state = ResultsState(self.FACET_CACHE_SIZE)
+
+    @classmethod
+    def listing_selectors(cls) -> dict:
+        """Selectors passed to EXTRACT_LISTINGS_JS"""
+        return {
+            "items": cls.RESULT_ITEMS,
+            "title": cls.CARD_TITLE,
+            "link": cls.CARD_LINK,
+            "price": cls.CARD_PRICE,
+            "subtitle": cls.CARD_SUBTITLE,
+            "attributes": cls.CARD_ATTRIBUTE_ROWS,
+        }
 
     def get_search_result_count(self) -> int:
         """
@@ -34,22 +253,20 @@ class EBaySearchResultsPage(BasePage):
         try:
             # Get the result count text
             count_text = self.get_text(self.RESULT_COUNT_TEXT)
-            logger.info(f"Result count text: {count_text}")
+            logger.info("Result count text: %s", count_text)
 
             # Extract number from text like "1,023 results" or "Results for mazda mx-5"
-            import re
-            numbers = re.findall(r'\d+', count_text.replace(',', ''))
+            result_count = parse_result_count(count_text)
 
-            if numbers:
-                result_count = int(numbers[0])
-                logger.info(f"Total search results: {result_count}")
+            if result_count is not None:
+                logger.info("Total search results: %s", result_count)
                 return result_count
             else:
-                logger.warning(f"Could not extract count from text: {count_text}")
+                logger.warning("Could not extract count from text: %s", count_text)
                 return 0
 
         except Exception as e:
-            logger.error(f"Error getting result count: {str(e)}")
+            logger.error("Error getting result count: %s", e)
             return 0
 
     def are_search_results_displayed(self) -> bool:
@@ -60,19 +277,19 @@ class EBaySearchResultsPage(BasePage):
 
         try:
             # Wait for results to load
-            results_visible = self.wait_for_element(self.RESULT_ITEMS, timeout=20000)
+            results_visible = self.wait_for_element(self.RESULT_ITEMS, timeout=self.results_timeout)
 
             if results_visible:
                 # Count the number of results
                 count = self.get_element_count(self.RESULT_ITEMS)
-                logger.info(f"Found {count} result items displayed")
+                logger.info("Found %s result items displayed", count)
                 return count > 0
             else:
                 logger.warning("No search results found")
                 return False
 
         except Exception as e:
-            logger.error(f"Error validating search results: {str(e)}")
+            logger.error("Error validating search results: %s", e)
             return False
 
     def get_displayed_result_count(self) -> int:
@@ -81,89 +298,329 @@ class EBaySearchResultsPage(BasePage):
         """
         try:
             count = self.get_element_count(self.RESULT_ITEMS)
-            logger.info(f"Results displayed on page: {count}")
+            logger.info("Results displayed on page: %s", count)
             return count
         except Exception as e:
-            logger.error(f"Error counting displayed results: {str(e)}")
+            logger.error("Error counting displayed results: %s", e)
             return 0
 
-    def filter_by_transmission(self, transmission_type: str) -> bool:
+    @classmethod
+    def facet_selectors(cls) -> dict:
+        """Selectors passed to PARSE_FACETS_JS"""
+        return {
+            "panel": cls.FILTER_PANEL,
+            "group": cls.FACET_GROUP,
+            "title": cls.FACET_TITLE,
+            "option": cls.FACET_OPTION,
+            "label": cls.FACET_OPTION_LABEL,
+            "count": cls.FACET_OPTION_COUNT,
+        }
+
+    def get_facet_index(self, refresh: bool = False) -> FacetIndex:
+        """
+        Get the left rail facet index for the current results, parsing it at most once per query URL
+
+        Args:
+            refresh (bool): Re-parse even if the query URL is cached
+
+        Returns:
+            FacetIndex: facet -> option -> {count, href, selected} (empty if the rail is missing)
+        """
+        key = self.current_query().to_url()
+        cached, wait = self._state.cached_facets(key, refresh)
+        if cached is not None:
+            return cached
+
+        logger.info("Parsing filter panel into facet index")
+        try:
+            if wait:
+                self.waits.for_selector(self.FILTER_PANEL, state="attached", timeout=self.page_ready_timeout)
+            raw = self.page.evaluate(PARSE_FACETS_JS, self.facet_selectors())
+        except Exception as e:
+            logger.warning("No filter panel on %s: %s", self.page.url, e)
+            raw = []
+        return self._state.store_facets(key, self.page.url, raw)
+
+    def apply_facet(self, facet: str, option: str) -> bool:
+        """
+        Apply a left rail option by index lookup, following its link in one navigation
+
+        Falls back to composing the aspect filter URL when the option is not in the rail.
+
+        Args:
+            facet (str): Facet name, e.g. 'Transmission'
+            option (str): Option label, e.g. 'Manual'
+
+        Returns:
+            bool: True if the filtered results page loaded
+        """
+        found = self.get_facet_index().get(facet, option)
+        if found is None or not found.href:
+            logger.info("%s: %s not in facet index, composing the filter URL instead", facet, option)
+            return self.apply_aspect_filter(facet, option)
+        if found.selected:
+            logger.info("%s: %s already selected", facet, option)
+            return True
+
+        logger.info("Applying %s: %s from facet index (%s results)", facet, option, found.count)
+        return self.open_url(found.href)
+
+    def facet_count_matches(self, facet: str, option: str, total: int) -> Optional[bool]:
+        """
+        Check a facet option's advertised count against a filtered total
+
+        Uses the index of the results page the option was picked from (the most recent cached one
+        that lists it), so call it after applying the filter.
+
+        Returns:
+            Optional[bool]: None if no cached index has a count for the option
+        """
+        return self._state.facet_count_matches(facet, option, total)
+
+    def invalidate_results(self) -> None:
+        """Drop cached listings and the current query's facet index after the results change"""
+        self.invalidate_listings()
+        self._state.drop_facets(self.current_query().to_url())
+
+    def current_query(self) -> SearchQuery:
+        """
+        Get the search and filters of the current results page as a SearchQuery
+        """
+        return SearchQuery.from_url(self.page.url)
+
+    def open_query(self, query: SearchQuery) -> bool:
+        """
+        Navigate straight to the results of a search query
+
+        Args:
+            query (SearchQuery): Search, filters, sort and paging to open
+
+        Returns:
+            bool: True once the results page (count heading) is rendered
+        """
+        logger.info("Opening search query: %s", query.to_url())
+        return self.open_url(query.to_url())
+
+    def open_url(self, url: str) -> bool:
+        """
+        Navigate to a results URL (query or facet link) and wait for the results to render
+
+        Returns:
+            bool: True once the results page (count heading) is rendered
+        """
+        try:
+            with self.waits.record("open_results", url):
+                self.page.goto(url, wait_until="domcontentloaded")
+            self.invalidate_results()
+            self.waits.for_selector(self.RESULT_COUNT_TEXT, state="attached")
+            return True
+        except Exception as e:
+            logger.error("Error opening results URL: %s", e)
+            return False
+
+    def apply_aspect_filter(self, aspect: str, *values: str) -> bool:
+        """
+        Add an aspect filter (e.g. Transmission=Manual) to the current search with one navigation
+
+        Args:
+            aspect (str): Aspect name as shown in the left rail
+            values (str): Option values to select
+
+        Returns:
+            bool: True if the filtered results page loaded
+        """
+        logger.info("Applying %s filter via URL: %s", aspect, values)
+        query = self.current_query().with_aspect(aspect, *values)
+        query.page_number = None
+        return self.open_query(query)
+
+    def filter_by_transmission(self, transmission_type: str, mode: str = FILTER_MODE_URL) -> bool:
         """
         Filter search results by transmission type
+
+        Args:
+            transmission_type (str): e.g. 'Manual'
+            mode (str): 'url' to navigate to the filtered URL, 'ui' to click the left rail
+        """
+        if mode == self.FILTER_MODE_UI:
+            applied = self.filter_by_transmission_ui(transmission_type)
+        else:
+            applied = self.apply_facet(self.TRANSMISSION_ASPECT, transmission_type)
+        if applied:
+            self.collect_web_vitals(self.VITALS_PAGE_TYPE, f"filter:{transmission_type}")
+        return applied
+
+    def filter_by_transmission_ui(self, transmission_type: str) -> bool:
         """
-        logger.info(f"Applying transmission filter: {transmission_type}")
+        Filter search results by clicking the transmission option in the left rail
+        """
+        logger.info("Applying transmission filter: %s", transmission_type)
 
         try:
             # Wait for filter panel to load
-            if not self.wait_for_element(self.FILTER_PANEL, timeout=15000):
+            if not self.wait_for_element(self.FILTER_PANEL, timeout=self.page_ready_timeout):
                 logger.error("Filter panel did not load")
                 return False
 
-            # Try to find and click transmission filter section
-            logger.info("Looking for Transmission filter section")
-            self.scroll_to_bottom()
-            self.wait_for_load_state("")
-
             # Try clicking transmission filter button to expand it
+            logger.info("Looking for Transmission filter section")
             try:
                 transmission_section = self.page.get_by_text("Transmission")
                 if transmission_section.count() > 0:
                     transmission_section.first.click()
                     logger.info("Clicked Transmission filter to expand")
-                    self.wait_for_load_state("domcontentloaded")
             except Exception as e:
-                logger.warning(f"Could not expand transmission filter button: {str(e)}")
+                logger.warning("Could not expand transmission filter button: %s", e)
 
-            # Find and click the specific transmission option
-            logger.info(f"Looking for {transmission_type} option")
+            # Find and click the specific transmission option once it is rendered
+            logger.info("Looking for %s option", transmission_type)
             option_locator = self.page.get_by_text(transmission_type)
-
-            if option_locator.count() > 0:
-                option_locator.first.click()
-                logger.info(f"Selected {transmission_type} transmission option")
-                self.wait_for_load_state("")
-                logger.info("Filter applied successfully")
-                return True
-            else:
-                logger.warning(f"{transmission_type} option not found in filter")
+            try:
+                self.waits.for_locator(option_locator, timeout=self.filter_option_timeout)
+            except Exception:
+                logger.warning("%s option not found in filter", transmission_type)
                 return False
 
+            # Filter is applied when the new results are rendered (count heading or URL changed)
+            signature = self.waits.content_signature(self.RESULT_COUNT_TEXT)
+            option_locator.first.click()
+            logger.info("Selected %s transmission option", transmission_type)
+            self.waits.for_content_change(self.RESULT_COUNT_TEXT, signature, ready_selector=self.RESULT_ITEMS)
+            self.invalidate_results()
+            logger.info("Filter applied successfully")
+            return True
+
         except Exception as e:
-            logger.error(f"Error applying transmission filter: {str(e)}")
+            logger.error("Error applying transmission filter: %s", e)
             return False
 
-    def get_result_titles(self, limit: int = 10) -> list:
+    def extract_listings(self) -> ListingSet:
         """
-        Get titles of search results
+        Extract every result card on the page in a single round trip
 
-        Args:
-            limit (int): Maximum number of titles to retrieve
+        The extracted records are kept as the page snapshot used by
+        get_result_titles and the keyword validation helpers.
 
         Returns:
-            list: List of result titles
+            ListingSet: Columnar set with one row per result card
         """
-        logger.info(f"Getting result titles (limit: {limit})")
+        logger.info("Extracting listings from results page")
 
         try:
-            titles = []
-            result_items = self.page.locator(self.RESULT_ITEMS)
-            count = result_items.count()
+            columns = self.page.evaluate(self.EXTRACT_LISTINGS_JS, self.listing_selectors())
+        except Exception as e:
+            logger.error("Error extracting listings: %s", e)
+            return ListingSet()
 
-            for i in range(min(limit, count)):
+        return self._state.store_listings(self.page.url, ListingSet.from_columns(columns or {}))
+
+    def get_listings(self, refresh: bool = False) -> ListingSet:
+        """
+        Get listings from the current snapshot, extracting only when needed
+
+        Args:
+            refresh (bool): Force a new extraction even if a snapshot exists
+
+        Returns:
+            ListingSet: Listings for the current results page
+        """
+        snapshot = None if refresh else self._state.listings(self.page.url)
+        return snapshot if snapshot is not None else self.extract_listings()
+
+    def _extract_page(self, page: Page) -> Tuple[ListingSet, Optional[str]]:
+        """Extract listings and the next-page URL from a results tab"""
+        selectors = dict(self.listing_selectors(), next=self.NEXT_PAGE_LINK)
+        data = page.evaluate(self.EXTRACT_PAGE_JS, selectors) or {}
+        return ListingSet.from_columns(data.get("columns") or {}), data.get("next")
+
+    def iter_listings(self, max_items: Optional[int] = None, max_pages: Optional[int] = None,
+                      dedup: bool = True) -> Iterator[Listing]:
+        """
+        Yield listings across result pages, prefetching the next page in a second tab
+
+        Page 1 is read from the current page. While page N is being consumed,
+        page N+1 is already loading in another tab of the same context, so
+        extraction overlaps with network and render time. The current page is
+        left untouched and the prefetch tabs are closed as soon as iteration
+        ends, including when the caller stops early.
+
+        Args:
+            max_items (int, optional): Stop after this many listings
+            max_pages (int, optional): Stop after this many result pages
+            dedup (bool): Skip item ids already yielded on earlier pages
+
+        Yields:
+            Listing: One record per result card, in page order
+        """
+        logger.info("Iterating listings (max_items: %s, max_pages: %s)", max_items, max_pages)
+        tabs = []
+        seen = set()
+        yielded = 0
+        page_number = 1
+        current = self.page
+
+        try:
+            while True:
+                listings, next_url = self._extract_page(current)
+                logger.info("Results page %s: %s listings", page_number, len(listings))
+
+                # Start loading page N+1 before handing out page N
+                prefetch = None
+                if next_url and (max_pages is None or page_number < max_pages):
+                    # two tabs alternate, so the tab being read is never the one navigating
+                    tab_index = (page_number - 1) % 2
+                    if len(tabs) <= tab_index:
+                        tabs.append(self.page.context.new_page())
+                    prefetch = tabs[tab_index]
+                    with self.waits.record("prefetch_commit", next_url):
+                        prefetch.goto(next_url, wait_until="commit")
+
+                for listing in listings:
+                    if dedup and listing.item_id:
+                        if listing.item_id in seen:
+                            continue
+                        seen.add(listing.item_id)
+                    yield listing
+                    yielded += 1
+                    if max_items is not None and yielded >= max_items:
+                        return
+
+                if prefetch is None:
+                    return
+
+                with self.waits.record("prefetch_ready", prefetch.url):
+                    # the first card attaches while the list is still streaming in; the whole
+                    # document (every card) is parsed once DOMContentLoaded has fired
+                    prefetch.wait_for_load_state("domcontentloaded", timeout=self.navigation_timeout)
+                current = prefetch
+                page_number += 1
+        finally:
+            for tab in tabs:
                 try:
-                    # Get title from each result
-                    title = self.page.locator(self.RESULT_ITEMS_TITLES).first.text_content()
-                    if title:
-                        titles.append(title.strip())
-                except Exception as e:
-                    logger.warning(f"Could not get title for result {i}: {str(e)}")
+                    tab.close()
+                except Exception:
+                    pass
+            logger.info("Listing iteration finished after %s listings on %s page(s)", yielded, page_number)
 
-            logger.info(f"Retrieved {len(titles)} result titles")
-            return titles
+    def invalidate_listings(self) -> None:
+        """Drop the cached listings snapshot (e.g. after results change)"""
+        self._state.drop_listings()
 
-        except Exception as e:
-            logger.error(f"Error getting result titles: {str(e)}")
-            return []
+    def get_result_titles(self, limit: int = 10) -> list:
+        """
+        Get titles of search results
+
+        Args:
+            limit (int): Maximum number of titles to retrieve
+
+        Returns:
+            list: List of result titles
+        """
+        logger.info("Getting result titles (limit: %s)", limit)
+
+        titles = self.get_listings().titles()[:limit]
+        logger.info("Retrieved %s result titles", len(titles))
+        return titles
 
     def validate_results_contain_keyword(self, keyword: str) -> bool:
         """
@@ -175,7 +632,7 @@ class EBaySearchResultsPage(BasePage):
         Returns:
             bool: True if results contain the keyword, False otherwise
         """
-        logger.info(f"Validating results contain keyword: {keyword}")
+        logger.info("Validating results contain keyword: %s", keyword)
 
         try:
             titles = self.get_result_titles(limit=20)
@@ -184,14 +641,14 @@ class EBaySearchResultsPage(BasePage):
             matching_results = [t for t in titles if keyword_lower in t.lower()]
 
             if matching_results:
-                logger.info(f"Found {len(matching_results)} results containing '{keyword}'")
+                logger.info("Found %s results containing '%s'", len(matching_results), keyword)
                 return True
             else:
-                logger.warning(f"No results containing '{keyword}' found")
+                logger.warning("No results containing '%s' found", keyword)
                 return False
 
         except Exception as e:
-            logger.error(f"Error validating keyword in results: {str(e)}")
+            logger.error("Error validating keyword in results: %s", e)
             return False
 
     def validate_results_and_count(self, keyword: str = None) -> int:
@@ -216,20 +673,23 @@ class EBaySearchResultsPage(BasePage):
                 logger.warning("Keyword validation raised an exception but continuing to return count")
         return count
 
-    def apply_transmission_and_get_count(self, transmission_type: str) -> int:
+    def apply_transmission_and_get_count(self, transmission_type: str, mode: str = FILTER_MODE_URL) -> int:
         """
         High-level helper: apply transmission filter and return filtered count
 
         Args:
             transmission_type (str): e.g. 'Manual'
+            mode (str): 'url' (single navigation) or 'ui' (click through the left rail)
 
         Returns:
             int: Filtered result count (0 if filter not applied)
         """
-        applied = self.filter_by_transmission(transmission_type)
+        applied = self.filter_by_transmission(transmission_type, mode)
         if not applied:
             return 0
 
-        # Wait for results to refresh and return new count
-        self.wait_for_load_state("")
-        return self.get_search_result_count()
+        # filter_by_transmission returns once the filtered results are rendered
+        count = self.get_search_result_count()
+        if self.facet_count_matches(self.TRANSMISSION_ASPECT, transmission_type, count) is False:
+            logger.warning("Filtered count %s differs from the %s facet count", count, transmission_type)
+        return count
@@ -0,0 +1,217 @@
+"""
+Self-healing selector chains
+A logical element is a ranked list of candidate CSS selectors; all candidates are
+probed together in one wait_for_function, and the winner is remembered per page
+type in a JSON cache so later runs try it first
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILE = "reports/selector_cache.json"
+
+# Highest-ranked candidate that currently matches (a visible element for state 'visible'), or null
+PROBE_JS = """
+(a) => {
+    const visible = (el) => {
+        if (a.state !== "visible") return true;
+        const style = getComputedStyle(el);
+        return style.visibility !== "hidden" && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    };
+    for (const selector of a.candidates) {
+        let found;
+        try { found = document.querySelectorAll(selector); } catch (e) { continue; }
+        for (const el of found) {
+            if (visible(el)) return selector;
+        }
+    }
+    return null;
+}
+"""
+
+
+class SelectorChain(str):
+    """
+    Ranked candidate CSS selectors for one logical element
+
+    Used as a plain string it is the CSS union of its candidates, so code that does
+    not resolve chains (e.g. selectors passed into page scripts) still matches.
+    """
+
+    name: str
+    candidates: Tuple[str, ...]
+
+    def __new__(cls, name: str, *candidates: str):
+        """
+        Args:
+            name (str): Logical element name, the cache key within a page type
+            candidates: CSS selectors, most preferred first
+
+        Raises:
+            ValueError: If no candidate is given
+        """
+        if not candidates:
+            raise ValueError(f"Selector chain '{name}' needs at least one candidate")
+        chain = super().__new__(cls, ", ".join(candidates))
+        chain.name = name
+        chain.candidates = tuple(candidates)
+        return chain
+
+    @property
+    def primary(self) -> str:
+        return self.candidates[0]
+
+    def ranked(self, preferred: Optional[str] = None) -> Tuple[str, ...]:
+        """Candidates with a previously winning selector moved to the front"""
+        if preferred is None or preferred not in self.candidates:
+            return self.candidates
+        return (preferred,) + tuple(c for c in self.candidates if c != preferred)
+
+    def __reduce__(self):
+        return (SelectorChain, (self.name, *self.candidates))
+
+    def __repr__(self) -> str:
+        return f"SelectorChain({self.name!r}, {len(self.candidates)} candidates)"
+
+
+class SelectorCache:
+    """Winning selector per (page type, chain name), persisted as JSON (one process-wide instance: SELECTOR_CACHE)"""
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_FILE):
+        """
+        Args:
+            path (str, optional): JSON cache file (None keeps the cache in memory only)
+        """
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._verified = set()
+        self._loaded = False
+
+    def configure(self, path: Optional[str]) -> None:
+        """Switch to another cache file (entries are reloaded on next use)"""
+        with self._lock:
+            self.path = Path(path) if path else None
+            self._entries = {}
+            self._verified = set()
+            self._loaded = False
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable selector cache %s: %s", self.path, e)
+            return {}
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self._entries = self._read()
+            self._loaded = True
+
+    def get(self, page_type: str, name: str) -> Optional[str]:
+        """Last winning selector of a chain (from this run or an earlier one)"""
+        with self._lock:
+            self._ensure_loaded()
+            return self._entries.get(page_type, {}).get(name)
+
+    def verified(self, page_type: str, name: str) -> Optional[str]:
+        """Winning selector of a chain if it was probed successfully in this process"""
+        with self._lock:
+            if (page_type, name) in self._verified:
+                return self._entries.get(page_type, {}).get(name)
+        return None
+
+    def store(self, page_type: str, name: str, selector: str) -> None:
+        """Remember a probe winner; the file is rewritten only when the winner changed"""
+        with self._lock:
+            self._ensure_loaded()
+            self._verified.add((page_type, name))
+            if self._entries.get(page_type, {}).get(name) == selector:
+                return
+            self._entries.setdefault(page_type, {})[name] = selector
+            self._save()
+
+    def _save(self) -> None:
+        """Merge into the file on disk (other workers may have written it) and replace it atomically"""
+        if self.path is None:
+            return
+        try:
+            merged = self._read()
+            for page_type, names in self._entries.items():
+                merged.setdefault(page_type, {}).update(names)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(merged, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Could not write selector cache %s: %s", self.path, e)
+
+
+SELECTOR_CACHE = SelectorCache()
+
+
+def _probe_args(chain: SelectorChain, page_type: str, state: str) -> dict:
+    return {"candidates": list(chain.ranked(SELECTOR_CACHE.get(page_type, chain.name))), "state": state}
+
+
+def _remember(chain: SelectorChain, page_type: str, winner: Optional[str], required: bool = True) -> Optional[str]:
+    if winner is None:
+        log = logger.error if required else logger.info
+        log("No candidate of selector chain %s matched on %s: %s", chain.name, page_type, chain.candidates)
+        return None
+    if required and winner != chain.primary:
+        logger.warning("Selector chain %s on %s: primary selector did not match, using %s",
+                       chain.name, page_type, winner)
+    SELECTOR_CACHE.store(page_type, chain.name, winner)
+    return winner
+
+
+def resolve_chain(page, chain: SelectorChain, page_type: str, timeout: int, state: str = "visible",
+                  required: bool = True) -> Optional[str]:
+    """
+    Wait until any candidate of a chain matches and return the best-ranked match
+
+    All candidates are checked in each poll of a single wait_for_function, so a broken
+    primary selector costs one poll rather than a full timeout.
+
+    Args:
+        page: Playwright sync Page
+        chain (SelectorChain): Element to find
+        page_type (str): Cache section (e.g. 'home', 'search_results')
+        timeout (int): Milliseconds to wait for any candidate
+        state (str): 'visible' or 'attached'
+        required (bool): Log a miss as an error (False for optional elements such as banners)
+
+    Returns:
+        Optional[str]: Winning selector, or None if nothing matched in time
+    """
+    try:
+        handle = page.wait_for_function(PROBE_JS, arg=_probe_args(chain, page_type, state), timeout=timeout)
+        winner = handle.json_value()
+    except Exception as e:
+        logger.debug("Selector chain %s probe failed: %s", chain.name, e)
+        winner = None
+    return _remember(chain, page_type, winner, required)
+
+
+async def resolve_chain_async(page, chain: SelectorChain, page_type: str, timeout: int,
+                              state: str = "visible", required: bool = True) -> Optional[str]:
+    """Async counterpart of resolve_chain for playwright.async_api pages"""
+    try:
+        handle = await page.wait_for_function(PROBE_JS, arg=_probe_args(chain, page_type, state), timeout=timeout)
+        winner = await handle.json_value()
+    except Exception as e:
+        logger.debug("Selector chain %s probe failed: %s", chain.name, e)
+        winner = None
+    return _remember(chain, page_type, winner, required)
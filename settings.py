@@ -0,0 +1,318 @@
+"""
+Typed project settings
+Loads config.json once, applies environment and command line overrides, validates
+the result and exposes typed sections (timeouts, launch options, logging, test data)
+
+Overrides use dotted keys; values are parsed as JSON when possible, else kept as strings:
+    EBAY_TIMEOUTS__DEFAULT=60000 pytest                # environment: EBAY_<SECTION>__<KEY>
+    pytest --ebay-set timeouts.navigation=90000         # command line (repeatable, wins over env)
+    pytest --ebay-set browser_config.headless=false
+"""
+
+import copy
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH = Path(__file__).resolve().parent / "config.json"
+ENV_PREFIX = "EBAY_"
+ENV_SEPARATOR = "__"
+
+# Dotted key -> accepted types (bool is checked separately since it is an int subclass)
+SCHEMA: Dict[str, tuple] = {
+    "base_url": (str,),
+    "browser_config": (dict,),
+    "test_data.search_term": (str,),
+    "test_data.filters": (dict,),
+    "test_data.filter_mode": (str,),
+    "test_data.matrix.queries": (list,),
+    "test_data.matrix.filters": (list,),
+    "test_data.matrix.max_tabs": (int,),
+    "timeouts.default": (int,),
+    "timeouts.navigation": (int,),
+    "timeouts.element_wait": (int,),
+    "timeouts.page_ready": (int,),
+    "timeouts.results": (int,),
+    "timeouts.filter_option": (int,),
+    "logging.log_level": (str,),
+    "logging.queue": (bool,),
+    "logging.batch_size": (int,),
+    "browser_pool.size": (int,),
+    "browser_pool.context_options": (dict,),
+    "network.enabled": (bool,),
+    "screenshots.quality": (int,),
+    "screenshots.sample_rate": (int, float),
+    "history.enabled": (bool,),
+    "instrumentation.enabled": (bool,),
+    "web_vitals.enabled": (bool,),
+    "web_vitals.budgets": (dict,),
+    "web_vitals.settle_ms": (int,),
+    "tracing.enabled": (bool,),
+    "tracing.duration_budget_s": (int, float),
+    "selectors.cache_file": (str,),
+    "storage_state.enabled": (bool,),
+    "storage_state.ttl_hours": (int, float),
+    "storage_state.consent_selectors": (list,),
+    "browser_server.enabled": (bool,),
+    "browser_server.endpoint_file": (str,),
+    "browser_server.connect_timeout": (int,),
+    "benchmarks.sizes": (list,),
+    "benchmarks.repeat": (int,),
+    "benchmarks.threshold": (int, float),
+    "benchmarks.baseline_file": (str,),
+    "benchmarks.warmup": (int,),
+    "benchmarks.facet_groups": (int,),
+    "benchmarks.facet_options": (int,),
+    "benchmarks.min_delta_ms": (int, float),
+}
+
+# Dotted key -> allowed values
+CHOICES: Dict[str, tuple] = {
+    "test_data.filter_mode": ("url", "ui"),
+    "logging.log_level": ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
+    "replay.mode": ("off", "record", "replay"),
+    "screenshots.mode": ("off", "failure", "always", "sampled"),
+    "web_vitals.mode": ("warn", "fail"),
+}
+
+POSITIVE = ("timeouts.default", "timeouts.navigation", "timeouts.element_wait", "timeouts.page_ready",
+            "timeouts.results", "timeouts.filter_option", "logging.batch_size",
+            "browser_pool.size", "test_data.matrix.max_tabs", "browser_server.connect_timeout",
+            "benchmarks.repeat", "benchmarks.warmup")
+
+
+class Timeouts(NamedTuple):
+    """Playwright timeouts in milliseconds"""
+
+    default: int = 30000
+    navigation: int = 45000
+    element_wait: int = 10000
+    # page-level readiness (home search box, filter rail), result list, left-rail filter option
+    page_ready: int = 15000
+    results: int = 20000
+    filter_option: int = 10000
+
+
+class LoggingSettings(NamedTuple):
+    """Log file, level and queued-logging options"""
+
+    log_file: str = "test_execution.log"
+    log_level: str = "INFO"
+    report_file: str = "test_report.html"
+    queue: bool = True
+    batch_size: int = 256
+
+
+class SearchSettings(NamedTuple):
+    """Search term and filters used by the flows"""
+
+    search_term: str = ""
+    # None until Settings fills in a dict of its own (a {} default would be shared by every instance)
+    filters: Optional[dict] = None
+    filter_mode: str = "url"
+    # {"queries": [...], "filters": [{aspect: value(s)}, ...], "max_tabs": n} for search_matrix
+    matrix: Optional[dict] = None
+
+    @property
+    def transmission(self) -> Optional[str]:
+        return (self.filters or {}).get("transmission")
+
+
+def parse_value(raw: str):
+    """Parse an override value as JSON ('60000', 'false', '[1, 2]'), falling back to the plain string"""
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+
+def env_overrides(environ: Optional[Mapping[str, str]] = None) -> List[Tuple[str, object]]:
+    """
+    Collect overrides from EBAY_<SECTION>__<KEY> environment variables
+
+    Returns:
+        List[Tuple[str, object]]: (dotted key, value) pairs, e.g. ('timeouts.default', 60000)
+    """
+    environ = os.environ if environ is None else environ
+    found = []
+    for name, raw in sorted(environ.items()):
+        if name.startswith(ENV_PREFIX) and ENV_SEPARATOR in name:
+            key = name[len(ENV_PREFIX):].lower().replace(ENV_SEPARATOR, ".")
+            found.append((key, parse_value(raw)))
+    return found
+
+
+def cli_overrides(assignments: Iterable[str]) -> List[Tuple[str, object]]:
+    """
+    Parse 'dotted.key=value' assignments (e.g. from --ebay-set)
+
+    Raises:
+        ValueError: If an assignment has no '='
+    """
+    found = []
+    for assignment in assignments:
+        key, sep, raw = assignment.partition("=")
+        if not sep or not key.strip():
+            raise ValueError(f"Invalid setting override '{assignment}', expected key=value")
+        found.append((key.strip(), parse_value(raw.strip())))
+    return found
+
+
+def _lookup(data: dict, dotted: str):
+    node = data
+    for part in dotted.split("."):
+        if not isinstance(node, dict) or part not in node:
+            return None
+        node = node[part]
+    return node
+
+
+def is_known_key(data: dict, dotted: str) -> bool:
+    """
+    Check whether an override targets a setting this project reads
+
+    Args:
+        data (dict): Config file contents before overrides
+        dotted (str): Override key, e.g. 'timeouts.navigation'
+
+    Returns:
+        bool: True for SCHEMA/CHOICES keys, keys present in the file and keys under a
+        free-form dict setting (browser_config, web_vitals.budgets, ...)
+    """
+    if dotted in SCHEMA or dotted in CHOICES or _lookup(data, dotted) is not None:
+        return True
+    return any(dotted.startswith(key + ".") for key, types in SCHEMA.items() if dict in types)
+
+
+class Settings:
+    """Validated configuration (one per session; see get_settings)"""
+
+    def __init__(self, data: dict, source: str = ""):
+        """
+        Args:
+            data (dict): Parsed config.json with overrides applied
+            source (str): Where the settings came from (for error messages)
+
+        Raises:
+            ValueError: If a setting has the wrong type or an unknown value
+        """
+        self.data = data
+        self.source = source
+        self.validate()
+        self.timeouts = Timeouts(**self._known(Timeouts, "timeouts"))
+        self.logging = LoggingSettings(**self._known(LoggingSettings, "logging"))
+        test_data = self._known(SearchSettings, "test_data")
+        self.test_data = SearchSettings(**{**test_data, "filters": dict(test_data.get("filters") or {}),
+                                           "matrix": dict(test_data.get("matrix") or {})})
+
+    @classmethod
+    def load(cls, path: Optional[str] = None, overrides: Iterable[Tuple[str, object]] = (),
+             environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """
+        Read a config file and apply environment, then explicit, overrides
+
+        Args:
+            path (str, optional): Config file (default: config.json next to this module)
+            overrides: (dotted key, value) pairs applied last, e.g. from cli_overrides
+            environ (Mapping, optional): Environment to read EBAY_* overrides from (default: os.environ)
+
+        Returns:
+            Settings: Validated settings
+        """
+        path = Path(path) if path else CONFIG_PATH
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for key, value in [*env_overrides(environ), *overrides]:
+            if not is_known_key(data, key):
+                logger.warning("Unknown setting %s (from an EBAY_* variable or --ebay-set); applied but not read "
+                               "by any setting type, check the key for typos", key)
+            cls._assign(data, key, value)
+            logger.info("Setting override: %s = %r", key, value)
+        return cls(data, source=str(path))
+
+    @staticmethod
+    def _assign(data: dict, dotted: str, value) -> None:
+        node = data
+        *parents, leaf = dotted.split(".")
+        for part in parents:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = node[part] = {}
+            node = child
+        node[leaf] = value
+
+    def _known(self, section_type, name: str) -> dict:
+        section = self.data.get(name, {})
+        return {k: v for k, v in section.items() if k in section_type._fields}
+
+    def validate(self) -> None:
+        """
+        Check types, allowed values and positive timeouts
+
+        Raises:
+            ValueError: Listing every invalid setting
+        """
+        problems = []
+        for key, types in SCHEMA.items():
+            value = _lookup(self.data, key)
+            if value is None:
+                continue
+            is_bool = isinstance(value, bool)
+            if (bool in types) != is_bool or not isinstance(value, types):
+                names = "/".join(t.__name__ for t in types)
+                problems.append(f"{key} must be {names}, got {value!r}")
+        for key, allowed in CHOICES.items():
+            value = _lookup(self.data, key)
+            if value is not None and value not in allowed:
+                problems.append(f"{key} must be one of {allowed}, got {value!r}")
+        for key in POSITIVE:
+            value = _lookup(self.data, key)
+            if isinstance(value, int) and not isinstance(value, bool) and value <= 0:
+                problems.append(f"{key} must be positive, got {value!r}")
+        if problems:
+            raise ValueError(f"Invalid settings in {self.source or 'config'}: " + "; ".join(problems))
+
+    def section(self, name: str) -> dict:
+        """Get a raw config section (empty dict if missing)"""
+        return self.data.get(name, {})
+
+    def get(self, dotted: str, default=None):
+        """Get a value by dotted key, e.g. 'web_vitals.budgets.home'"""
+        value = _lookup(self.data, dotted)
+        return default if value is None else value
+
+    @property
+    def base_url(self) -> str:
+        return self.data.get("base_url", "https://www.ebay.com/")
+
+    @property
+    def launch_options(self) -> dict:
+        """Keyword arguments for browser_type.launch (browser_config section)"""
+        return dict(self.section("browser_config"))
+
+    def as_dict(self) -> dict:
+        """Deep copy of the effective configuration"""
+        return copy.deepcopy(self.data)
+
+
+# Settings of this process, set once per session by conftest (or loaded on first use)
+SETTINGS: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """Get the session settings, loading config.json (with environment overrides) on first use"""
+    global SETTINGS
+    if SETTINGS is None:
+        SETTINGS = Settings.load()
+    return SETTINGS
+
+
+def use_settings(settings: Settings) -> Settings:
+    """Make settings the session settings returned by get_settings"""
+    global SETTINGS
+    SETTINGS = settings
+    return settings
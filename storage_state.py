@@ -0,0 +1,129 @@
+"""
+Warmed storage-state snapshots
+Visits the site once as a first-time user, dismisses the consent banner, and saves the
+resulting cookies and localStorage per site and locale so new contexts start as a
+returning visitor
+"""
+
+import os
+import re
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+from urllib.parse import urlparse
+import logging
+
+from playwright.sync_api import Browser, BrowserContext
+
+from selector_chain import SelectorChain, resolve_chain
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONSENT_SELECTORS = (
+    "#gdpr-banner-accept",
+    "button[data-testid='gdpr-banner-accept']",
+    "#onetrust-accept-btn-handler",
+)
+
+
+class StorageStateManager:
+    """Builds, caches and expires one storage_state file per (site, locale)"""
+
+    # Cache section used for the consent button chain
+    PAGE_TYPE = "consent"
+
+    def __init__(self, directory: str = "reports/storage_state", ttl_hours: float = 12,
+                 consent_selectors: Iterable[str] = DEFAULT_CONSENT_SELECTORS, consent_timeout: int = 3000):
+        """
+        Args:
+            directory (str): Where snapshots are written
+            ttl_hours (float): Rebuild a snapshot older than this
+            consent_selectors: Candidate selectors of the consent banner's accept button
+            consent_timeout (int): Milliseconds to wait for the consent banner on the warm-up visit
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_hours * 3600
+        consent = tuple(consent_selectors)
+        self.consent_button = SelectorChain("consent_accept", *consent) if consent else None
+        self.consent_timeout = consent_timeout
+
+    @classmethod
+    def from_config(cls, settings: dict) -> "StorageStateManager":
+        """Build a manager from the 'storage_state' section of config.json"""
+        return cls(
+            directory=settings.get("directory", "reports/storage_state"),
+            ttl_hours=settings.get("ttl_hours", 12),
+            consent_selectors=settings.get("consent_selectors", DEFAULT_CONSENT_SELECTORS),
+            consent_timeout=settings.get("consent_timeout", 3000),
+        )
+
+    def path_for(self, base_url: str, locale: Optional[str] = None) -> Path:
+        """Snapshot file of a site and locale, e.g. www.ebay.com_en-US.json"""
+        host = urlparse(base_url).netloc or base_url
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{host}_{locale or 'default'}")
+        return self.directory / f"{name}.json"
+
+    def is_fresh(self, path: Path) -> bool:
+        """True if the snapshot exists and is younger than the TTL"""
+        try:
+            return time.time() - path.stat().st_mtime < self.ttl_seconds
+        except OSError:
+            return False
+
+    def get(self, browser: Browser, base_url: str, context_options: Optional[dict] = None,
+            setup: Optional[Callable[[BrowserContext], None]] = None) -> Optional[Path]:
+        """
+        Get a fresh snapshot for the site and the options' locale, building it if needed
+
+        Args:
+            browser (Browser): Browser used for the warm-up visit
+            base_url (str): Site root to visit
+            context_options (dict, optional): Options of the contexts that will load the snapshot
+            setup (callable, optional): Run on the warm-up context first (e.g. request router installation)
+
+        Returns:
+            Optional[Path]: Snapshot file, or None if it could not be built (contexts then start cold)
+        """
+        options = dict(context_options or {})
+        path = self.path_for(base_url, options.get("locale"))
+        if self.is_fresh(path):
+            logger.info("Using storage state snapshot %s", path)
+            return path
+        try:
+            return self.build(browser, base_url, path, options, setup)
+        except Exception as e:
+            logger.warning("Could not build storage state for %s: %s", base_url, e)
+            return None
+
+    def build(self, browser: Browser, base_url: str, path: Path, context_options: dict,
+              setup: Optional[Callable[[BrowserContext], None]] = None) -> Path:
+        """
+        Visit the site as a first-time user, accept consent and save the storage state
+
+        Returns:
+            Path: Written snapshot
+        """
+        start = time.perf_counter()
+        options = {k: v for k, v in context_options.items() if k != "storage_state"}
+        context = browser.new_context(**options)
+        try:
+            if setup:
+                setup(context)
+            page = context.new_page()
+            page.goto(base_url, wait_until="domcontentloaded")
+            if self.consent_button is not None:
+                accept = resolve_chain(page, self.consent_button, self.PAGE_TYPE, self.consent_timeout,
+                                       required=False)
+                if accept:
+                    page.click(accept)
+                    page.wait_for_load_state("domcontentloaded")
+                    logger.info("Accepted consent banner (%s)", accept)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # write then rename, so parallel workers never load a half-written file
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            context.storage_state(path=str(tmp))
+            os.replace(tmp, path)
+        finally:
+            context.close()
+        logger.info("Built storage state snapshot %s in %.2fs", path, time.perf_counter() - start)
+        return path
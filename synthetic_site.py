@@ -0,0 +1,212 @@
+"""
+Synthetic eBay-like site for benchmarks
+Serves a home page with the header search form and search results pages with a
+configurable number of result cards and a large filter rail, using the same markup
+the page objects' selectors target, from a local HTTP server
+"""
+
+import html
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+import logging
+
+from search_query import SEARCH_PATH, SearchQuery
+
+logger = logging.getLogger(__name__)
+
+TRANSMISSIONS = ("Manual", "Automatic")
+# Share of the total each transmission option advertises in the rail (and returns when applied)
+TRANSMISSION_SHARE = {"Manual": 0.3, "Automatic": 0.7}
+RESULTS_PER_CARD = 17
+
+
+def build_home_page() -> str:
+    """Home page with the header search form (GET /sch/i.html?_nkw=...)"""
+    return f"""<!DOCTYPE html>
+<html><head><title>Electronics, Cars, Fashion, Collectibles &amp; More | eBay</title></head>
+<body>
+<header><a href="/">eBay</a>
+<form id="gh-f" action="/{SEARCH_PATH}" method="get">
+<input id="gh-ac" type="text" name="_nkw" placeholder="Search for anything">
+<input type="hidden" name="_sacat" value="0">
+<button type="submit">Search</button>
+</form></header>
+<main><h2>Today's deals</h2></main>
+</body></html>"""
+
+
+def total_results(size: int) -> int:
+    """Advertised result count of an unfiltered search on a site of this size"""
+    return size * RESULTS_PER_CARD + 3
+
+
+def filtered_total(size: int, transmission: Optional[str]) -> int:
+    """Advertised result count with a transmission filter applied"""
+    total = total_results(size)
+    return int(total * TRANSMISSION_SHARE[transmission]) if transmission in TRANSMISSION_SHARE else total
+
+
+def _card(base_url: str, keyword: str, index: int) -> str:
+    item_id = 100000000000 + index
+    title = html.escape(f"{keyword} {1990 + index % 30} roadster listing {index}")
+    return f"""<li class="s-card" data-listingid="{item_id}"><div class="su-card-container">
+<div class="su-card-container__header"><a class="su-link" href="{base_url}itm/{item_id}">\
+<div class="s-card__title"><span class="su-styled-text primary">{title}</span></div></a></div>
+<div class="s-card__subtitle">Pre-owned &middot; Convertible</div>
+<span class="s-card__price">${5000 + index * 37:,}.00</span>
+<div class="s-card__attribute-row">Free delivery</div>
+<div class="s-card__attribute-row">Located in United States</div>
+</div></li>"""
+
+
+def _facet_group(name: str, options: List[tuple]) -> str:
+    checked = ' aria-checked="true"'
+    links = "".join(
+        f'<a class="x-refine__multi-select-link" href="{html.escape(href)}"{checked if selected else ""}>'
+        f'<span class="cbx x-refine__multi-select-cbx">{html.escape(label)}</span>'
+        f'<span class="x-refine__multi-select-histogram">({count:,})</span></a>'
+        for label, count, href, selected in options
+    )
+    return f'<li class="x-refine__main__list"><div class="x-refine__item">{html.escape(name)}</div>{links}</li>'
+
+
+def build_results_page(query: SearchQuery, size: int, facet_groups: int = 12, facet_options: int = 40) -> str:
+    """
+    Search results page for a query
+
+    Args:
+        query (SearchQuery): Search (keyword and aspect filters) being rendered
+        size (int): Result cards on an unfiltered page
+        facet_groups (int): Filler facets in the rail besides Transmission
+        facet_options (int): Options per filler facet
+
+    Returns:
+        str: HTML with the count heading, the left rail, the result cards and a disabled next-page link
+    """
+    selected = (query.aspects.get("Transmission") or [None])[0]
+    total = filtered_total(size, selected)
+    cards = min(size, total)
+    base_url = query.base_url
+
+    transmission = [(option, filtered_total(size, option),
+                     query.copy().without_aspect("Transmission").with_aspect("Transmission", option).to_url(),
+                     option == selected)
+                    for option in TRANSMISSIONS]
+    groups = [_facet_group("Transmission", transmission)]
+    for g in range(facet_groups):
+        name = f"Aspect {g}"
+        options = [(f"Option {g}-{o}", total // (o + 2),
+                    query.copy().with_aspect(name, f"Option {g}-{o}").to_url(), False)
+                   for o in range(facet_options)]
+        groups.append(_facet_group(name, options))
+
+    keyword = html.escape(query.keyword)
+    return f"""<!DOCTYPE html>
+<html><head><title>{keyword} for sale | eBay</title></head>
+<body>
+<header><a href="/">eBay</a>
+<form id="gh-f" action="/{SEARCH_PATH}" method="get">
+<input id="gh-ac" type="text" name="_nkw" placeholder="Search for anything" value="{keyword}">
+<button type="submit">Search</button>
+</form></header>
+<div class="srp-rail__left"><ul>{"".join(groups)}</ul></div>
+<div class="srp-main">
+<h1 class="srp-controls__count-heading"><span>{total:,}</span> <span>results for {keyword}</span></h1>
+<ul class="srp-results">{"".join(_card(base_url, query.keyword, i) for i in range(cards))}</ul>
+<nav><a class="pagination__next" aria-disabled="true">Next</a></nav>
+</div>
+</body></html>"""
+
+
+class SyntheticSite:
+    """Local HTTP server for the synthetic pages; use as a context manager"""
+
+    def __init__(self, size: int = 60, facet_groups: int = 12, facet_options: int = 40, host: str = "127.0.0.1",
+                 port: int = 0):
+        """
+        Args:
+            size (int): Result cards per unfiltered results page
+            facet_groups (int): Filler facets in the rail besides Transmission
+            facet_options (int): Options per filler facet
+            host (str): Interface to listen on
+            port (int): Port (0 picks a free one)
+        """
+        self.size = size
+        self.facet_groups = facet_groups
+        self.facet_options = facet_options
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        # pages are rendered once per URL so server time stays out of the measurements
+        self._pages: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Site root, e.g. http://127.0.0.1:50123/"""
+        return f"http://{self.host}:{self.port}/"
+
+    def render(self, path: str) -> Optional[bytes]:
+        """
+        Body for a request path ('/' or '/sch/i.html?...'), or None if the path is unknown
+        """
+        with self._lock:
+            cached = self._pages.get(path)
+        if cached is not None:
+            return cached
+        route = path.split("?", 1)[0]
+        if route == "/":
+            body = build_home_page()
+        elif route == f"/{SEARCH_PATH}":
+            query = SearchQuery.from_url(self.url.rstrip("/") + path)
+            body = build_results_page(query, self.size, self.facet_groups, self.facet_options)
+        else:
+            return None
+        encoded = body.encode("utf-8")
+        with self._lock:
+            self._pages[path] = encoded
+        return encoded
+
+    def _handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = site.render(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("synthetic site: " + format, *args)
+
+        return Handler
+
+    def start(self) -> "SyntheticSite":
+        """Start serving in a background thread"""
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="synthetic-site", daemon=True)
+        self._thread.start()
+        logger.info("Synthetic site (%s cards) serving at %s", self.size, self.url)
+        return self
+
+    def stop(self) -> None:
+        """Stop the server"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "SyntheticSite":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,96 @@
+import re
+import urllib.request
+
+from benchmark import BenchmarkResult, CallCounter, compare
+from wait_engine import WaitEngine
+from search_results_page import parse_result_count
+from synthetic_site import SyntheticSite, filtered_total
+
+
+def _result(case, median_ms, calls, size=60):
+    return BenchmarkResult(case, size, 20, median_ms, median_ms, median_ms, median_ms, calls)
+
+
+def test_compare_flags_slowdowns_over_threshold_and_any_extra_api_calls():
+    baseline = {r.key: r for r in [_result("base.get_text", 10.0, 3), _result("results.get_result_titles", 0.5, 2),
+                                   _result("results.filter_by_transmission", 40.0, 12)]}
+    current = [_result("base.get_text", 14.0, 3), _result("results.get_result_titles", 1.5, 2),
+               _result("results.filter_by_transmission", 41.0, 14), _result("base.fill", 5.0, 4)]
+
+    found = {(r.case, r.metric) for r in compare(baseline, current, threshold=0.25, min_delta_ms=2.0)}
+    assert found == {("base.get_text", "median_ms"), ("results.filter_by_transmission", "api_calls")}
+
+
+def test_synthetic_results_page_serves_requested_cards_and_filtered_count():
+    with SyntheticSite(size=240, facet_groups=2, facet_options=5) as site:
+        url = f"{site.url}sch/i.html?_nkw=mazda+mx-5&_sacat=0&Transmission=Manual"
+        body = urllib.request.urlopen(url).read().decode("utf-8")
+
+    heading = re.search(r'<h1 class="srp-controls__count-heading"><span>([^<]*)</span>', body).group(1)
+    assert parse_result_count(heading) == filtered_total(240, "Manual")
+    assert body.count("data-listingid=") == 240
+    assert 'aria-checked="true"><span class="cbx x-refine__multi-select-cbx">Manual' in body
+
+
+class FakeLocator:
+    __module__ = "playwright.sync_api._generated"
+
+    def count(self):
+        return 3
+
+
+class FakePage:
+    __module__ = "playwright.sync_api._generated"
+
+    url = "http://127.0.0.1/"
+
+    def locator(self, selector):
+        return FakeLocator()
+
+    def evaluate(self, script, arg=None):
+        return isinstance(arg, FakeLocator)
+
+    def expect_response(self, url_or_predicate, timeout=None):
+        return FakeExpectation()
+
+
+class FakeExpectation:
+    value = "response"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeContext:
+    __module__ = "playwright.sync_api._generated"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def new_page(self):
+        return FakePage()
+
+
+def test_call_counter_counts_calls_through_handed_out_objects():
+    counter = CallCounter()
+    page = counter.wrap(FakePage())
+
+    locator = page.locator("li")
+    assert locator.count() == 3
+    assert page.evaluate("(el) => el", locator) is True
+    assert page.url == "http://127.0.0.1/"
+    assert counter.calls == 3
+
+
+def test_counted_objects_keep_working_as_context_managers():
+    counter = CallCounter()
+    with counter.wrap(FakeContext()) as context:
+        page = context.new_page()
+    assert WaitEngine(page).for_response("**/sch/**", lambda: None) == "response"
+    assert counter.calls == 2
@@ -0,0 +1,41 @@
+from browser_pool import ContextPool
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    def new_page(self):
+        self.pages.append(object())
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **options):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+def test_release_closes_the_context_and_keeps_the_pool_warm():
+    hooked = []
+    pool = ContextPool(FakeBrowser(), size=2, on_create=[hooked.append])
+    pool.fill()
+
+    for _ in range(5):
+        context = pool.acquire()
+        assert context.pages and context in hooked
+        pool.release(context)
+        assert context.closed
+        assert len(pool._idle) == 2
+
+    # every acquire was served warm: 2 initial contexts plus one replacement per release
+    assert pool.created == 7
+    pool.close()
+    assert all(context.closed for context in hooked)
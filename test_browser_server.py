@@ -0,0 +1,79 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+
+from browser_server import _read_ws_endpoint, connect_or_launch, read_endpoint, stop_server
+
+
+class FakeBrowserType:
+    name = "chromium"
+
+    def __init__(self, connect_error=None):
+        self.connect_error = connect_error
+        self.calls = []
+
+    def connect(self, ws_endpoint, timeout=None):
+        self.calls.append(("connect", ws_endpoint))
+        if self.connect_error:
+            raise self.connect_error
+        return "connected"
+
+    def launch(self, **options):
+        self.calls.append(("launch", options))
+        return "launched"
+
+
+def _write_endpoint(path, pid, headless=True):
+    path.write_text(json.dumps({"ws_endpoint": "ws://127.0.0.1:1234/abc", "pid": pid, "browser": "chromium",
+                                "started_at": "", "options": {"headless": headless}}))
+
+
+def test_stale_endpoint_is_removed_and_session_launches_locally(tmp_path):
+    endpoint = tmp_path / "browser_server.json"
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    _write_endpoint(endpoint, exited.pid)
+
+    browser_type = FakeBrowserType()
+    assert connect_or_launch(browser_type, {"headless": True}, str(endpoint)) == "launched"
+    assert browser_type.calls == [("launch", {"headless": True})]
+    assert not endpoint.exists()
+
+
+def test_running_server_is_used_and_failures_fall_back(tmp_path):
+    endpoint = tmp_path / "browser_server.json"
+    _write_endpoint(endpoint, os.getpid())
+    assert read_endpoint(str(endpoint))["ws_endpoint"] == "ws://127.0.0.1:1234/abc"
+
+    assert connect_or_launch(FakeBrowserType(), {"headless": True}, str(endpoint)) == "connected"
+    assert connect_or_launch(FakeBrowserType(), {"headless": False}, str(endpoint)) == "launched"
+    assert connect_or_launch(FakeBrowserType(ConnectionError("refused")), {}, str(endpoint)) == "launched"
+
+
+def test_endpoint_is_read_from_the_new_part_of_the_server_log(tmp_path):
+    log = tmp_path / "browser_server.log"
+    log.write_text("ws://127.0.0.1:1111/old\n")
+    offset = log.stat().st_size
+    assert _read_ws_endpoint(str(log), offset) is None
+
+    with open(log, 'a') as f:
+        f.write("Launching chromium\nws://127.0.0.1:2222/new\n")
+    assert _read_ws_endpoint(str(log), offset) == "ws://127.0.0.1:2222/new"
+
+
+def test_stop_signals_the_server_process_group_and_removes_the_endpoint(tmp_path):
+    endpoint = tmp_path / "browser_server.json"
+    server = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"], start_new_session=True)
+    _write_endpoint(endpoint, server.pid)
+    # reap the child as soon as it exits, as init does for a real detached server
+    reaper = threading.Thread(target=server.wait)
+    reaper.start()
+
+    assert stop_server(str(endpoint)) is True
+    reaper.join(timeout=10)
+    assert server.returncode == -signal.SIGTERM
+    assert not endpoint.exists()
+    assert stop_server(str(endpoint)) is False
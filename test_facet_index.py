@@ -0,0 +1,39 @@
+from facet_index import FacetIndex
+
+URL = "https://www.ebay.com/sch/i.html?_nkw=mazda+mx-5"
+RAW = [
+    {"facet": "Transmission", "options": [
+        {"label": "Manual", "count": 1204, "href": URL + "&Transmission=Manual", "selected": True},
+        {"label": "Automatic", "count": None, "href": URL + "&Transmission=Automatic", "selected": False}]},
+    {"facet": "Body  Type", "options": [{"label": "Convertible", "count": 96, "href": ""}]},
+    # a repeated facet name (e.g. a 'more filters' copy) never overrides the first group
+    {"facet": "Transmission", "options": [{"label": "Manual", "count": 1, "href": "", "selected": False}]},
+]
+
+
+def test_from_raw_keeps_rail_order_and_the_first_group_of_a_repeated_facet():
+    index = FacetIndex.from_raw(URL, RAW)
+
+    assert len(index) == 2 and index.facet_names() == ["Transmission", "Body  Type"]
+    assert index.get("Transmission", "Manual").count == 1204
+    assert index.selected() == {"Transmission": ["Manual"]}
+    assert len(FacetIndex.from_raw(URL, None)) == 0
+
+
+def test_lookups_ignore_case_and_whitespace():
+    index = FacetIndex.from_raw(URL, RAW)
+
+    assert index.get(" body type ", "CONVERTIBLE").count == 96
+    assert "transmission" in index and "Make" not in index
+    assert list(index.options("TRANSMISSION")) == ["Manual", "Automatic"]
+    assert index.get("Transmission", "CVT") is None and index.options("Make") == {}
+
+
+def test_count_matches_compares_the_advertised_count_with_a_total():
+    index = FacetIndex.from_raw(URL, RAW)
+
+    assert index.count_matches("Transmission", "Manual", 1204) is True
+    assert index.count_matches("Transmission", "Manual", 1203) is False
+    # unknown count or option: nothing to compare
+    assert index.count_matches("Transmission", "Automatic", 10) is None
+    assert index.count_matches("Make", "Mazda", 10) is None
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from instrumentation import RECORDER, LatencyHistogram, attribute_to, current_test_id, timed
+
+
+class FakePage:
+    @timed()
+    def get_text(self, selector):
+        return "text"
+
+    @timed(false_is_error=True)
+    def wait_for_element(self, selector):
+        return False
+
+    @timed()
+    def click(self, selector):
+        raise RuntimeError("detached")
+
+    @timed()
+    async def fill(self, selector):
+        await asyncio.sleep(0)
+
+
+def test_timed_records_per_test_actions_and_errors():
+    page = FakePage()
+    page.get_text("#a")
+    page.get_text("#a")
+    page.wait_for_element("#b")
+    with pytest.raises(RuntimeError):
+        page.click("#c")
+
+    rows = {(r["action"], r["selector"]): r for r in RECORDER.test_summary(current_test_id())}
+    assert rows[("get_text", "#a")]["count"] == 2 and rows[("get_text", "#a")]["errors"] == 0
+    assert rows[("wait_for_element", "#b")]["errors"] == 1
+    assert rows[("click", "#c")]["errors"] == 1
+    assert {r["page"] for r in rows.values()} == {"FakePage"}
+
+
+def test_latency_histogram_percentiles():
+    hist = LatencyHistogram()
+    for ms in [3] * 90 + [150] * 10:
+        hist.add(ms)
+    assert hist.percentile(50) == 5  # upper bound of the 2-5ms bucket
+    assert hist.percentile(95) == 150  # 100-200ms bucket, capped at the max seen
+    assert hist.to_dict()["count"] == 100
+
+
+def test_concurrent_flows_record_against_their_own_test():
+    page = FakePage()
+
+    async def flow(test_id):
+        with attribute_to(test_id):
+            for _ in range(3):
+                await page.fill("#q")
+
+    async def run():
+        await asyncio.gather(flow("flow-a"), flow("flow-b"))
+
+    outer = current_test_id()
+    asyncio.run(run())
+
+    assert current_test_id() == outer
+    assert [r["count"] for r in RECORDER.pop_test("flow-a")] == [3]
+    assert [r["count"] for r in RECORDER.pop_test("flow-b")] == [3]
+    assert all(r["action"] != "fill" for r in RECORDER.test_summary(outer))
@@ -0,0 +1,34 @@
+from listings import Listing, ListingSet
+
+
+def make_set():
+    return ListingSet.from_columns({
+        "item_id": ["1", "2", "2", "3"],
+        "title": ["2006 Mazda MX-5 Miata", "1991 Mazda Miata", "1991 Mazda Miata", "Mazda MX-5 floor mats"],
+        "price": [9500.0, 6200.0, 6200.0, None],
+        "price_text": ["$9,500.00", "$6,200.00", "$6,200.00", ""],
+        "url": ["https://www.ebay.com/itm/1", "https://www.ebay.com/itm/2", "https://www.ebay.com/itm/2", ""],
+    })
+
+
+def test_listing_set_columns_and_records():
+    listings = make_set()
+    assert len(listings) == 4
+    assert listings[0] == Listing("1", "2006 Mazda MX-5 Miata", 9500.0, "$9,500.00",
+                                  "https://www.ebay.com/itm/1", "", "", "")
+    assert listings[-1].price is None
+    assert [l.item_id for l in listings[1:3]] == ["2", "2"]
+
+
+def test_listing_set_filter_dedup_and_aggregates():
+    listings = make_set()
+    unique = listings.dedup()
+    assert unique.item_id == ["1", "2", "3"]
+    assert unique.price_stats() == {"count": 3, "priced": 2, "min": 6200.0, "median": 7850.0, "max": 9500.0}
+    assert unique.year_histogram() == {1991: 1, 2006: 1}
+    assert unique.filter(keyword="mx-5").count() == 2
+    assert unique.filter(max_price=7000).titles() == ["1991 Mazda Miata"]
+
+    merged = ListingSet.from_listings(unique[:1])
+    merged.extend(unique[1:])
+    assert merged.item_id == unique.item_id
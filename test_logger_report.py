@@ -0,0 +1,64 @@
+import logger_report
+
+
+def test_report_streams_rows_and_finishes_with_summary(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    report = logger_report.TestReport(report_file="run.html")
+    report.add_result("test_a", "PASS", duration=1.5)
+    report.add_result("test_<b>", "FAIL", message="assert 1 < 2", screenshot="screenshots/b.jpg")
+
+    partial = report.report_path.read_text(encoding="utf-8")
+    assert partial.count('class="result-item"') == 2
+    assert "test_&lt;b&gt;" in partial and "assert 1 &lt; 2" in partial
+    assert "</html>" not in partial
+
+    report.generate_report()
+    final = report.report_path.read_text(encoding="utf-8")
+    assert final.rstrip().endswith("</html>")
+    assert '<div class="summary-value fail">1</div>' in final
+    assert '<div class="summary-value">1.50s</div>' in final
+
+
+def test_merge_shards_orders_results_across_workers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    shards = {worker: logger_report.TestReport(report_file=f"{worker}.html", shard_file=str(tmp_path / f"{worker}.jsonl"))
+              for worker in ("gw0", "gw1")}
+    for name, worker in (("t1", "gw0"), ("t2", "gw1"), ("t3", "gw0")):
+        shards[worker].add_result(name, "PASS", worker=worker)
+    for shard in shards.values():
+        shard.generate_report()
+
+    merged = logger_report.TestReport.merge_shards([s.shard_path for s in shards.values()], report_file="merged.html")
+    merged.generate_report()
+    html = merged.report_path.read_text(encoding="utf-8")
+    assert html.index(">t1<") < html.index(">t2<") < html.index(">t3<")
+    assert merged.total_tests == 3 and merged.workers == {"gw0", "gw1"}
+    assert not (tmp_path / "reports" / "gw0.html").exists()
+
+
+def test_queued_records_keep_the_values_of_mutable_args(tmp_path):
+    import logging
+    import queue
+
+    handler = logger_report.BufferedFileHandler(tmp_path / "queued.log")
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = logger_report.BatchingQueueListener(log_queue, handler, batch_size=2)
+    log = logging.getLogger("test_queued_logging")
+    log.propagate = False
+    log.addHandler(logger_report.LazyQueueHandler(log_queue))
+    state = {"page": 0}
+    listener.start()
+    try:
+        for i in range(5):
+            state["page"] = i
+            log.warning("line %d %s", i, state)
+        # changed after logging, possibly before the listener formats the records
+        state["page"] = "changed"
+    finally:
+        listener.stop()
+        handler.close()
+        log.handlers.clear()
+
+    lines = (tmp_path / "queued.log").read_text().splitlines()
+    assert lines == [f"WARNING line {i} {{'page': {i}}}" for i in range(5)]
@@ -0,0 +1,74 @@
+from network_router import RequestRouter
+
+
+class FakeFrame:
+    def __init__(self, parent_frame=None):
+        self.parent_frame = parent_frame
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type, navigation=False, frame=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.navigation = navigation
+        self.frame = frame or FakeFrame()
+
+    def is_navigation_request(self):
+        return self.navigation
+
+
+class FakeRoute:
+    def __init__(self):
+        self.outcome = None
+
+    def fallback(self):
+        self.outcome = ("fallback",)
+
+    def fulfill(self, status, body, content_type):
+        self.outcome = ("fulfill", status, content_type)
+
+    def abort(self, error_code=None):
+        self.outcome = ("abort", error_code)
+
+
+def _route(router, request):
+    route = FakeRoute()
+    router.handle(route, request)
+    return route.outcome
+
+
+def _router():
+    return RequestRouter(block_resource_types=["image", "font"], block_url_patterns=["*/ads/*"],
+                         block_third_party=True, first_party_domains=["ebay.com", "ebaystatic.com"],
+                         stub_resource_types=["script"], estimated_bytes={"image": 1000})
+
+
+def test_requests_are_blocked_by_type_pattern_and_third_party_host():
+    router = _router()
+    assert router.block_reason("https://i.ebayimg.com/a.jpg", "image") == "resource_type"
+    assert router.block_reason("https://www.ebay.com/ads/slot.js", "script") == "url_pattern"
+    assert router.block_reason("https://tracker.example.net/t.js", "script") == "third_party"
+    assert router.block_reason("https://ir.ebaystatic.com/app.js", "script") is None
+    assert router.block_reason("data:image/png;base64,AAAA", "xhr") is None
+    # the page itself is never blocked, even from a third-party host
+    assert router.block_reason("https://signin.example.net/", "document", is_main_navigation=True) is None
+
+
+def test_blocked_requests_are_stubbed_or_aborted_and_counted():
+    router = _router()
+    assert _route(router, FakeRequest("https://www.ebay.com/sch/i.html", "document", navigation=True)) == ("fallback",)
+    assert _route(router, FakeRequest("https://i.ebayimg.com/a.jpg", "image")) == ("abort", "blockedbyclient")
+    assert _route(router, FakeRequest("https://tracker.example.net/t.js", "script")) == (
+        "fulfill", 200, "application/javascript")
+    # a navigation inside an iframe is a subresource of the page and can be blocked
+    ad_frame = FakeRequest("https://ads.example.net/frame", "document", navigation=True,
+                           frame=FakeFrame(parent_frame=FakeFrame()))
+    assert _route(router, ad_frame) == ("abort", "blockedbyclient")
+
+    assert router.summary() == {
+        "requests_seen": 4,
+        "requests_blocked": 3,
+        "requests_stubbed": 1,
+        "bytes_saved_estimate": 1000 + 25000 + 20000,
+        "blocked_by_reason": {"resource_type": 1, "third_party": 2},
+    }
@@ -0,0 +1,33 @@
+from run_history import RunHistory, percentile
+
+
+def _run(run_id, day, results):
+    return [{"run_id": run_id, "name": name, "status": status, "duration": duration,
+             "timestamp": f"2026-01-{day:02d}T10:00:00"} for name, status, duration in results]
+
+
+def test_run_history_percentiles_slowdowns_and_flakiness(tmp_path):
+    history = RunHistory(str(tmp_path / "history.sqlite"))
+    for day in range(1, 11):
+        history.ingest(_run(f"r{day}", day, [
+            ("test_stable", "PASS", 2.0),
+            ("test_slower", "PASS", 1.0 if day <= 7 else 3.0),
+            ("test_flaky", "FAIL" if day % 3 == 0 else "PASS", 1.0),
+        ]))
+
+    stats = {s.test_id: s for s in history.duration_stats()}
+    assert stats["test_stable"].runs == 10 and stats["test_stable"].p50 == 2.0
+    assert stats["test_slower"].p50 == 1.0 and stats["test_slower"].p95 == 3.0
+
+    assert [s.test_id for s in history.slowdowns(recent=3, baseline=7)] == ["test_slower"]
+
+    flaky = history.flaky_tests(runs=10)
+    assert [f.test_id for f in flaky] == ["test_flaky"]
+    assert flaky[0].failures == 3 and flaky[0].flips == 6
+    history.close()
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 95) == 0.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 95) == 4.0
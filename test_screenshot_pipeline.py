@@ -0,0 +1,20 @@
+from screenshot_pipeline import ScreenshotPolicy, ScreenshotWriter
+
+
+class FakePage:
+    def screenshot(self, **options):
+        return b"\xff\xd8fake"
+
+
+def test_retention_only_expires_files_the_writer_produced(tmp_path):
+    kept = tmp_path / "baseline.png"
+    kept.write_bytes(b"png")
+    writer = ScreenshotWriter(ScreenshotPolicy(mode="always", max_files=2, directory=str(tmp_path)))
+
+    paths = [writer.capture(FakePage(), f"test_{i}") for i in range(3)]
+    writer.flush()
+    writer.close()
+
+    assert kept.exists()
+    assert [p.exists() for p in paths] == [False, True, True]
+    assert paths[0].name == "capture_test_0.jpg"
@@ -0,0 +1,24 @@
+from facet_index import FacetIndex
+from search_matrix import expand_matrix, filtered_url, group_by_query
+from search_query import SearchQuery
+
+
+def test_cases_are_grouped_by_query_once_per_filter_combination():
+    cases = expand_matrix({"queries": ["mazda mx-5", "honda s2000", "mazda mx-5"],
+                           "filters": [{"Transmission": "Manual"}, {"Transmission": ["Manual", "Automatic"]}]})
+
+    groups = group_by_query(cases)
+
+    assert list(groups) == ["mazda mx-5", "honda s2000"]
+    assert groups["mazda mx-5"] == [(("Transmission", ("Manual",)),), (("Transmission", ("Manual", "Automatic")),)]
+
+
+def test_filtered_url_prefers_the_facet_link_of_the_cached_results_page():
+    base = SearchQuery("mazda mx-5")
+    index = FacetIndex.from_raw(base.to_url(), [{"facet": "Transmission", "options": [
+        {"label": "Manual", "count": 12, "href": "https://www.ebay.com/sch/i.html?_nkw=mazda+mx-5&Transmission=Manual"}]}])
+
+    assert filtered_url(base, (("Transmission", ("Manual",)),), index).endswith("Transmission=Manual")
+    composed = filtered_url(base, (("Transmission", ("Automatic",)),), index)
+    assert composed == base.copy().with_aspect("Transmission", "Automatic").to_url()
+    assert base.aspects == {}
@@ -0,0 +1,57 @@
+import pytest
+
+from search_query import SearchQuery, aspect_query
+
+
+def test_search_query_builds_filtered_url():
+    query = (SearchQuery("mazda mx-5")
+             .in_category(6001)
+             .with_aspect("Transmission", "Manual")
+             .with_aspect("Body Type", "Convertible", "Coupe")
+             .price_range(5000, 20000)
+             .with_condition("used")
+             .sorted_by("price_low")
+             .per_page(240))
+
+    assert query.to_url() == (
+        "https://www.ebay.com/sch/i.html?_nkw=mazda+mx-5&_sacat=6001&_udlo=5000&_udhi=20000"
+        "&LH_ItemCondition=3000&_sop=15&_ipg=240&Transmission=Manual&Body%2520Type=Convertible%7CCoupe"
+    )
+    assert SearchQuery.from_url(query.to_url()) == query
+
+
+def test_search_query_from_results_url_ignores_tracking_params():
+    url = "https://www.ebay.com/sch/i.html?_from=R40&_trksid=p2380057.m570.l1313&_nkw=mazda+mx-5&_sacat=0"
+    query = SearchQuery.from_url(url)
+    assert query.keyword == "mazda mx-5"
+    assert query.aspects == {}
+    assert query.copy().with_aspect("Transmission", "Manual") == aspect_query("mazda mx-5", {"Transmission": "Manual"})
+
+
+def test_search_query_keeps_other_ebay_params_verbatim():
+    url = ("https://www.ebay.com/sch/i.html?_nkw=mazda+mx-5&_sacat=0&_odkw=mazda+mx-5&_dcat=6001"
+           "&LH_BIN=1&Body%2520Type=Convertible")
+    query = SearchQuery.from_url(url)
+    assert query.aspects == {"Body Type": ["Convertible"]}
+    assert query.extra_params == [("_odkw", "mazda+mx-5"), ("_dcat", "6001"), ("LH_BIN", "1")]
+    assert "&_odkw=mazda+mx-5&_dcat=6001&LH_BIN=1&" in query.to_url()
+    assert SearchQuery.from_url(query.to_url()) == query
+
+
+def test_search_query_from_url_tolerates_bad_prices_and_keeps_literal_percent_in_aspects():
+    query = SearchQuery("mazda mx-5").with_aspect("Model", "MX-5 100%25 Edition", "NA|NB")
+    url = query.to_url()
+    assert "Model=MX-5%2520100%252525%2520Edition%7CNA%257CNB" in url
+    assert SearchQuery.from_url(url).aspects == {"Model": ["MX-5 100%25 Edition", "NA|NB"]}
+
+    odd = SearchQuery.from_url(
+        "https://www.ebay.com/sch/i.html?_nkw=miata&_udlo=abc&_udhi=9000&Transmission=Manual|Automatic")
+    assert (odd.min_price, odd.max_price) == (None, 9000.0)
+    assert odd.aspects == {"Transmission": ["Manual", "Automatic"]}
+
+
+def test_search_query_rejects_unknown_options():
+    with pytest.raises(ValueError):
+        SearchQuery("miata").sorted_by("cheapest")
+    with pytest.raises(ValueError):
+        SearchQuery("miata").per_page(50)
@@ -0,0 +1,126 @@
+from listings import ListingSet
+from search_results_page import EBaySearchResultsPage, ResultsState
+
+BASE = "https://www.ebay.com/sch/i.html?_nkw=mazda+mx-5"
+# page URL -> (item ids on the page, next-page URL)
+RESULT_PAGES = {
+    BASE: (["101", "102"], BASE + "&_pgn=2"),
+    BASE + "&_pgn=2": (["102", "103"], BASE + "&_pgn=3"),
+    BASE + "&_pgn=3": (["104"], None),
+}
+
+
+class FakeTab:
+    def __init__(self, context, url="about:blank"):
+        self.context = context
+        self.url = url
+        self.closed = False
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def set_default_navigation_timeout(self, timeout):
+        pass
+
+    def goto(self, url, wait_until=None):
+        self.context.navigations.append(url)
+        self.url = url
+
+    def wait_for_load_state(self, state, timeout=None):
+        pass
+
+    def evaluate(self, script, selectors):
+        ids, next_url = RESULT_PAGES[self.url]
+        return {"columns": {"item_id": ids, "title": [f"Mazda MX-5 {i}" for i in ids]}, "next": next_url}
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.tabs = []
+        self.navigations = []
+
+    def new_page(self):
+        tab = FakeTab(self)
+        self.tabs.append(tab)
+        return tab
+
+
+def _results_page():
+    context = FakeContext()
+    return EBaySearchResultsPage(FakeTab(context, BASE)), context
+
+
+def test_pages_are_prefetched_deduplicated_and_iteration_stops_on_the_last_page():
+    results, context = _results_page()
+    listings = results.iter_listings()
+
+    first = next(listings)
+    # page 2 was already requested before the first listing of page 1 was handed out
+    assert first.item_id == "101" and context.navigations == [BASE + "&_pgn=2"]
+
+    assert [first.item_id] + [listing.item_id for listing in listings] == ["101", "102", "103", "104"]
+    # the last page has no next link, so nothing is requested after page 3
+    assert context.navigations == [BASE + "&_pgn=2", BASE + "&_pgn=3"]
+    assert len(context.tabs) == 2 and all(tab.closed for tab in context.tabs)
+    assert results.page.url == BASE and not results.page.closed
+
+
+def test_prefetch_tabs_are_closed_when_the_caller_stops_early():
+    results, context = _results_page()
+    assert [listing.item_id for listing in results.iter_listings(max_items=1)] == ["101"]
+    assert all(tab.closed for tab in context.tabs)
+
+    results, context = _results_page()
+    listings = results.iter_listings(max_pages=2)
+    next(listings)
+    listings.close()
+    assert context.navigations == [BASE + "&_pgn=2"]
+    assert context.tabs and all(tab.closed for tab in context.tabs)
+
+
+class RaillessTab(FakeTab):
+    def __init__(self, context, url):
+        super().__init__(context, url)
+        self.selector_waits = 0
+        self.rail = []
+
+    def wait_for_selector(self, selector, state, timeout):
+        self.selector_waits += 1
+        raise TimeoutError(f"{selector} not {state} after {timeout} ms")
+
+    def evaluate(self, script, selectors):
+        return self.rail
+
+
+def test_a_results_page_without_a_rail_is_waited_for_only_once():
+    tab = RaillessTab(FakeContext(), BASE)
+    results = EBaySearchResultsPage(tab)
+
+    assert len(results.get_facet_index()) == 0
+    assert len(results.get_facet_index()) == 0
+    assert tab.selector_waits == 1
+
+    # a rail that renders later is still picked up by the next call
+    tab.rail = [{"facet": "Transmission", "options": [{"label": "Manual", "count": 3, "href": BASE + "&Transmission=Manual"}]}]
+    assert results.get_facet_index().get("Transmission", "Manual").count == 3
+    assert tab.selector_waits == 1
+
+
+def test_results_state_marks_railless_queries_and_evicts_the_oldest():
+    state = ResultsState(facet_cache_size=2)
+    assert state.cached_facets("q1") == (None, True)
+    state.store_facets("q1", "https://example.test/q1", [])
+    assert state.cached_facets("q1") == (None, False)
+    state.store_facets("q2", "https://example.test/q2", [])
+    state.store_facets("q3", "https://example.test/q3", [])
+    assert state.cached_facets("q1") == (None, True)
+
+    listings = ListingSet()
+    state.store_listings("https://example.test/q3", listings)
+    assert state.listings("https://example.test/q3") is listings
+    assert state.listings("https://example.test/q2") is None
+    state.drop_listings()
+    assert state.listings("https://example.test/q3") is None
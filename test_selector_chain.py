@@ -0,0 +1,42 @@
+import json
+
+import selector_chain
+from selector_chain import SelectorCache, SelectorChain, resolve_chain
+
+CHAIN = SelectorChain("result_items", "div.su-card-container", "li.s-item")
+
+
+def test_chain_is_the_union_of_its_candidates_and_ranks_the_cached_winner_first():
+    assert CHAIN == "div.su-card-container, li.s-item"
+    assert CHAIN.ranked("li.s-item") == ("li.s-item", "div.su-card-container")
+    assert CHAIN.ranked("gone") == CHAIN.candidates
+
+
+def test_probe_winner_is_cached_on_disk_and_tried_first_next_run(tmp_path, monkeypatch):
+    path = tmp_path / "selector_cache.json"
+    monkeypatch.setattr(selector_chain, "SELECTOR_CACHE", SelectorCache(str(path)))
+
+    class Handle:
+        def __init__(self, value):
+            self.value = value
+
+        def json_value(self):
+            return self.value
+
+    class FakePage:
+        probes = []
+
+        def wait_for_function(self, script, arg, timeout):
+            self.probes.append(arg["candidates"])
+            # the primary selector is broken; the fallback matches
+            return Handle("li.s-item")
+
+    assert resolve_chain(FakePage(), CHAIN, "search_results", 1000) == "li.s-item"
+    assert json.loads(path.read_text()) == {"search_results": {"result_items": "li.s-item"}}
+    assert selector_chain.SELECTOR_CACHE.verified("search_results", "result_items") == "li.s-item"
+
+    # a later run loads the file and probes the previous winner first
+    monkeypatch.setattr(selector_chain, "SELECTOR_CACHE", SelectorCache(str(path)))
+    assert selector_chain.SELECTOR_CACHE.verified("search_results", "result_items") is None
+    resolve_chain(FakePage(), CHAIN, "search_results", 1000)
+    assert FakePage.probes[-1] == ["li.s-item", "div.su-card-container"]
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from settings import Settings, cli_overrides
+
+
+def _write(tmp_path, data):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(data))
+    return path
+
+
+def test_cli_overrides_win_over_environment_and_file(tmp_path):
+    path = _write(tmp_path, {"timeouts": {"default": 30000, "navigation": 45000}, "browser_config": {"headless": True}})
+    environ = {"EBAY_TIMEOUTS__DEFAULT": "60000", "EBAY_TIMEOUTS__NAVIGATION": "50000", "HOME": "/root"}
+
+    settings = Settings.load(path, cli_overrides(["timeouts.navigation=90000", "browser_config.headless=false"]),
+                             environ=environ)
+
+    assert settings.timeouts.default == 60000
+    assert settings.timeouts.navigation == 90000
+    assert settings.timeouts.element_wait == 10000
+    assert settings.launch_options == {"headless": False}
+
+
+def test_invalid_settings_are_reported_together(tmp_path):
+    path = _write(tmp_path, {"timeouts": {"default": "slow", "navigation": 0}, "web_vitals": {"mode": "strict"}})
+
+    with pytest.raises(ValueError) as excinfo:
+        Settings.load(path, environ={})
+
+    message = str(excinfo.value)
+    assert "timeouts.default must be int" in message
+    assert "timeouts.navigation must be positive" in message
+    assert "web_vitals.mode must be one of" in message
+
+
+def test_unknown_override_keys_are_warned_about(tmp_path, caplog):
+    path = _write(tmp_path, {"timeouts": {"default": 30000}, "browser_config": {"headless": True}})
+    environ = {"EBAY_TIMEOUTS__NAVIGATON": "50000", "EBAY_BROWSER_CONFIG__SLOW_MO": "100"}
+
+    with caplog.at_level("WARNING", logger="settings"):
+        settings = Settings.load(path, cli_overrides(["timeouts.page_ready=9000"]), environ=environ)
+
+    assert [r.getMessage().split(" (")[0] for r in caplog.records] == ["Unknown setting timeouts.navigaton"]
+    assert settings.timeouts.page_ready == 9000
+
+
+def test_search_settings_get_their_own_filter_and_matrix_dicts(tmp_path):
+    first = Settings.load(_write(tmp_path, {}), environ={})
+    first.test_data.filters["transmission"] = "Manual"
+    second = Settings.load(_write(tmp_path, {}), environ={})
+
+    assert second.test_data.filters == {} and second.test_data.matrix == {}
+    assert first.test_data.transmission == "Manual" and second.test_data.transmission is None
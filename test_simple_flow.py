@@ -1,20 +1,22 @@
-import json
-from pathlib import Path
 from home_page import EBayHomePage
+from search_matrix import MatrixScheduler, expand_matrix, group_by_query
 from search_results_page import EBaySearchResultsPage
 
-def load_config():
-    cfg_path = Path(__file__).resolve().parent / "config.json"
-    with open(cfg_path, 'r') as f:
-        return json.load(f)
 
+def pytest_generate_tests(metafunc):
+    """Parametrize the matrix test per search term from the session settings (--ebay-set applies)"""
+    if metafunc.function.__name__ == "test_search_filter_matrix":
+        matrix = metafunc.config.ebay_settings.test_data.matrix
+        metafunc.parametrize("query", list(group_by_query(expand_matrix(matrix))))
 
-def test_search_and_filter(page):
+
+def test_search_and_filter(pooled_page, settings):
     """Simple test that delegates all work to page-level helpers"""
-    config = load_config()
-    search_term = config["test_data"]["search_term"]
-    transmission = config["test_data"]["filters"]["transmission"]
+    search_term = settings.test_data.search_term
+    transmission = settings.test_data.transmission
+    filter_mode = settings.test_data.filter_mode
 
+    page = pooled_page
     home = EBayHomePage(page)
     home.navigate_to_home()
     home.search_for_item(search_term)
@@ -26,6 +28,17 @@ def test_search_and_filter(page):
     assert count > 0, f"Expected search results > 0 for '{search_term}'"
 
     # Apply filter and verify filtered count is <= original
-    filtered_count = results.apply_transmission_and_get_count(transmission)
+    filtered_count = results.apply_transmission_and_get_count(transmission, mode=filter_mode)
     assert filtered_count >= 0
     assert filtered_count <= count
+
+
+def test_search_filter_matrix(pooled_page, settings, query):
+    """Search a matrix term once and check every configured filter combination in extra tabs"""
+    scheduler = MatrixScheduler(pooled_page, max_tabs=settings.test_data.matrix.get("max_tabs", 4))
+    results = scheduler.run(case for case in expand_matrix(settings.test_data.matrix) if case.query == query)
+
+    assert scheduler.searches == 1
+    assert results and results[0].base_count > 0, f"Expected search results > 0 for '{query}'"
+    failed = [r.describe() + (f" ({r.error})" if r.error else "") for r in results if not r.passed]
+    assert not failed, "Filtered counts out of range: " + "; ".join(failed)
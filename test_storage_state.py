@@ -0,0 +1,54 @@
+import os
+import time
+
+from storage_state import StorageStateManager
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    def new_page(self):
+        return FakePage()
+
+    def storage_state(self, path):
+        with open(path, "w") as f:
+            f.write('{"cookies": [], "origins": []}')
+
+    def close(self):
+        pass
+
+
+class FakePage:
+    def goto(self, url, wait_until=None):
+        pass
+
+    def wait_for_function(self, script, arg, timeout):
+        raise TimeoutError("no consent banner")
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **options):
+        self.contexts.append(options)
+        return FakeContext(self)
+
+
+def test_snapshot_is_built_once_per_site_and_locale_until_it_expires(tmp_path):
+    manager = StorageStateManager(directory=str(tmp_path), ttl_hours=1)
+    browser = FakeBrowser()
+    options = {"locale": "en-US", "storage_state": "old.json"}
+
+    path = manager.get(browser, "https://www.ebay.com/", options)
+    assert path == tmp_path / "www.ebay.com_en-US.json" and path.exists()
+    assert browser.contexts == [{"locale": "en-US"}]
+
+    assert manager.get(browser, "https://www.ebay.com/", options) == path
+    assert len(browser.contexts) == 1
+
+    stale = time.time() - 2 * 3600
+    os.utime(path, (stale, stale))
+    manager.get(browser, "https://www.ebay.com/", options)
+    assert len(browser.contexts) == 2
@@ -0,0 +1,64 @@
+from trace_recorder import TracePolicy, start_test_chunk, start_tracing, stop_test_chunk
+
+
+class FakeTracing:
+    def __init__(self):
+        self.calls = []
+
+    def start(self, **options):
+        self.calls.append(("start", options))
+
+    def start_chunk(self, title=None):
+        self.calls.append(("start_chunk", title))
+
+    def stop_chunk(self, path=None):
+        self.calls.append(("stop_chunk", path))
+        if path:
+            open(path, "wb").close()
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+def test_chunks_are_kept_for_failing_or_slow_tests_only():
+    policy = TracePolicy(enabled=True, duration_budget_s=5)
+
+    assert policy.should_keep(failed=True, duration_s=0.2)
+    assert policy.should_keep(failed=False, duration_s=5.5)
+    assert not policy.should_keep(failed=False, duration_s=4.9)
+    # a duration_budget marker overrides the configured budget either way
+    assert policy.should_keep(failed=False, duration_s=2.0, budget_s=1.5)
+    assert not policy.should_keep(failed=False, duration_s=8.0, budget_s=10)
+    assert not TracePolicy(enabled=True).should_keep(failed=False, duration_s=600)
+
+
+def test_kept_chunks_are_written_and_passing_chunks_are_discarded(tmp_path):
+    policy = TracePolicy(enabled=True, directory=str(tmp_path / "traces"), sources=True)
+    context = FakeContext()
+    start_tracing(context, policy)
+    start_tracing(context, policy)
+
+    assert start_test_chunk(context, "test_search[chromium]")
+    assert stop_test_chunk(context) is None
+    assert start_test_chunk(context, "test_filter[chromium]")
+    path = policy.trace_path("test_filter[chromium]", "gw0_1")
+    assert stop_test_chunk(context, path) == path and path.exists()
+    assert path.name == "test_filter_chromium_gw0_1.zip"
+    # nothing is open any more, so a leftover cleanup writes nothing
+    assert stop_test_chunk(context, path) is None
+
+    assert context.tracing.calls == [
+        ("start", {"screenshots": True, "snapshots": True, "sources": True}),
+        ("start_chunk", "test_search[chromium]"), ("stop_chunk", None),
+        ("start_chunk", "test_filter[chromium]"), ("stop_chunk", str(path)),
+    ]
+
+
+def test_untraced_contexts_never_open_chunks():
+    context = FakeContext()
+    start_tracing(context, TracePolicy(enabled=False))
+
+    assert not start_test_chunk(context, "test_search[chromium]")
+    assert context.tracing.calls == []
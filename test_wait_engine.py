@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from wait_engine import CONTENT_CHANGED_JS, AsyncWaitEngine, WaitEngine
+
+
+class FakeExpectation:
+    value = "response"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakePage:
+    def __init__(self, fail_selectors=()):
+        self.fail_selectors = set(fail_selectors)
+        self.functions = []
+
+    def wait_for_selector(self, selector, state, timeout):
+        if selector in self.fail_selectors:
+            raise TimeoutError(f"{selector} not {state} after {timeout} ms")
+
+    def evaluate(self, script, arg=None):
+        return "1,204 results|https://www.ebay.com/sch/i.html?_nkw=mx-5"
+
+    def wait_for_function(self, script, arg=None, timeout=None):
+        self.functions.append((script, arg, timeout))
+
+    def expect_response(self, url_or_predicate, timeout):
+        return FakeExpectation()
+
+
+class FakeAsyncPage(FakePage):
+    async def wait_for_selector(self, selector, state, timeout):
+        super().wait_for_selector(selector, state, timeout)
+
+
+def test_waits_are_recorded_on_success_and_failure_and_summarized():
+    waits = WaitEngine(FakePage(fail_selectors=["#missing"]), default_timeout=500)
+    waits.for_selector(".srp-results")
+    waits.for_selector(".srp-results", state="attached")
+    with pytest.raises(TimeoutError):
+        waits.for_selector("#missing")
+    assert waits.for_response("**/sch/**", lambda: None) == "response"
+
+    assert [(t.name, t.target, t.ok) for t in waits.timings] == [
+        ("selector", ".srp-results", True), ("selector", ".srp-results", True),
+        ("selector", "#missing", False), ("response", "**/sch/**", True)]
+    summary = waits.summary()
+    assert {name: (s["count"], s["failed"]) for name, s in summary.items()} == {"selector": (3, 1), "response": (1, 0)}
+    assert summary["selector"]["max_ms"] <= summary["selector"]["total_ms"]
+
+
+def test_content_change_waits_for_a_new_signature_after_the_ready_element():
+    page = FakePage()
+    waits = WaitEngine(page, default_timeout=500)
+    before = waits.content_signature("h1.srp-controls__count-heading")
+    waits.for_content_change("h1.srp-controls__count-heading", before, ready_selector=".srp-results", timeout=900)
+
+    assert page.functions == [(CONTENT_CHANGED_JS, {"selector": "h1.srp-controls__count-heading", "previous": before,
+                                                    "ready": ".srp-results"}, 900)]
+    assert [(t.name, t.ok) for t in waits.timings] == [("content_change", True)]
+
+
+def test_async_engine_records_failed_waits_and_re_raises():
+    waits = AsyncWaitEngine(FakeAsyncPage(fail_selectors=["#missing"]), default_timeout=500)
+
+    async def run():
+        await waits.for_selector(".srp-results")
+        with pytest.raises(TimeoutError):
+            await waits.for_selector("#missing")
+
+    asyncio.run(run())
+    assert waits.summary()["selector"]["count"] == 2
+    assert waits.summary()["selector"]["failed"] == 1
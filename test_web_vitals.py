@@ -0,0 +1,37 @@
+from web_vitals import VitalsRecorder, check_budgets, failed_budgets, summarize, warned_budgets
+
+BUDGETS = {
+    "home": {"lcp_ms": 4000, "cls": 0.1},
+    "search_results": {"mode": "fail", "ttfb_ms": 2000, "transfer_kb": 6000},
+}
+
+
+def test_check_budgets_uses_page_type_limits_and_modes():
+    home = check_budgets("home", {"lcp_ms": 4200.5, "cls": 0.02, "ttfb_ms": 9000}, BUDGETS)
+    assert [(v.metric, v.mode) for v in home] == [("lcp_ms", "warn")]
+
+    results = check_budgets("search_results", {"ttfb_ms": 2500, "transfer_kb": None}, BUDGETS)
+    assert [(v.metric, v.value, v.limit, v.mode) for v in results] == [("ttfb_ms", 2500, 2000, "fail")]
+    assert check_budgets("item", {"lcp_ms": 99999}, BUDGETS) == []
+
+
+def test_budget_descriptions_split_by_mode():
+    samples = [
+        {"page_type": "home", "label": "navigate", "metrics": {"lcp_ms": 4200.5, "cls": 0.02},
+         "violations": [v._asdict() for v in check_budgets("home", {"lcp_ms": 4200.5}, BUDGETS)]},
+        {"page_type": "search_results", "label": "filter:Manual", "metrics": {"ttfb_ms": 2500},
+         "violations": [v._asdict() for v in check_budgets("search_results", {"ttfb_ms": 2500}, BUDGETS)]},
+    ]
+    assert warned_budgets(samples) == ["home lcp_ms 4200.5 > 4000 [navigate]"]
+    assert failed_budgets(samples) == ["search_results ttfb_ms 2500 > 2000 [filter:Manual]"]
+    assert summarize(samples[0]) == "home/navigate: LCP 4200.5, CLS 0.02"
+
+
+def test_routed_samples_keep_only_metrics_the_router_cannot_change():
+    recorder = VitalsRecorder()
+    recorder.configure({"enabled": True, "budgets": {"home": {"ttfb_ms": 1000, "lcp_ms": 100}}}, routed=True)
+
+    sample = recorder.record("home", "navigate", "https://www.ebay.com/",
+                             {"ttfb_ms": 1200, "dom_content_loaded_ms": 900, "lcp_ms": 300, "transfer_kb": 80})
+    assert sample["metrics"] == {"ttfb_ms": 1200, "dom_content_loaded_ms": 900, "lcp_ms": None, "transfer_kb": None}
+    assert [v["metric"] for v in sample["violations"]] == ["ttfb_ms"]
@@ -0,0 +1,126 @@
+"""
+Failure-only Playwright tracing
+Tracing starts once when a context is created; each test records one trace chunk
+that is written to disk only when the test fails or runs over its duration budget
+"""
+
+import re
+import weakref
+from pathlib import Path
+from typing import Optional
+import logging
+
+from playwright.sync_api import BrowserContext
+
+logger = logging.getLogger(__name__)
+
+# Contexts with tracing started -> title of the open chunk ('' when none is open)
+_TRACED = weakref.WeakKeyDictionary()
+
+
+class TracePolicy:
+    """Whether tracing is on, what it records and which chunks are kept"""
+
+    def __init__(self, enabled: bool = False, duration_budget_s: Optional[float] = None,
+                 directory: str = "traces", screenshots: bool = True, snapshots: bool = True,
+                 sources: bool = False):
+        """
+        Initialize the policy
+
+        Args:
+            enabled (bool): Record a trace chunk per test
+            duration_budget_s (float, optional): Also keep chunks of tests slower than this
+            directory (str): Where kept traces are written
+            screenshots (bool): Record screencast frames
+            snapshots (bool): Record DOM snapshots for each action
+            sources (bool): Embed test source files
+        """
+        self.enabled = enabled
+        self.duration_budget_s = duration_budget_s
+        self.directory = Path(directory)
+        self.start_options = {"screenshots": screenshots, "snapshots": snapshots, "sources": sources}
+
+    @classmethod
+    def from_config(cls, settings: dict) -> "TracePolicy":
+        """Build a policy from the 'tracing' section of config.json"""
+        return cls(
+            enabled=settings.get("enabled", False),
+            duration_budget_s=settings.get("duration_budget_s"),
+            directory=settings.get("directory", "traces"),
+            screenshots=settings.get("screenshots", True),
+            snapshots=settings.get("snapshots", True),
+            sources=settings.get("sources", False),
+        )
+
+    def should_keep(self, failed: bool, duration_s: float, budget_s: Optional[float] = None) -> bool:
+        """
+        Decide whether a test's chunk is written
+
+        Args:
+            failed (bool): The test failed
+            duration_s (float): Test call duration
+            budget_s (float, optional): Per-test budget overriding duration_budget_s
+        """
+        budget = budget_s if budget_s is not None else self.duration_budget_s
+        return failed or (budget is not None and duration_s > budget)
+
+    def trace_path(self, test_name: str, suffix: str) -> Path:
+        """Output path for a kept chunk"""
+        safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", test_name).strip("_")
+        return self.directory / f"{safe}_{suffix}.zip"
+
+
+def start_tracing(context: BrowserContext, policy: TracePolicy) -> None:
+    """Start tracing on a context once (e.g. as a ContextPool on_create hook)"""
+    if not policy.enabled or context in _TRACED:
+        return
+    context.tracing.start(**policy.start_options)
+    _TRACED[context] = ""
+
+
+def start_test_chunk(context: BrowserContext, title: str) -> bool:
+    """
+    Open a trace chunk for a test
+
+    Returns:
+        bool: True if the context is traced and the chunk started
+    """
+    if context not in _TRACED:
+        return False
+    if _TRACED[context]:
+        stop_test_chunk(context)
+    try:
+        context.tracing.start_chunk(title=title)
+    except Exception as e:
+        logger.warning("Could not start trace chunk for %s: %s", title, e)
+        return False
+    _TRACED[context] = title
+    return True
+
+
+def stop_test_chunk(context: BrowserContext, path: Optional[Path] = None) -> Optional[Path]:
+    """
+    Close the open chunk, writing it only when a path is given
+
+    Args:
+        context (BrowserContext): Traced context
+        path (Path, optional): Where to keep the chunk; None discards it
+
+    Returns:
+        Optional[Path]: Written trace file, or None if discarded or nothing was open
+    """
+    if not _TRACED.get(context):
+        return None
+    title = _TRACED[context]
+    _TRACED[context] = ""
+    try:
+        if path is None:
+            context.tracing.stop_chunk()
+            return None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        context.tracing.stop_chunk(path=str(path))
+        logger.info("Kept trace for %s: %s", title, path)
+        return path
+    except Exception as e:
+        logger.warning("Could not stop trace chunk for %s: %s", title, e)
+        return None
@@ -0,0 +1,270 @@
+"""
+Event-driven wait engine for page objects
+Waits for the signal that matters (URL change, text change, DOM mutation, response)
+instead of blanket load states, and records how long every wait took
+"""
+
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+# True once the element's text differs from the previous value
+TEXT_CHANGED_JS = """
+(a) => {
+    const el = document.querySelector(a.selector);
+    return !!el && el.textContent.trim() !== a.previous;
+}
+"""
+
+# Signature of the rendered content: watched element text plus URL
+CONTENT_SIGNATURE_JS = """
+(a) => {
+    const el = document.querySelector(a.selector);
+    return (el ? el.textContent.trim() : "") + "|" + location.href;
+}
+"""
+
+# True once the ready element is present and the signature has moved on;
+# re-evaluated by Playwright in the new document if the action navigates
+CONTENT_CHANGED_JS = """
+(a) => {
+    if (a.ready && !document.querySelector(a.ready)) return false;
+    const el = document.querySelector(a.selector);
+    const sig = (el ? el.textContent.trim() : "") + "|" + location.href;
+    return sig !== a.previous;
+}
+"""
+
+# Arms a one-shot MutationObserver on a container (same-document updates only)
+ARM_MUTATION_JS = """
+(selector) => {
+    const target = document.querySelector(selector) || document.body;
+    const state = { fired: false };
+    window.__ebayMutation = state;
+    const observer = new MutationObserver(() => { state.fired = true; observer.disconnect(); });
+    observer.observe(target, { childList: true, subtree: true, characterData: true });
+}
+"""
+
+MUTATION_FIRED_JS = "() => !!(window.__ebayMutation && window.__ebayMutation.fired)"
+
+
+class WaitTiming(NamedTuple):
+    """Duration of a single wait"""
+
+    name: str
+    target: str
+    duration_ms: float
+    ok: bool
+
+
+class _WaitRecorder:
+    """Timing storage shared by the sync and async engines"""
+
+    def __init__(self, page, default_timeout: int = 30000):
+        """
+        Args:
+            page: Playwright Page (sync or async API)
+            default_timeout (int): Timeout in milliseconds when a wait does not pass one
+        """
+        self.page = page
+        self.default_timeout = default_timeout
+        self.timings: List[WaitTiming] = []
+
+    def _add(self, name: str, target: str, start: float, ok: bool) -> None:
+        timing = WaitTiming(name, target, (time.perf_counter() - start) * 1000, ok)
+        self.timings.append(timing)
+        logger.info("Wait %s(%s) %s in %.0f ms", name, target, 'done' if ok else 'failed', timing.duration_ms)
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        Get wait statistics grouped by wait name
+
+        Returns:
+            dict: name -> {count, failed, total_ms, max_ms}
+        """
+        stats = defaultdict(lambda: {"count": 0, "failed": 0, "total_ms": 0.0, "max_ms": 0.0})
+        for t in self.timings:
+            entry = stats[t.name]
+            entry["count"] += 1
+            entry["failed"] += 0 if t.ok else 1
+            entry["total_ms"] += t.duration_ms
+            entry["max_ms"] = max(entry["max_ms"], t.duration_ms)
+        return dict(stats)
+
+
+class WaitEngine(_WaitRecorder):
+    """Event-driven waits for playwright.sync_api pages"""
+
+    @contextmanager
+    def record(self, name: str, target: str = ""):
+        """Time the enclosed wait and record it (failed waits are recorded and re-raised)"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self._add(name, target, start, ok=False)
+            raise
+        self._add(name, target, start, ok=True)
+
+    def for_selector(self, selector: str, state: str = "visible", timeout: Optional[int] = None) -> None:
+        """Wait until an element reaches a state ('attached', 'visible', 'hidden', 'detached')"""
+        with self.record("selector", selector):
+            self.page.wait_for_selector(selector, state=state, timeout=timeout or self.default_timeout)
+
+    def for_locator(self, locator, state: str = "visible", timeout: Optional[int] = None) -> None:
+        """Wait until the first element of a Locator reaches a state"""
+        with self.record("locator", str(locator)):
+            locator.first.wait_for(state=state, timeout=timeout or self.default_timeout)
+
+    def for_url(self, url: Union[str, Callable[[str], bool]], wait_until: str = "commit",
+                timeout: Optional[int] = None) -> None:
+        """Wait until the page URL matches a glob, regex or predicate"""
+        with self.record("url", str(url)):
+            self.page.wait_for_url(url, wait_until=wait_until, timeout=timeout or self.default_timeout)
+
+    def for_url_change(self, previous_url: str, wait_until: str = "commit", timeout: Optional[int] = None) -> None:
+        """Wait until the page URL differs from previous_url"""
+        with self.record("url_change", previous_url):
+            self.page.wait_for_url(lambda url: url != previous_url, wait_until=wait_until,
+                                   timeout=timeout or self.default_timeout)
+
+    def for_text_change(self, selector: str, previous_text: str, timeout: Optional[int] = None) -> None:
+        """Wait until an element's text differs from previous_text"""
+        with self.record("text_change", selector):
+            self.page.wait_for_function(TEXT_CHANGED_JS, arg={"selector": selector, "previous": previous_text},
+                                        timeout=timeout or self.default_timeout)
+
+    def content_signature(self, selector: str) -> str:
+        """Get the signature (element text + URL) compared by for_content_change"""
+        return self.page.evaluate(CONTENT_SIGNATURE_JS, {"selector": selector})
+
+    def for_content_change(self, selector: str, previous_signature: str, ready_selector: Optional[str] = None,
+                           timeout: Optional[int] = None) -> None:
+        """
+        Wait until content has re-rendered, whether in place or through a navigation
+
+        Args:
+            selector (str): Element whose text identifies the content (e.g. a count heading)
+            previous_signature (str): Value of content_signature taken before the action
+            ready_selector (str, optional): Element that must exist before the change counts
+            timeout (int, optional): Timeout in milliseconds
+        """
+        with self.record("content_change", selector):
+            self.page.wait_for_function(
+                CONTENT_CHANGED_JS,
+                arg={"selector": selector, "previous": previous_signature, "ready": ready_selector},
+                timeout=timeout or self.default_timeout,
+            )
+
+    def for_dom_mutation(self, selector: str, action: Callable[[], Any], timeout: Optional[int] = None) -> None:
+        """
+        Run an action and wait for the first DOM mutation under a container
+
+        Only for same-document updates: a navigation discards the observer.
+        """
+        self.page.evaluate(ARM_MUTATION_JS, selector)
+        action()
+        with self.record("dom_mutation", selector):
+            self.page.wait_for_function(MUTATION_FIRED_JS, timeout=timeout or self.default_timeout)
+
+    def for_response(self, url_or_predicate, action: Callable[[], Any], timeout: Optional[int] = None):
+        """
+        Run an action and wait for a matching network response
+
+        Returns:
+            Response: The matching response
+        """
+        with self.record("response", str(url_or_predicate)):
+            with self.page.expect_response(url_or_predicate, timeout=timeout or self.default_timeout) as info:
+                action()
+            return info.value
+
+    def for_navigation(self, action: Callable[[], Any], wait_until: str = "commit", timeout: Optional[int] = None):
+        """
+        Run an action and wait for the navigation it triggers
+
+        Returns:
+            Optional[Response]: Main resource response of the navigation
+        """
+        with self.record("navigation", wait_until):
+            with self.page.expect_navigation(wait_until=wait_until, timeout=timeout or self.default_timeout) as info:
+                action()
+            return info.value
+
+
+class AsyncWaitEngine(_WaitRecorder):
+    """Event-driven waits for playwright.async_api pages (same methods, awaitable)"""
+
+    @asynccontextmanager
+    async def record(self, name: str, target: str = ""):
+        """Time the enclosed wait and record it (failed waits are recorded and re-raised)"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self._add(name, target, start, ok=False)
+            raise
+        self._add(name, target, start, ok=True)
+
+    async def for_selector(self, selector: str, state: str = "visible", timeout: Optional[int] = None) -> None:
+        async with self.record("selector", selector):
+            await self.page.wait_for_selector(selector, state=state, timeout=timeout or self.default_timeout)
+
+    async def for_locator(self, locator, state: str = "visible", timeout: Optional[int] = None) -> None:
+        async with self.record("locator", str(locator)):
+            await locator.first.wait_for(state=state, timeout=timeout or self.default_timeout)
+
+    async def for_url(self, url: Union[str, Callable[[str], bool]], wait_until: str = "commit",
+                      timeout: Optional[int] = None) -> None:
+        async with self.record("url", str(url)):
+            await self.page.wait_for_url(url, wait_until=wait_until, timeout=timeout or self.default_timeout)
+
+    async def for_url_change(self, previous_url: str, wait_until: str = "commit",
+                             timeout: Optional[int] = None) -> None:
+        async with self.record("url_change", previous_url):
+            await self.page.wait_for_url(lambda url: url != previous_url, wait_until=wait_until,
+                                         timeout=timeout or self.default_timeout)
+
+    async def for_text_change(self, selector: str, previous_text: str, timeout: Optional[int] = None) -> None:
+        async with self.record("text_change", selector):
+            await self.page.wait_for_function(TEXT_CHANGED_JS, arg={"selector": selector, "previous": previous_text},
+                                              timeout=timeout or self.default_timeout)
+
+    async def content_signature(self, selector: str) -> str:
+        return await self.page.evaluate(CONTENT_SIGNATURE_JS, {"selector": selector})
+
+    async def for_content_change(self, selector: str, previous_signature: str, ready_selector: Optional[str] = None,
+                                 timeout: Optional[int] = None) -> None:
+        async with self.record("content_change", selector):
+            await self.page.wait_for_function(
+                CONTENT_CHANGED_JS,
+                arg={"selector": selector, "previous": previous_signature, "ready": ready_selector},
+                timeout=timeout or self.default_timeout,
+            )
+
+    async def for_dom_mutation(self, selector: str, action: Callable[[], Awaitable[Any]],
+                               timeout: Optional[int] = None) -> None:
+        await self.page.evaluate(ARM_MUTATION_JS, selector)
+        await action()
+        async with self.record("dom_mutation", selector):
+            await self.page.wait_for_function(MUTATION_FIRED_JS, timeout=timeout or self.default_timeout)
+
+    async def for_response(self, url_or_predicate, action: Callable[[], Awaitable[Any]],
+                           timeout: Optional[int] = None):
+        async with self.record("response", str(url_or_predicate)):
+            async with self.page.expect_response(url_or_predicate, timeout=timeout or self.default_timeout) as info:
+                await action()
+            return await info.value
+
+    async def for_navigation(self, action: Callable[[], Awaitable[Any]], wait_until: str = "commit",
+                             timeout: Optional[int] = None):
+        async with self.record("navigation", wait_until):
+            async with self.page.expect_navigation(wait_until=wait_until,
+                                                   timeout=timeout or self.default_timeout) as info:
+                await action()
+            return await info.value
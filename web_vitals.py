@@ -0,0 +1,225 @@
+"""
+Web performance capture and budgets
+Collects Navigation Timing, paint, LCP, CLS, long tasks and transfer sizes from the
+page, and checks them against per-page-type budgets from config.json
+"""
+
+import threading
+import weakref
+from typing import Dict, List, NamedTuple
+import logging
+
+from instrumentation import current_test_id
+
+logger = logging.getLogger(__name__)
+
+BUDGET_MODES = ("warn", "fail")
+
+# Installed on the context so observers exist before the page's own scripts run;
+# buffered observers also pick up entries recorded before they were created
+WEB_VITALS_INIT_JS = """
+(() => {
+    if (window.__ebayVitals || typeof PerformanceObserver === "undefined") return;
+    const vitals = window.__ebayVitals = { lcp: null, cls: 0, longTaskCount: 0, longTaskMs: 0 };
+    const observe = (type, onEntry) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(onEntry))
+                .observe({ type: type, buffered: true });
+        } catch (e) { /* entry type not supported by this browser */ }
+    };
+    observe("largest-contentful-paint", (e) => { vitals.lcp = e.renderTime || e.startTime; });
+    observe("layout-shift", (e) => { if (!e.hadRecentInput) vitals.cls += e.value; });
+    observe("longtask", (e) => { vitals.longTaskCount += 1; vitals.longTaskMs += e.duration; });
+})();
+"""
+
+# Default cap (ms) on waiting for the page's LCP entry before a sample is taken
+LCP_SETTLE_MS = 500
+
+# Passed to page.wait_for_function: true once the observers have an LCP entry (or when
+# the init script is missing, so there is nothing to wait for)
+VITALS_READY_JS = """
+() => { const vitals = window.__ebayVitals; return !vitals || vitals.lcp !== null; }
+"""
+
+# One round trip: every metric of the current document, in ms / KB (null when not yet reported)
+COLLECT_VITALS_JS = """
+() => {
+    const round = (v) => (v === null || v === undefined ? null : Math.round(v * 10) / 10);
+    const nav = performance.getEntriesByType("navigation")[0];
+    const paint = {};
+    performance.getEntriesByType("paint").forEach((p) => { paint[p.name] = p.startTime; });
+    const resources = performance.getEntriesByType("resource");
+    let transfer = nav ? nav.transferSize || 0 : 0;
+    resources.forEach((r) => { transfer += r.transferSize || 0; });
+    const vitals = window.__ebayVitals || {};
+    return {
+        ttfb_ms: nav ? round(nav.responseStart) : null,
+        dom_content_loaded_ms: nav ? round(nav.domContentLoadedEventEnd) : null,
+        load_ms: nav && nav.loadEventEnd ? round(nav.loadEventEnd) : null,
+        fp_ms: round(paint["first-paint"]),
+        fcp_ms: round(paint["first-contentful-paint"]),
+        lcp_ms: round(vitals.lcp),
+        cls: vitals.cls === undefined ? null : Math.round(vitals.cls * 1000) / 1000,
+        long_task_count: vitals.longTaskCount === undefined ? null : vitals.longTaskCount,
+        long_task_ms: round(vitals.longTaskMs),
+        resource_count: resources.length,
+        transfer_kb: round(transfer / 1024),
+    };
+}
+"""
+
+# Metrics the request router cannot change: it only ever blocks subresources, so the
+# document's own response and parse stay comparable while images, fonts and third-party
+# scripts are stripped
+ROUTED_METRICS = ("ttfb_ms", "dom_content_loaded_ms")
+
+# Metrics shown in report rows, in order
+SUMMARY_METRICS = (("ttfb_ms", "TTFB"), ("fcp_ms", "FCP"), ("lcp_ms", "LCP"), ("cls", "CLS"),
+                   ("long_task_ms", "Long tasks"), ("transfer_kb", "Transfer KB"))
+
+# Contexts that already carry the init script
+_INSTALLED = weakref.WeakSet()
+
+
+class BudgetViolation(NamedTuple):
+    """A metric over its budget"""
+
+    page_type: str
+    metric: str
+    value: float
+    limit: float
+    mode: str
+
+    def describe(self) -> str:
+        return f"{self.page_type} {self.metric} {self.value:g} > {self.limit:g}"
+
+
+def install_web_vitals(context) -> None:
+    """Add the observer script to a sync context once (applies to its next navigations)"""
+    if context in _INSTALLED:
+        return
+    context.add_init_script(WEB_VITALS_INIT_JS)
+    _INSTALLED.add(context)
+
+
+async def install_web_vitals_async(context) -> None:
+    """Async counterpart of install_web_vitals for playwright.async_api contexts"""
+    if context in _INSTALLED:
+        return
+    await context.add_init_script(WEB_VITALS_INIT_JS)
+    _INSTALLED.add(context)
+
+
+def check_budgets(page_type: str, metrics: dict, budgets: dict, default_mode: str = "warn") -> List[BudgetViolation]:
+    """
+    Compare metrics with a page type's budgets
+
+    Args:
+        page_type (str): Budget section name ('home', 'search_results', ...)
+        metrics (dict): COLLECT_VITALS_JS output
+        budgets (dict): Page type -> {metric: limit, optional 'mode': 'warn'|'fail'}
+        default_mode (str): Mode for page types without their own
+
+    Returns:
+        List[BudgetViolation]: Metrics over budget (missing metrics never violate)
+    """
+    limits = budgets.get(page_type, {})
+    mode = limits.get("mode", default_mode)
+    violations = []
+    for metric, limit in limits.items():
+        if metric == "mode":
+            continue
+        value = metrics.get(metric)
+        if value is not None and limit is not None and value > limit:
+            violations.append(BudgetViolation(page_type, metric, value, limit, mode))
+    return violations
+
+
+class VitalsRecorder:
+    """Per-test web performance samples and budget results (one process-wide instance: VITALS)"""
+
+    def __init__(self):
+        self.enabled = False
+        self.mode = "warn"
+        self.budgets: Dict[str, dict] = {}
+        self.settle_ms = LCP_SETTLE_MS
+        self.routed = False
+        self._lock = threading.Lock()
+        self._tests: Dict[str, List[dict]] = {}
+
+    def configure(self, settings: dict, routed: bool = False) -> None:
+        """
+        Apply the 'web_vitals' config section
+
+        Args:
+            settings (dict): 'web_vitals' section
+            routed (bool): Whether the request router is enabled; samples then keep only ROUTED_METRICS
+
+        Raises:
+            ValueError: If a budget mode is unknown
+        """
+        self.enabled = settings.get("enabled", False)
+        self.mode = settings.get("mode", "warn")
+        self.budgets = settings.get("budgets", {})
+        self.settle_ms = settings.get("settle_ms", LCP_SETTLE_MS)
+        self.routed = routed
+        if self.enabled and routed:
+            logger.warning("Request router is enabled: web vitals samples keep only %s (blocked images, fonts "
+                           "and third-party scripts change every other metric)", ", ".join(ROUTED_METRICS))
+        for mode in [self.mode] + [b.get("mode", self.mode) for b in self.budgets.values()]:
+            if mode not in BUDGET_MODES:
+                raise ValueError(f"Unknown web vitals budget mode '{mode}', expected one of {BUDGET_MODES}")
+
+    def record(self, page_type: str, label: str, url: str, metrics: dict) -> dict:
+        """
+        Check a sample against its budgets and store it for the running test
+
+        Args:
+            page_type (str): Budget section name
+            label (str): When the sample was taken (e.g. 'navigate', 'filter')
+            url (str): Page URL
+            metrics (dict): COLLECT_VITALS_JS output
+
+        Returns:
+            dict: Sample with its violations (stored per test only while one is attributed, see attribute_to)
+        """
+        if self.routed:
+            metrics = {key: (value if key in ROUTED_METRICS else None) for key, value in metrics.items()}
+        violations = check_budgets(page_type, metrics, self.budgets, self.mode)
+        sample = {"page_type": page_type, "label": label, "url": url, "metrics": metrics,
+                  "violations": [v._asdict() for v in violations]}
+        for v in violations:
+            logger.warning("Web performance budget exceeded (%s): %s [%s]", v.mode, v.describe(), label)
+        test_id = current_test_id()
+        if test_id:
+            with self._lock:
+                self._tests.setdefault(test_id, []).append(sample)
+        return sample
+
+    def pop_test(self, test_id: str) -> List[dict]:
+        """Get and drop a test's samples"""
+        with self._lock:
+            return self._tests.pop(test_id, [])
+
+
+VITALS = VitalsRecorder()
+
+
+def failed_budgets(samples: List[dict]) -> List[str]:
+    """Descriptions of 'fail' mode violations in a test's samples"""
+    return [BudgetViolation(**v).describe() + f" [{s['label']}]"
+            for s in samples for v in s["violations"] if v["mode"] == "fail"]
+
+
+def warned_budgets(samples: List[dict]) -> List[str]:
+    """Descriptions of 'warn' mode violations in a test's samples"""
+    return [BudgetViolation(**v).describe() + f" [{s['label']}]"
+            for s in samples for v in s["violations"] if v["mode"] == "warn"]
+
+
+def summarize(sample: dict) -> str:
+    """One-line summary of a sample's headline metrics"""
+    metrics = sample["metrics"]
+    parts = [f"{name} {metrics[key]:g}" for key, name in SUMMARY_METRICS if metrics.get(key) is not None]
+    return f"{sample['page_type']}/{sample['label']}: " + ", ".join(parts)